@@ -16,19 +16,30 @@ import os
 import sys
 import time
 import math
+import mmap
 import hashlib
 import secrets
 import platform
 import subprocess
 import json
+import csv
+import re
 import shutil
+import sqlite3
 import random
+import atexit
+import weakref
 import threading
+import multiprocessing
+import queue
 import webbrowser
+from collections import deque, OrderedDict
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import qrcode
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Tuple, Optional, Callable, Iterable, Iterator
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
 from PIL import Image, ImageTk
@@ -38,20 +49,34 @@ from io import BytesIO
 # Cryptographic libraries
 from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import rsa, padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.fernet import Fernet
 
 # PDF generation
+from reportlab import rl_config
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image as RLImage
+from reportlab.pdfgen.canvas import Canvas as RLCanvas
 from reportlab.graphics.shapes import Drawing, Rect
 from reportlab.graphics.charts.barcharts import VerticalBarChart
 from reportlab.graphics import renderPDF
 
+# Write PDF streams in binary for every document this process renders:
+# ASCII85 only adds size, and runs in pure Python unless ReportLab's
+# optional C accelerator is installed
+rl_config.useA85 = 0
+
+# Optional: vectorized verification heuristics
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 # ============================================================================
 # MULTI-LANGUAGE SUPPORT
 # ============================================================================
@@ -269,12 +294,36 @@ class SystemInterface:
                         'interface': dev.get('tran') or 'Unknown',
                         'serial': dev.get('serial') or 'Unknown',
                         'type': self._detect_drive_type(dev.get('model', ''), dev.get('tran', '')),
+                        'controller': self._linux_controller(dev.get('name')),
                         'platform': 'linux'
                     })
         except Exception as e:
             print(f"Linux device detection error: {e}")
         return devices
 
+    def _linux_controller(self, name: str) -> Optional[str]:
+        """sysfs path of the controller or hub whose bandwidth a disk shares.
+
+        USB disks are grouped by the hub they hang off, everything else by
+        the PCI function of its HBA (an NVMe drive is its own PCI function).
+        """
+        try:
+            device_path = os.path.realpath(f"/sys/block/{name}")
+        except OSError:
+            return None
+        parts = device_path.split('/')
+
+        usb_devices = [i for i, part in enumerate(parts)
+                       if re.fullmatch(r'\d+-[\d.]+', part)]
+        if usb_devices:
+            return '/'.join(parts[:usb_devices[-1]])
+
+        pci_functions = [i for i, part in enumerate(parts)
+                         if re.fullmatch(r'[0-9a-f]{4}:[0-9a-f]{2}:[0-9a-f]{2}\.[0-7]', part)]
+        if pci_functions:
+            return '/'.join(parts[:pci_functions[-1] + 1])
+        return None
+
     def _get_android_devices(self) -> List[Dict]:
         devices = []
         try:
@@ -327,6 +376,411 @@ class SystemInterface:
         except:
             return 0
 
+# ============================================================================
+# HIGH-THROUGHPUT DEVICE I/O
+# ============================================================================
+
+
+class AlignedBuffer:
+    """Page-aligned I/O buffer backed by an anonymous mmap (safe for O_DIRECT)"""
+
+    def __init__(self, size: int):
+        self.size = size
+        # Anonymous mappings always start on a page boundary, which satisfies
+        # the buffer alignment O_DIRECT requires on every supported kernel
+        self._map = mmap.mmap(-1, max(size, mmap.PAGESIZE))
+        self.view = memoryview(self._map)[:size]
+
+    def fill(self, pattern: bytes):
+        """Tile pattern across the whole buffer without building a temporary copy"""
+        if not pattern:
+            pattern = b'\x00'
+        first = min(len(pattern), self.size)
+        self.view[:first] = pattern[:first]
+        filled = first
+        while filled < self.size:
+            count = min(filled, self.size - filled)
+            self.view[filled:filled + count] = self.view[:count]
+            filled += count
+
+    def close(self):
+        """Release the mapping"""
+        try:
+            self.view.release()
+            self._map.close()
+        except BufferError:
+            # A caller still holds a slice; the mapping is freed with it
+            pass
+
+
+class QueuedDeviceWriter:
+    """Keeps up to queue_depth positional writes in flight on a pool of pwrite workers"""
+
+    def __init__(self, fd: int, queue_depth: int = 8):
+        self.fd = fd
+        self.queue_depth = max(1, int(queue_depth))
+        # os.pwrite releases the GIL, so each worker is one outstanding request
+        # at the block layer - the thread-pool equivalent of an async queue
+        self._executor = ThreadPoolExecutor(max_workers=self.queue_depth,
+                                            thread_name_prefix='ews-writer')
+        self._in_flight = deque()
+
+    def submit(self, offset: int, data, fd: int = None) -> List[Dict]:
+        """Queue a write, blocking while the queue is full.
+
+        Returns the writes that completed meanwhile, oldest first, so callers
+        always see a contiguous prefix of the device as finished.
+        """
+        completions = []
+        while len(self._in_flight) >= self.queue_depth:
+            completions.append(self._reap())
+
+        target_fd = self.fd if fd is None else fd
+        future = self._executor.submit(os.pwrite, target_fd, data, offset)
+        self._in_flight.append((offset, data, target_fd, future))
+        return completions
+
+    def drain(self) -> List[Dict]:
+        """Wait for every outstanding write"""
+        completions = []
+        while self._in_flight:
+            completions.append(self._reap())
+        return completions
+
+    def _reap(self) -> Dict:
+        offset, data, fd, future = self._in_flight.popleft()
+        completion = {'offset': offset, 'length': len(data), 'data': data,
+                      'fd': fd, 'written': 0, 'error': None}
+        try:
+            completion['written'] = future.result()
+        except OSError as e:
+            completion['error'] = e
+        return completion
+
+    def close(self):
+        """Wait for outstanding writes and stop the workers"""
+        self.drain()
+        self._executor.shutdown(wait=True)
+
+
+class RandomPattern:
+    """Random pass data: a seekable AES-256-CTR keystream, unique per key.
+
+    The keystream at any device offset can be regenerated from the key,
+    which is what lets writers produce it in parallel chunks.
+    """
+
+    BLOCK_SIZE = 16
+
+    def __init__(self, key: bytes = None, nonce: bytes = None):
+        self.key = key or secrets.token_bytes(32)
+        self.nonce = nonce or secrets.token_bytes(self.BLOCK_SIZE)
+        self._counter_base = int.from_bytes(self.nonce, 'big')
+        self._zeros = b''
+
+    def _encryptor_at(self, offset: int):
+        """CTR encryptor positioned at a byte offset of the keystream"""
+        block, skip = divmod(offset, self.BLOCK_SIZE)
+        counter = (self._counter_base + block) % (1 << 128)
+        encryptor = Cipher(algorithms.AES(self.key),
+                           modes.CTR(counter.to_bytes(self.BLOCK_SIZE, 'big')),
+                           backend=default_backend()).encryptor()
+        if skip:
+            encryptor.update(bytes(skip))
+        return encryptor
+
+    def fill_into(self, out, offset: int, length: int):
+        """Write the keystream for [offset, offset + length) into out.
+
+        out must have BLOCK_SIZE - 1 bytes of slack past length, as
+        required by update_into.
+        """
+        encryptor = self._encryptor_at(offset)
+        if len(self._zeros) < length:
+            self._zeros = bytes(length)
+        # Encrypting zeros yields the raw keystream
+        encryptor.update_into(memoryview(self._zeros)[:length],
+                              memoryview(out)[:length + self.BLOCK_SIZE - 1])
+
+    def generate(self, offset: int, length: int) -> bytes:
+        """Return the keystream for [offset, offset + length)"""
+        out = bytearray(length + self.BLOCK_SIZE - 1)
+        self.fill_into(out, offset, length)
+        return bytes(out[:length])
+
+    def xor(self, data, offset: int) -> bytes:
+        """XOR data read from offset with the keystream - all zeros if it matches"""
+        return self._encryptor_at(offset).update(data)
+
+
+class PatternSource:
+    """Generation stage of the overwrite pipeline.
+
+    next(length) returns a view of the next chunk in device order from
+    preallocated memory; release() hands the oldest outstanding chunk back
+    once its write has completed.
+    """
+
+    def next(self, length: int) -> memoryview:
+        raise NotImplementedError
+
+    def release(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FixedPatternSource(PatternSource):
+    """Repeating pattern tiled once into a single aligned buffer"""
+
+    def __init__(self, pattern: bytes, chunk_size: int):
+        self.chunk_size = chunk_size
+        self._buffer = AlignedBuffer(chunk_size)
+        self._buffer.fill(pattern)
+        self._chunk = self._buffer.view
+
+    def next(self, length: int) -> memoryview:
+        # Only the final partial chunk of a device needs a shorter view
+        return self._chunk if length == self.chunk_size else self._chunk[:length]
+
+    def close(self):
+        self._buffer.close()
+
+
+class RandomPatternSource(PatternSource):
+    """Background thread keeping a ring of aligned buffers filled with keystream"""
+
+    def __init__(self, pattern: RandomPattern, chunk_size: int, total_size: int,
+                 ring_size: int = 8, start_offset: int = 0):
+        self.pattern = pattern
+        self.chunk_size = chunk_size
+        self.total_size = total_size
+        self._buffers = [AlignedBuffer(chunk_size + RandomPattern.BLOCK_SIZE)
+                         for _ in range(max(2, ring_size))]
+        self._chunks = [buffer.view[:chunk_size] for buffer in self._buffers]
+        self._free = queue.Queue()
+        self._ready = queue.Queue()
+        self._in_flight = deque()
+        for slot in range(len(self._buffers)):
+            self._free.put(slot)
+
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._produce, args=(start_offset,),
+                                        name='ews-keystream', daemon=True)
+        self._thread.start()
+
+    def _produce(self, offset: int):
+        try:
+            while offset < self.total_size and not self._stopped.is_set():
+                slot = self._free.get()
+                if slot is None:
+                    return
+                length = min(self.chunk_size, self.total_size - offset)
+                self.pattern.fill_into(self._buffers[slot].view, offset, length)
+                self._ready.put(slot)
+                offset += length
+        except Exception as e:
+            self._ready.put(e)
+
+    def next(self, length: int) -> memoryview:
+        slot = self._ready.get()
+        if isinstance(slot, Exception):
+            raise Exception(f"Random stream generation failed: {slot}")
+        self._in_flight.append(slot)
+        chunk = self._chunks[slot]
+        return chunk if length == self.chunk_size else chunk[:length]
+
+    def release(self):
+        self._free.put(self._in_flight.popleft())
+
+    def close(self):
+        """Stop the producer and free the ring"""
+        self._stopped.set()
+        self._free.put(None)
+        self._thread.join()
+        for chunk in self._chunks:
+            chunk.release()
+        for buffer in self._buffers:
+            buffer.close()
+
+# ============================================================================
+# WIPE CHECKPOINT JOURNAL
+# ============================================================================
+
+
+class WipeJournal:
+    """On-disk checkpoints of in-progress wipes, one JSON file per device.
+
+    Each checkpoint names the next pass and offset to write; everything
+    before it is known to be on the media, so a crashed wipe can resume there.
+    """
+
+    def __init__(self, journal_dir: Path = None, min_interval: float = 1.0):
+        self.journal_dir = journal_dir or Path.home() / '.ewaste_safe' / 'journal'
+        self.min_interval = min_interval  # Seconds between throttled saves
+        self._last_save = 0.0
+
+    def fingerprint(self, device_info: Dict) -> str:
+        """Identify the physical device independent of its current path"""
+        serial = device_info.get('serial') or ''
+        if serial in ('', 'Unknown'):
+            serial = device_info.get('device', '')
+        fingerprint_data = f"{device_info.get('model', '')}|{serial}|{device_info.get('size', 0)}"
+        return hashlib.sha256(fingerprint_data.encode()).hexdigest()[:16].upper()
+
+    def _journal_path(self, fingerprint: str) -> Path:
+        return self.journal_dir / f"{fingerprint}.json"
+
+    def load(self, device_info: Dict) -> Optional[Dict]:
+        """Return the checkpoint for a device, if an unfinished wipe left one"""
+        try:
+            with open(self._journal_path(self.fingerprint(device_info)), 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, state: Dict, force: bool = False) -> bool:
+        """Atomically replace the checkpoint; unforced saves are rate limited.
+
+        Skipping a save is always safe - the previous checkpoint is older,
+        so resuming from it only rewrites a little more.
+        """
+        now = time.time()
+        if not force and now - self._last_save < self.min_interval:
+            return False
+
+        state['updated_at'] = datetime.now(timezone.utc).isoformat()
+        journal_path = self._journal_path(state['fingerprint'])
+        try:
+            self.journal_dir.mkdir(parents=True, exist_ok=True)
+            temp_path = journal_path.with_suffix('.tmp')
+            with open(temp_path, 'w') as f:
+                json.dump(state, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, journal_path)
+            self._last_save = now
+            return True
+        except OSError as e:
+            print(f"⚠️ Could not write wipe journal: {e}")
+            return False
+
+    def clear(self, device_info: Dict):
+        """Forget the checkpoint once every pass has completed"""
+        try:
+            self._journal_path(self.fingerprint(device_info)).unlink()
+        except FileNotFoundError:
+            pass
+
+# ============================================================================
+# RECOVERABLE DATA SIGNATURES
+# ============================================================================
+
+
+class SignatureScanner:
+    """Single-pass search for file magic numbers and text file indicators.
+
+    Each pattern set is compiled once into one regex alternation, so a
+    sample is scanned once no matter how many patterns are configured.
+    Patterns containing a byte the sample lacks are dropped first, with
+    one memchr-speed test per distinct byte, and the alternation is only
+    run over the patterns that can still match.
+    Extra patterns are read from ~/.ewaste_safe/signatures.json:
+
+        {"signatures": ["hex:377abcaf271c", "SQLite format 3"],
+         "text_indicators": ["password"]}
+
+    Entries prefixed with "hex:" are raw bytes, anything else is UTF-8 text.
+    Text indicators are matched against lowercased text.
+    """
+
+    DEFAULT_SIGNATURES = [
+        b'NTFS', b'\x55\xAA', b'FAT32', b'FAT16', b'exFAT',
+        b'ext2', b'ext3', b'ext4', b'XFS', b'Btrfs',
+        b'\x89PNG', b'JFIF', b'%PDF', b'PK\x03\x04',
+        b'MZ', b'ELF', b'\x7fELF', b'RIFF', b'GIF8'
+    ]
+    DEFAULT_TEXT_INDICATORS = [
+        b'filename', b'document', b'created', b'modified', b'author',
+        b'copyright', b'version', b'www.', b'http', b'.com', b'.exe', b'.txt'
+    ]
+    REGEX_CACHE_SIZE = 64
+
+    def __init__(self, config_path: Path = None):
+        self.config_path = config_path or Path.home() / '.ewaste_safe' / 'signatures.json'
+        self.signatures = list(self.DEFAULT_SIGNATURES)
+        self.text_indicators = list(self.DEFAULT_TEXT_INDICATORS)
+        self._load_config()
+        self._regex_cache = OrderedDict()  # Candidate patterns -> regex, least recently used first
+
+    def _load_config(self):
+        """Add user-defined patterns from the config file, if present"""
+        try:
+            with open(self.config_path, 'r') as f:
+                config = json.load(f)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not read signature config {self.config_path}: {e}")
+            return
+
+        for key, patterns, transform in (
+                ('signatures', self.signatures, lambda p: p),
+                ('text_indicators', self.text_indicators, bytes.lower)):
+            for entry in config.get(key, []):
+                try:
+                    if entry.startswith('hex:'):
+                        pattern = bytes.fromhex(entry[4:])
+                    else:
+                        pattern = entry.encode('utf-8')
+                except (AttributeError, ValueError):
+                    print(f"⚠️ Ignoring invalid {key} entry: {entry!r}")
+                    continue
+                pattern = transform(pattern)
+                if pattern and pattern not in patterns:
+                    patterns.append(pattern)
+
+    @staticmethod
+    def _compile(patterns: List[bytes]):
+        # Longest first so a pattern never loses to one of its own prefixes
+        ordered = sorted(set(patterns), key=len, reverse=True)
+        return re.compile(b'|'.join(re.escape(pattern) for pattern in ordered))
+
+    def _search(self, patterns: List[bytes], data: bytes) -> Optional[bytes]:
+        """First of patterns in data, searching only those whose bytes all occur"""
+        present = {}
+        candidates = []
+        for pattern in patterns:
+            for value in pattern:
+                if value not in present:
+                    present[value] = value in data
+                if not present[value]:
+                    break
+            else:
+                candidates.append(pattern)
+        if not candidates:
+            return None
+
+        key = tuple(candidates)
+        regex = self._regex_cache.get(key)
+        if regex is None:
+            regex = self._regex_cache[key] = self._compile(candidates)
+            if len(self._regex_cache) > self.REGEX_CACHE_SIZE:
+                self._regex_cache.popitem(last=False)
+        else:
+            self._regex_cache.move_to_end(key)
+        match = regex.search(data)
+        return match.group() if match else None
+
+    def find_signature(self, data: bytes) -> Optional[bytes]:
+        """First file system or file format signature in data"""
+        return self._search(self.signatures, data)
+
+    def find_text_indicator(self, text_lower: bytes) -> Optional[bytes]:
+        """First file indicator in already lowercased text"""
+        return self._search(self.text_indicators, text_lower)
+
 # ============================================================================
 # SECURE WIPE ENGINE
 # ============================================================================
@@ -335,11 +789,30 @@ class SystemInterface:
 class SecureWipeEngine:
     """Cross-platform secure wiping engine"""
 
+    DEFAULT_CHUNK_SIZE = 1024 * 1024
+    # Settings carried over to engines created for other devices or processes
+    TUNABLE_SETTINGS = ('write_queue_depth', 'chunk_size', 'interleave_passes',
+                        'interleave_region_size', 'verification_mode')
+    CALIBRATION_CHUNK_SIZES = [128 * 1024, 256 * 1024, 512 * 1024, 1024 * 1024,
+                               2 * 1024 * 1024, 4 * 1024 * 1024,
+                               8 * 1024 * 1024, 16 * 1024 * 1024]
+
     def __init__(self):
         self.system = SystemInterface()
         self.wipe_patterns = self._initialize_patterns()
         self.current_operation = None
         self.is_wiping = False
+        self.write_queue_depth = 8  # Outstanding writes per overwrite pass
+        self.chunk_size = self.DEFAULT_CHUNK_SIZE  # I/O size for overwrite and verify
+        self.interleave_passes = False  # Apply all passes region by region (HDDs)
+        self.interleave_region_size = 256 * 1024 * 1024
+        self.verification_mode = 'sample'  # 'sample' or 'full' read-back
+        self.journal = WipeJournal()
+        self._journal_state = None  # Checkpoint of the wipe in progress
+        self.signature_scanner = SignatureScanner()
+        self.bytes_written = 0  # Running total for bandwidth monitoring
+        self.calibration_cache_path = Path.home() / '.ewaste_safe' / \
+            'chunk_calibration.json'
 
     def _initialize_patterns(self) -> Dict:
         return {
@@ -351,19 +824,19 @@ class SecureWipeEngine:
             },
             'nist_purge': {
                 'passes': 3,
-                'patterns': [b'\x00', b'\xFF', secrets.token_bytes(512)],
+                'patterns': [b'\x00', b'\xFF', RandomPattern()],
                 'description': 'Three-pass secure overwrite (recommended)',
                 'compliance': ['NIST SP 800-88 Rev 1', 'Common Criteria']
             },
             'dod_5220': {
                 'passes': 7,
-                'patterns': [b'\x00', b'\xFF', b'\x00', b'\xFF', b'\x00', b'\xFF', secrets.token_bytes(512)],
+                'patterns': [b'\x00', b'\xFF', b'\x00', b'\xFF', b'\x00', b'\xFF', RandomPattern()],
                 'description': 'DoD standard seven-pass method',
                 'compliance': ['DoD 5220.22-M', 'NIST SP 800-88 Rev 1']
             },
             'secure_random': {
                 'passes': 7,
-                'patterns': [secrets.token_bytes(512) for _ in range(7)],
+                'patterns': [RandomPattern() for _ in range(7)],
                 'description': 'Seven passes with cryptographically secure random data',
                 'compliance': ['Maximum Security', 'FIPS 140-2']
             },
@@ -381,7 +854,7 @@ class SecureWipeEngine:
 
         # 4 random passes
         for _ in range(4):
-            patterns.append(secrets.token_bytes(512))
+            patterns.append(RandomPattern())
 
         # 27 specific patterns designed for magnetic media
         base_patterns = [
@@ -400,12 +873,13 @@ class SecureWipeEngine:
 
         # 4 more random passes
         for _ in range(4):
-            patterns.append(secrets.token_bytes(512))
+            patterns.append(RandomPattern())
 
         return patterns
 
-    def wipe_device(self, device_info, method: str, progress_callback: Callable = None) -> Dict:
-        """Main device wiping function"""
+    def wipe_device(self, device_info, method: str, progress_callback: Callable = None,
+                    resume: bool = False) -> Dict:
+        """Main device wiping function; resume continues from the device's journal"""
         start_time = time.time()
 
         # Handle both dict and string inputs for compatibility
@@ -429,6 +903,7 @@ class SecureWipeEngine:
             'device_info': device_info,
             'passes_completed': 0,
             'total_passes': 0,
+            'pass_stats': [],
             'verification_passed': False,
             'errors': [],
             'success': False,
@@ -444,6 +919,13 @@ class SecureWipeEngine:
                 method, self.wipe_patterns['nist_purge'])
             wipe_log['total_passes'] = method_config['passes']
 
+            # Pick up an interrupted wipe of the same device with the same method
+            journal_state = self.journal.load(device_info) if resume else None
+            if journal_state and journal_state.get('method') != method:
+                print(
+                    f"⚠️ Journal is for method {journal_state.get('method')}, starting over")
+                journal_state = None
+
             if progress_callback:
                 progress_callback(0, "Preparing secure wipe...")
 
@@ -454,7 +936,7 @@ class SecureWipeEngine:
             is_ssd = self._is_ssd_device(device_info)
             wipe_log['is_ssd'] = is_ssd
 
-            if is_ssd:
+            if is_ssd and not journal_state:
                 if progress_callback:
                     progress_callback(
                         5, "SSD detected - attempting hardware secure erase...")
@@ -473,7 +955,7 @@ class SecureWipeEngine:
                     if progress_callback:
                         progress_callback(95, "Performing verification...")
                     wipe_log['verification_passed'] = self._verify_wipe(
-                        device_info)
+                        device_info, wipe_log)
 
                     if progress_callback:
                         progress_callback(98, "Finalizing...")
@@ -495,31 +977,103 @@ class SecureWipeEngine:
                         progress_callback(
                             10, "Hardware secure erase not available - using software method...")
 
-            # Perform software-based wiping (fallback or for non-SSDs)
-            for pass_num, pattern in enumerate(method_config['patterns'], 1):
-                if not self.is_wiping:  # Check for cancellation
-                    break
-
+            if journal_state:
+                # Chunk size, random keys and layout must match the
+                # interrupted run for the remaining data to line up
+                self._journal_state = journal_state
+                self.chunk_size = journal_state['chunk_size']
+                wipe_log['chunk_calibration'] = 'journal'
+                patterns = self._journal_patterns(method_config, journal_state)
+                interleave = journal_state.get('interleaved', False)
+                region_size = journal_state.get(
+                    'region_size', self.interleave_region_size)
+                resume_pass = journal_state['pass']
+                resume_offset = journal_state['offset']
+                wipe_log['resumed_from'] = {
+                    'pass': resume_pass, 'offset': resume_offset}
+                print(
+                    f"↩️ Resuming wipe at pass {resume_pass}, offset {resume_offset:,}")
                 if progress_callback:
                     progress_callback(
-                        (pass_num - 1) / method_config['passes'] * 80,
-                        f"Pass {pass_num}/{method_config['passes']}: Writing secure pattern..."
-                    )
-
+                        10, f"Resuming at pass {resume_pass}, offset {resume_offset:,}...")
+            else:
+                # Pick the request size this drive streams fastest at
+                self.chunk_size, wipe_log['chunk_calibration'] = self._calibrate_chunk_size(
+                    device_info, progress_callback)
+
+                # Fresh key for every random pass
+                patterns = [RandomPattern() if isinstance(pattern, RandomPattern) else pattern
+                            for pattern in method_config['patterns']]
+                interleave = (self.interleave_passes and len(patterns) > 1 and
+                              device_info.get('platform', self.system.platform) == 'linux')
+                region_size = self.interleave_region_size
+                resume_pass, resume_offset = 1, 0
+                self._journal_state = self._new_journal_state(
+                    device_info, method, patterns, interleave, region_size)
+
+            self.journal.save(self._journal_state, force=True)
+            wipe_log['chunk_size'] = self.chunk_size
+            wipe_log['interleaved'] = interleave
+
+            if interleave:
+                if progress_callback:
+                    progress_callback(
+                        0, f"Writing {len(patterns)} passes region by region...")
                 try:
-                    self._overwrite_device(
-                        device_info, pattern, pass_num, progress_callback)
-                    wipe_log['passes_completed'] = pass_num
+                    wipe_log['pass_stats'].extend(self._linux_interleaved_overwrite(
+                        device_info['device'], patterns, progress_callback,
+                        region_size, resume_pass - 1, resume_offset))
+                    if self.is_wiping:
+                        wipe_log['passes_completed'] = len(patterns)
                 except Exception as e:
-                    error_msg = f"Error in pass {pass_num}: {str(e)}"
+                    error_msg = f"Error in interleaved passes: {str(e)}"
                     wipe_log['errors'].append(error_msg)
                     print(error_msg)
+            else:
+                # Perform software-based wiping (fallback or for non-SSDs)
+                for pass_num, pattern in enumerate(patterns, 1):
+                    if not self.is_wiping:  # Check for cancellation
+                        break
+
+                    if pass_num < resume_pass:
+                        # Completed before the interruption
+                        wipe_log['passes_completed'] = pass_num
+                        continue
+
+                    if progress_callback:
+                        progress_callback(
+                            (pass_num - 1) / method_config['passes'] * 80,
+                            f"Pass {pass_num}/{method_config['passes']}: Writing secure pattern..."
+                        )
+
+                    try:
+                        start_offset = resume_offset if pass_num == resume_pass else 0
+                        pass_stats = self._overwrite_device(
+                            device_info, pattern, pass_num, progress_callback, start_offset)
+                        if pass_stats:
+                            wipe_log['pass_stats'].append(pass_stats)
+                        wipe_log['passes_completed'] = pass_num
+                        if self.is_wiping:
+                            self._journal_checkpoint(pass_num + 1, 0, force=True)
+                    except Exception as e:
+                        error_msg = f"Error in pass {pass_num}: {str(e)}"
+                        wipe_log['errors'].append(error_msg)
+                        print(error_msg)
+                        # Keep the journal at the last good position
+                        self._journal_state = None
+
+            if self.is_wiping and wipe_log['passes_completed'] >= method_config['passes']:
+                self.journal.clear(device_info)
 
             if progress_callback:
                 progress_callback(80, "Performing verification...")
 
             # Verify the wipe
-            wipe_log['verification_passed'] = self._verify_wipe(device_info)
+            # Both full and sample verification compare against the last pass
+            expected_pattern = patterns[-1] if (
+                wipe_log['passes_completed'] >= method_config['passes']) else None
+            wipe_log['verification_passed'] = self._verify_wipe(
+                device_info, wipe_log, expected_pattern, progress_callback)
 
             # Enhanced success determination with better messaging
             passes_completed_successfully = wipe_log['passes_completed'] >= method_config['passes']
@@ -572,9 +1126,55 @@ class SecureWipeEngine:
         finally:
             self.is_wiping = False
             self.current_operation = None
+            self._journal_state = None
 
         return wipe_log
 
+    def _new_journal_state(self, device_info: Dict, method: str, patterns: List,
+                           interleave: bool, region_size: int) -> Dict:
+        """Initial checkpoint for a fresh wipe"""
+        random_keys = {}
+        for pass_num, pattern in enumerate(patterns, 1):
+            if isinstance(pattern, RandomPattern):
+                random_keys[str(pass_num)] = {
+                    'key': pattern.key.hex(), 'nonce': pattern.nonce.hex()}
+
+        return {
+            'fingerprint': self.journal.fingerprint(device_info),
+            'device': device_info['device'],
+            'model': device_info.get('model', 'Unknown'),
+            'serial': device_info.get('serial', 'Unknown'),
+            'size': device_info.get('size', 0),
+            'method': method,
+            'chunk_size': self.chunk_size,
+            'interleaved': interleave,
+            'region_size': region_size,
+            'random_keys': random_keys,
+            'pass': 1,
+            'offset': 0,
+            'started_at': datetime.now(timezone.utc).isoformat()
+        }
+
+    def _journal_patterns(self, method_config: Dict, journal_state: Dict) -> List:
+        """Rebuild the pass patterns of an interrupted wipe, random keys included"""
+        random_keys = journal_state.get('random_keys', {})
+        patterns = []
+        for pass_num, pattern in enumerate(method_config['patterns'], 1):
+            if isinstance(pattern, RandomPattern):
+                keys = random_keys[str(pass_num)]
+                pattern = RandomPattern(bytes.fromhex(keys['key']),
+                                        bytes.fromhex(keys['nonce']))
+            patterns.append(pattern)
+        return patterns
+
+    def _journal_checkpoint(self, pass_num: int, offset: int, force: bool = False):
+        """Record the next position to write once everything before it is durable"""
+        if self._journal_state is None:
+            return
+        self._journal_state['pass'] = pass_num
+        self._journal_state['offset'] = offset
+        self.journal.save(self._journal_state, force)
+
     def _pre_wipe_operations(self, device_info: Dict, wipe_log: Dict):
         """Platform-specific pre-wipe operations with enhanced privilege verification"""
         platform = device_info.get('platform', self.system.platform)
@@ -1156,35 +1756,254 @@ class SecureWipeEngine:
 
         return health_status
 
-    def _overwrite_device(self, device_info: Dict, pattern: bytes, pass_num: int, progress_callback: Callable):
-        """Perform the actual overwrite operation"""
+    def _get_logical_sector_size(self, device_path: str, device=None) -> int:
+        """Get the logical sector size O_DIRECT transfers must be aligned to"""
+        device_name = os.path.basename(os.path.realpath(device_path))
+        sysfs_file = f"/sys/class/block/{device_name}/queue/logical_block_size"
+
+        try:
+            with open(sysfs_file, 'r') as f:
+                sector_size = int(f.read().strip())
+                if sector_size > 0:
+                    return sector_size
+        except (OSError, ValueError):
+            pass
+
+        # Fall back to the BLKSSZGET ioctl on an already open handle
+        if device is not None:
+            try:
+                import fcntl
+                import struct
+                BLKSSZGET = 0x1268
+                result = fcntl.ioctl(device.fileno(), BLKSSZGET,
+                                     struct.pack('I', 0))
+                sector_size = struct.unpack('I', result)[0]
+                if sector_size > 0:
+                    return sector_size
+            except (ImportError, OSError):
+                pass
+
+        return 512
+
+    def _open_direct_device(self, device_path: str, sector_size: int):
+        """Open device with O_DIRECT, returning None if direct I/O is unsupported"""
+        if not hasattr(os, 'O_DIRECT'):
+            return None
+
+        try:
+            fd = os.open(device_path, os.O_RDWR | os.O_DIRECT)
+        except OSError as e:
+            print(f"O_DIRECT not available for {device_path}: {e}")
+            return None
+
+        direct_device = open(fd, 'r+b', buffering=0)
+        probe = AlignedBuffer(sector_size)
+        try:
+            # Read the first sector and write it back unchanged - some drivers
+            # accept O_DIRECT on open and only reject it on the first transfer
+            if direct_device.readinto(probe.view) != sector_size:
+                raise OSError("short read while probing direct I/O")
+            direct_device.seek(0)
+            if direct_device.write(probe.view) != sector_size:
+                raise OSError("short write while probing direct I/O")
+            direct_device.seek(0)
+            return direct_device
+        except OSError as e:
+            print(f"O_DIRECT probe failed for {device_path}: {e}")
+            direct_device.close()
+            return None
+        finally:
+            probe.close()
+
+    def _calibration_key(self, device_info: Dict) -> str:
+        """Identify a drive SKU - same model on the same interface streams alike"""
+        model = (device_info.get('model') or 'unknown').strip().lower()
+        interface = (device_info.get('interface') or 'unknown').strip().lower()
+        return f"{model}|{interface}"
+
+    def _load_calibration_cache(self) -> Dict:
+        try:
+            with open(self.calibration_cache_path, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_calibration_cache(self, cache: Dict):
+        try:
+            self.calibration_cache_path.parent.mkdir(
+                parents=True, exist_ok=True)
+            # Per-thread temp file: engines of a parallel batch may save at once
+            temp_path = self.calibration_cache_path.with_suffix(
+                f'.{os.getpid()}.{threading.get_ident()}.tmp')
+            with open(temp_path, 'w') as f:
+                json.dump(cache, f, indent=2)
+            os.replace(temp_path, self.calibration_cache_path)
+        except OSError as e:
+            print(f"⚠️ Could not save chunk calibration cache: {e}")
+
+    def _calibrate_chunk_size(self, device_info: Dict, progress_callback: Callable = None):
+        """Return (chunk_size, source) for the device, measuring it once per SKU"""
+        key = self._calibration_key(device_info)
+        cache = self._load_calibration_cache()
+
+        cached = cache.get(key)
+        if cached and cached.get('chunk_size') in self.CALIBRATION_CHUNK_SIZES:
+            print(
+                f"Using cached chunk size {cached['chunk_size']:,} bytes for {key}")
+            return cached['chunk_size'], 'cached'
+
+        platform = device_info.get('platform', self.system.platform)
+        if platform != 'linux':
+            return self.DEFAULT_CHUNK_SIZE, 'default'
+
+        if progress_callback:
+            progress_callback(2, "Calibrating optimal I/O chunk size...")
+
+        try:
+            results = self._linux_measure_chunk_sizes(device_info['device'])
+        except Exception as e:
+            print(f"⚠️ Chunk size calibration failed: {e}")
+            return self.DEFAULT_CHUNK_SIZE, 'default'
+
+        if not results:
+            return self.DEFAULT_CHUNK_SIZE, 'default'
+
+        best_size = max(results, key=results.get)
+        print(
+            f"📐 Calibrated chunk size for {key}: {best_size:,} bytes ({results[best_size]:.1f} MB/s)")
+
+        cache[key] = {
+            'chunk_size': best_size,
+            'throughput_mb_s': {str(size): round(rate, 2) for size, rate in results.items()},
+            'calibrated_at': datetime.now(timezone.utc).isoformat()
+        }
+        self._save_calibration_cache(cache)
+        return best_size, 'measured'
+
+    def _linux_measure_chunk_sizes(self, device_path: str) -> Dict[int, float]:
+        """Time sequential writes at each candidate chunk size at the start of the device.
+
+        The data written is overwritten by the first wipe pass, so calibrating
+        on the target itself costs nothing but a few seconds.
+        """
+        min_volume = 32 * 1024 * 1024
+        results = {}
+
+        with open(device_path, 'r+b', buffering=0) as device:
+            device.seek(0, os.SEEK_END)
+            total_size = device.tell()
+
+            sector_size = self._get_logical_sector_size(device_path, device)
+            direct_device = self._open_direct_device(device_path, sector_size)
+            writer = direct_device or device
+            buffer = AlignedBuffer(max(self.CALIBRATION_CHUNK_SIZES))
+            buffer.fill(b'\x00')
+
+            try:
+                for chunk_size in self.CALIBRATION_CHUNK_SIZES:
+                    if not self.is_wiping:
+                        break
+
+                    volume = min(max(min_volume, 4 * chunk_size), total_size)
+                    volume -= volume % chunk_size
+                    if volume == 0:
+                        break
+
+                    queued_writer = QueuedDeviceWriter(
+                        writer.fileno(), self.write_queue_depth)
+                    start = time.time()
+                    try:
+                        completions = []
+                        for offset in range(0, volume, chunk_size):
+                            completions.extend(queued_writer.submit(
+                                offset, buffer.view[:chunk_size]))
+                        completions.extend(queued_writer.drain())
+                        os.fsync(writer.fileno())
+                    finally:
+                        queued_writer.close()
+
+                    for completion in completions:
+                        if completion['error'] is not None:
+                            raise completion['error']
+
+                    elapsed = max(time.time() - start, 1e-6)
+                    results[chunk_size] = volume / elapsed / (1024 * 1024)
+                    print(
+                        f"  📐 {chunk_size // 1024:>6} KB chunks: {results[chunk_size]:.1f} MB/s")
+            finally:
+                if direct_device:
+                    direct_device.close()
+                buffer.close()
+
+        return results
+
+    def _open_pattern_source(self, pattern, chunk_size: int, total_size: int,
+                             ring_size: int = 8, start_offset: int = 0) -> PatternSource:
+        """Build the generation stage of the overwrite pipeline for one pass"""
+        if isinstance(pattern, RandomPattern):
+            return RandomPatternSource(pattern, chunk_size, total_size,
+                                       ring_size, start_offset)
+        return FixedPatternSource(pattern, chunk_size)
+
+    def _overwrite_device(self, device_info: Dict, pattern: bytes, pass_num: int, progress_callback: Callable,
+                          start_offset: int = 0) -> Optional[Dict]:
+        """Perform the actual overwrite operation, returning per-pass I/O statistics"""
         platform = device_info.get('platform', self.system.platform)
         device_path = device_info['device']
 
         if platform == 'linux':
-            self._linux_overwrite(device_path, pattern,
-                                  progress_callback, pass_num)
+            return self._linux_overwrite(device_path, pattern,
+                                         progress_callback, pass_num, start_offset)
         elif platform == 'windows':
-            self._windows_overwrite(
-                device_path, pattern, progress_callback, pass_num)
+            return self._windows_overwrite(
+                device_path, pattern, progress_callback, pass_num, start_offset)
         elif platform == 'android':
-            self._android_overwrite(
+            return self._android_overwrite(
                 device_path, pattern, progress_callback, pass_num)
+        return None
 
-    def _linux_overwrite(self, device_path: str, pattern: bytes, progress_callback: Callable, pass_num: int):
+    def _linux_overwrite(self, device_path: str, pattern: bytes, progress_callback: Callable, pass_num: int,
+                         start_offset: int = 0):
         """Linux-specific overwrite implementation with enhanced I/O error handling"""
+        return self._linux_overwrite_passes(
+            device_path, [pattern], progress_callback, pass_num,
+            start_offset=start_offset)[0]
+
+    def _linux_interleaved_overwrite(self, device_path: str, patterns: List, progress_callback: Callable,
+                                     region_size: int, start_pass_index: int = 0,
+                                     start_offset: int = 0) -> List[Dict]:
+        """Apply every pass to one region before moving to the next.
+
+        On rotational media this replaces one end-to-end head sweep (and one
+        open/test/lock cycle) per pass with a single sweep for the whole method.
+        """
+        return self._linux_overwrite_passes(
+            device_path, patterns, progress_callback, 1, region_size,
+            start_pass_index, start_offset)
+
+    def _linux_overwrite_passes(self, device_path: str, patterns: List, progress_callback: Callable,
+                                first_pass_num: int, region_size: int = None,
+                                start_pass_index: int = 0, start_offset: int = 0) -> List[Dict]:
+        """Write patterns in order over the device through one open handle.
+
+        Without region_size each pattern is a full sequential pass. With it,
+        all patterns are applied to each region in turn, with a sync between
+        passes so the drive cannot merge them in its write cache. Writing
+        starts at pattern start_pass_index, offset start_offset (a resume).
+        """
         import fcntl
         import time
 
-        buffer_size = 1024 * 1024  # 1MB buffer
-
-        # Expand pattern to buffer size
-        pattern_buffer = (
-            pattern * (buffer_size // len(pattern) + 1))[:buffer_size]
+        buffer_size = self.chunk_size
+        direct_device = None
+        queued_writer = None
+        pattern_source = None
 
         try:
+            pass_label = ', '.join(
+                str(first_pass_num + i) for i in range(len(patterns)))
             print(
-                f"Starting Linux overwrite for {device_path} - Pass {pass_num}")
+                f"Starting Linux overwrite for {device_path} - Pass {pass_label}")
 
             # Open device with direct I/O and sync flags
             with open(device_path, 'r+b', buffering=0) as device:
@@ -1227,145 +2046,286 @@ class SecureWipeEngine:
                     raise Exception(
                         f"Device {device_path} is not writable. Are you running as root? Error: {e}")
 
-                # Perform the actual overwrite with enhanced error handling
-                written = 0
-                sync_interval = 50 * 1024 * 1024  # Sync every 50MB
+                # Prefer O_DIRECT with page-aligned buffers so the pass streams at
+                # the drive's sequential rate instead of through the page cache
+                sector_size = self._get_logical_sector_size(
+                    device_path, device)
+                buffer_size = max(sector_size,
+                                  (buffer_size // sector_size) * sector_size)
+                direct_device = self._open_direct_device(
+                    device_path, sector_size)
+
+                if direct_device:
+                    writer = direct_device
+                    # Nothing accumulates in the page cache, so syncs only have
+                    # to flush the drive's write cache and can be far apart
+                    sync_interval = 1024 * 1024 * 1024  # Sync every 1GB
+                    print(
+                        f"  ⚡ Using O_DIRECT I/O ({sector_size}-byte sectors, {buffer_size:,}-byte chunks)")
+                else:
+                    writer = device
+                    sync_interval = 50 * 1024 * 1024  # Sync every 50MB
+                    print("  Using buffered I/O")
+
+                # Perform the actual overwrite with enhanced error handling.
+                # Up to write_queue_depth chunks are kept in flight so drives
+                # that need a deep queue (NVMe) reach their full bandwidth.
+                queued_writer = QueuedDeviceWriter(
+                    writer.fileno(), self.write_queue_depth)
+
+                # A plain pass is a single region spanning the whole device
+                interleaved = len(patterns) > 1 and bool(region_size)
+                if not region_size or region_size >= total_size:
+                    region_size = max(total_size, 1)
+                else:
+                    region_size = max(buffer_size,
+                                      (region_size // buffer_size) * buffer_size)
+                num_regions = max(1, -(-total_size // region_size))
+
+                # Resume on a chunk boundary inside the interrupted region
+                start_offset = min(start_offset - start_offset % buffer_size,
+                                   total_size)
+                first_region = start_offset - start_offset % region_size
+
+                written = 0  # Bytes confirmed on the device, in offset order
                 last_sync = 0
-                bad_sectors = []
-                retry_count = 0
+                bad_sectors = [[] for _ in patterns]
+                pass_seconds = [0.0 for _ in patterns]
+                pass_written = [0 for _ in patterns]
                 max_retries = 3
+                pass_index = 0
+                region_index = 0
+                region_start = 0
+                region_end = total_size
+
+                def complete(completion):
+                    """Account a finished write, retrying failed chunks and skipping bad sectors"""
+                    nonlocal written, last_sync
+                    offset = completion['offset']
+                    length = completion['length']
+                    error = completion['error']
+                    done = completion['written']
+                    retry_count = 0
+
+                    while error is not None or done != length:
+                        if error is not None:
+                            print(
+                                f"  ❌ I/O Error at offset {offset:,}: {error}")
+                        else:
+                            print(
+                                f"  ⚠️ Partial write at offset {offset:,}: expected {length}, wrote {done}")
 
-                print(
-                    f"  🔄 Starting data overwrite - {total_size:,} bytes to process")
+                        # Hardware I/O errors are skipped right away, anything
+                        # else gets a few synchronous retries first
+                        hardware_error = error is not None and (
+                            "Input/output error" in str(error) or error.errno == 5)
+                        retry_count += 1
+                        if hardware_error or retry_count > max_retries:
+                            break
 
-                while written < total_size and self.is_wiping:
-                    remaining = min(buffer_size, total_size - written)
-                    write_data = pattern_buffer[:remaining]
+                        print(
+                            f"  🔄 Retry attempt {retry_count}/{max_retries}")
+                        time.sleep(0.5)
+                        try:
+                            done = os.pwrite(
+                                completion['fd'], completion['data'], offset)
+                            error = None
+                        except OSError as retry_error:
+                            error = retry_error
+                            done = 0
+
+                    if error is not None or done != length:
+                        error_details = str(error) if error else "short write"
+
+                        # Rewrite the chunk one sector at a time so that only
+                        # the sectors that still fail are left unwritten
+                        print(
+                            f"  🔍 Rewriting {length:,} bytes at offset {offset:,} sector by sector")
+                        skipped = 0
+                        for piece in range(0, length, sector_size):
+                            piece_length = min(sector_size, length - piece)
+                            try:
+                                if os.pwrite(completion['fd'],
+                                             completion['data'][piece:piece + piece_length],
+                                             offset + piece) == piece_length:
+                                    continue
+                                error_details = "short write"
+                            except OSError as sector_error:
+                                error_details = str(sector_error)
+
+                            # Record bad sector location
+                            skipped += piece_length
+                            bad_sectors[pass_index].append((offset + piece) // 512)
+
+                            if len(bad_sectors[pass_index]) > 100:  # Too many bad sectors
+                                raise Exception(
+                                    f"Device has too many bad sectors ({len(bad_sectors[pass_index])}). "
+                                    f"Hardware failure likely. Last error at offset {offset + piece:,}: {error_details}")
 
-                    try:
-                        bytes_written = device.write(write_data)
-                        if bytes_written != remaining:
+                        if skipped:
+                            if not hardware_error and (offset / total_size) < 0.1:
+                                raise Exception(
+                                    f"Write failed early at offset {offset:,}: {error_details}. "
+                                    f"Check device connection and health.")
                             print(
-                                f"  ⚠️ Partial write: expected {remaining}, wrote {bytes_written}")
-                            # For partial writes, adjust the written count
-                            written += bytes_written
+                                f"  ⏭️ Skipped {skipped:,} bytes in bad sectors at offset {offset:,}")
                         else:
-                            written += bytes_written
-                            retry_count = 0  # Reset retry count on successful write
+                            print(
+                                f"  ✅ Chunk at offset {offset:,} rewritten sector by sector")
 
-                        # Periodic sync to ensure data is written to storage
-                        if written - last_sync >= sync_interval:
-                            try:
-                                device.flush()
-                                os.fsync(device.fileno())
-                                last_sync = written
-                                print(f"  💾 Synced at {written:,} bytes")
-                            except OSError as sync_error:
-                                print(
-                                    f"  ⚠️ Sync warning at {written:,}: {sync_error}")
+                    written = offset + length
+                    self.bytes_written += length
+                    pattern_source.release()
 
-                        # Update progress
-                        if progress_callback:
+                    # Periodic sync to ensure data is written to storage
+                    if written - last_sync >= sync_interval:
+                        try:
+                            os.fsync(writer.fileno())
+                            last_sync = written
+                            print(f"  💾 Synced at {written:,} bytes")
+                            self._journal_checkpoint(
+                                first_pass_num + pass_index, written)
+                        except OSError as sync_error:
+                            print(
+                                f"  ⚠️ Sync warning at {written:,}: {sync_error}")
+
+                    # Update progress
+                    if progress_callback:
+                        pass_num = first_pass_num + pass_index
+                        if interleaved:
+                            done_bytes = region_start * len(patterns) + \
+                                pass_index * (region_end - region_start) + \
+                                (written - region_start)
+                            overall = done_bytes / \
+                                (total_size * len(patterns)) * 100
+                            progress_callback(
+                                overall,
+                                f"Region {region_index + 1}/{num_regions}, pass {pass_num}: "
+                                f"{overall:.1f}% complete"
+                            )
+                        else:
                             pass_progress = (written / total_size) * 100
                             progress_callback(
                                 pass_progress,
                                 f"Pass {pass_num}: {pass_progress:.1f}% complete ({written:,}/{total_size:,} bytes)"
                             )
 
-                    except (OSError, IOError) as e:
-                        error_offset = written
-                        error_details = str(e)
-
-                        print(
-                            f"  ❌ I/O Error at offset {error_offset:,}: {error_details}")
+                print(
+                    f"  🔄 Starting data overwrite - {total_size:,} bytes to process "
+                    f"(queue depth {queued_writer.queue_depth})")
+                if interleaved:
+                    print(
+                        f"  🧩 Region-interleaved: {len(patterns)} passes per "
+                        f"{region_size:,}-byte region ({num_regions} regions)")
+                if any(isinstance(p, RandomPattern) for p in patterns):
+                    print("  🎲 Streaming AES-256-CTR random data")
+
+                for region_start in range(first_region, total_size, region_size):
+                    region_index = region_start // region_size
+                    region_end = min(total_size, region_start + region_size)
+
+                    for pass_index, pattern in enumerate(patterns):
+                        if not self.is_wiping:
+                            break
+                        begin = region_start
+                        if region_start == first_region:
+                            if pass_index < start_pass_index:
+                                continue  # Already on the media
+                            if pass_index == start_pass_index:
+                                begin = max(start_offset, region_start)
+                        pass_start = time.time()
+
+                        # Pattern source -> preallocated buffer ring -> queued
+                        # writer. The ring holds every in-flight chunk plus a
+                        # little read-ahead.
+                        pattern_source = self._open_pattern_source(
+                            pattern, buffer_size, region_end,
+                            ring_size=queued_writer.queue_depth + 2,
+                            start_offset=begin)
+
+                        written = last_sync = next_offset = begin
+                        while next_offset < region_end and self.is_wiping:
+                            remaining = min(
+                                buffer_size, region_end - next_offset)
+                            write_data = pattern_source.next(remaining)
+                            target_fd = writer.fileno()
+
+                            if direct_device and remaining % sector_size:
+                                # An unaligned tail cannot go through O_DIRECT
+                                target_fd = device.fileno()
+
+                            for completion in queued_writer.submit(next_offset, write_data, target_fd):
+                                complete(completion)
+                            next_offset += remaining
+
+                        for completion in queued_writer.drain():
+                            complete(completion)
+                        pattern_source.close()
+                        pattern_source = None
+
+                        if interleaved:
+                            # Each pass has to reach the media before the next
+                            # one overwrites the region
+                            os.fsync(writer.fileno())
+                            if writer is not device:
+                                os.fsync(device.fileno())
+                            if written >= region_end:
+                                if pass_index + 1 < len(patterns):
+                                    self._journal_checkpoint(
+                                        first_pass_num + pass_index + 1, region_start, force=True)
+                                else:
+                                    self._journal_checkpoint(
+                                        first_pass_num, region_end, force=True)
+
+                        pass_written[pass_index] += written - begin
+                        pass_seconds[pass_index] += time.time() - pass_start
+
+                    if not self.is_wiping:
+                        break
 
-                        # Record bad sector location
-                        bad_sector = error_offset // 512  # Convert to sector number
-                        bad_sectors.append(bad_sector)
+                # Final sync to ensure all data is written
+                os.fsync(writer.fileno())
+                if writer is not device:
+                    os.fsync(device.fileno())
 
-                        # Determine error handling strategy
-                        if "Input/output error" in error_details or e.errno == 5:
-                            print(
-                                f"  🔧 Hardware I/O error detected - attempting recovery")
+                pass_stats = []
+                for pass_index in range(len(patterns)):
+                    pass_num = first_pass_num + pass_index
+                    pass_bad_sectors = bad_sectors[pass_index]
 
-                            # Try to skip the problematic sector(s)
-                            skip_size = 512 * 1024  # Skip 512KB (1024 sectors)
-                            new_position = min(written + skip_size, total_size)
+                    # Report bad sectors found
+                    if pass_bad_sectors:
+                        print(
+                            f"  ⚠️ Found {len(pass_bad_sectors)} bad sectors during pass {pass_num}")
+                        print(
+                            f"  📍 Bad sector range: {min(pass_bad_sectors)} - {max(pass_bad_sectors)}")
 
-                            try:
-                                device.seek(new_position)
-                                written = new_position
-                                print(
-                                    f"  ⏭️ Skipped to offset {new_position:,}")
-                                retry_count = 0
-                                continue
-                            except OSError as seek_error:
-                                print(
-                                    f"  ❌ Cannot seek past bad sector: {seek_error}")
-
-                        # Retry logic for transient errors
-                        retry_count += 1
-                        if retry_count <= max_retries:
-                            print(
-                                f"  🔄 Retry attempt {retry_count}/{max_retries}")
+                        # Add bad sector info to progress callback
+                        if progress_callback:
+                            progress_callback(
+                                100,
+                                f"Pass {pass_num}: Complete with {len(pass_bad_sectors)} bad sectors"
+                            )
 
-                            # Wait briefly and try to resync device
-                            time.sleep(0.5)
-                            try:
-                                device.flush()
-                                # Try to reposition and continue
-                                device.seek(written)
-                                continue
-                            except OSError:
-                                pass
-
-                        # If we've exhausted retries, decide whether to continue or fail
-                        if len(bad_sectors) > 100:  # Too many bad sectors
-                            raise Exception(
-                                f"Device has too many bad sectors ({len(bad_sectors)}). "
-                                f"Hardware failure likely. Last error at offset {error_offset:,}: {error_details}")
-                        elif (written / total_size) < 0.1:  # Failed very early
-                            raise Exception(
-                                f"Write failed early at offset {error_offset:,}: {error_details}. "
-                                f"Check device connection and health.")
-                        else:
-                            # We've made significant progress, record and continue
-                            print(
-                                f"  ⚠️ Continuing despite error at {error_offset:,}")
-                            # Try to skip ahead and continue
-                            skip_size = 1024 * 1024  # Skip 1MB
-                            try:
-                                new_position = min(
-                                    written + skip_size, total_size)
-                                device.seek(new_position)
-                                written = new_position
-                                retry_count = 0
-                                print(
-                                    f"  ⏭️ Resumed at offset {new_position:,}")
-                            except OSError:
-                                # If we can't even seek, the device is probably dead
-                                raise Exception(
-                                    f"Device unresponsive after I/O error at {error_offset:,}: {error_details}")
+                    elapsed = max(pass_seconds[pass_index], 1e-6)
+                    stats = {
+                        'pass': pass_num,
+                        'bytes_written': pass_written[pass_index],
+                        'seconds': round(elapsed, 3),
+                        'throughput_mb_s': round(pass_written[pass_index] / elapsed / (1024 * 1024), 2),
+                        'io_mode': 'direct' if direct_device else 'buffered',
+                        'queue_depth': queued_writer.queue_depth,
+                        'chunk_size': buffer_size,
+                        'bad_sectors': len(pass_bad_sectors)
+                    }
+                    if interleaved:
+                        stats['region_size'] = region_size
+                    pass_stats.append(stats)
 
-                # Report bad sectors found
-                if bad_sectors:
                     print(
-                        f"  ⚠️ Found {len(bad_sectors)} bad sectors during pass {pass_num}")
+                        f"Pass {pass_num} completed: {stats['bytes_written']:,} bytes written")
                     print(
-                        f"  📍 Bad sector range: {min(bad_sectors)} - {max(bad_sectors)}")
-
-                    # Add bad sector info to progress callback
-                    if progress_callback:
-                        progress_callback(
-                            100,
-                            f"Pass {pass_num}: Complete with {len(bad_sectors)} bad sectors"
-                        )
-
-                # Final sync to ensure all data is written
-                device.flush()
-                os.fsync(device.fileno())
-
-                print(f"Pass {pass_num} completed: {written:,} bytes written")
+                        f"  📈 Throughput: {stats['throughput_mb_s']:.1f} MB/s over {stats['seconds']:.1f}s")
 
                 # For SSDs, try to issue TRIM command after overwrite
                 if 'nvme' in device_path or 'ssd' in device_path.lower():
@@ -1377,6 +2337,8 @@ class SecureWipeEngine:
                     except (FileNotFoundError, subprocess.SubprocessError):
                         print("TRIM command not available or failed")
 
+                return pass_stats
+
         except Exception as e:
             error_msg = str(e)
 
@@ -1414,7 +2376,16 @@ class SecureWipeEngine:
 
             raise Exception(enhanced_msg)
 
-    def _windows_overwrite(self, device_path: str, pattern: bytes, progress_callback: Callable, pass_num: int):
+        finally:
+            if queued_writer:
+                queued_writer.close()
+            if pattern_source:
+                pattern_source.close()
+            if direct_device:
+                direct_device.close()
+
+    def _windows_overwrite(self, device_path: str, pattern: bytes, progress_callback: Callable, pass_num: int,
+                           start_offset: int = 0):
         """Windows-specific overwrite - FINAL SOLUTION that bypasses Windows 'learned blocking'"""
         import ctypes
         import subprocess
@@ -1464,7 +2435,8 @@ class SecureWipeEngine:
         FILE_SHARE_WRITE = 0x00000002
         OPEN_EXISTING = 3
 
-        buffer_size = 1024 * 1024  # 1MB buffer
+        buffer_size = self.chunk_size
+        pattern_source = None
 
         try:
             print(
@@ -1584,15 +2556,27 @@ class SecureWipeEngine:
                     print(
                         f"  ⚠️ Using safe default size: {total_size:,} bytes")
 
-                # Prepare write buffer with pattern
-                write_pattern = (
-                    pattern * (buffer_size // len(pattern) + 1))[:buffer_size]
-                write_buffer = create_string_buffer(write_pattern)
+                # Same pattern pipeline as Linux; WriteFile is synchronous so
+                # a short ring is enough. ctypes views over the ring buffers
+                # are built once and reused for every chunk.
+                # Resume an interrupted pass on a chunk boundary
+                start_offset = min(start_offset - start_offset % buffer_size,
+                                   total_size)
+                if start_offset:
+                    windll.kernel32.SetFilePointerEx(
+                        handle, ctypes.c_longlong(start_offset), None, 0)  # FILE_BEGIN
+                    print(f"  ↩️ Resuming at offset {start_offset:,}")
+
+                pattern_source = self._open_pattern_source(
+                    pattern, buffer_size, total_size, ring_size=4,
+                    start_offset=start_offset)
+                write_buffers = {}
                 bytes_written = wintypes.DWORD()
 
                 # Perform the overwrite - Method 6 style
-                written = 0
+                written = start_offset
                 last_progress = -1
+                pass_start = time.time()
 
                 print(f"  🔥 Starting data destruction...")
 
@@ -1601,12 +2585,12 @@ class SecureWipeEngine:
                     current_write_size = min(buffer_size, total_size - written)
 
                     # Prepare buffer for this write
-                    if current_write_size != buffer_size:
-                        current_pattern = (
-                            pattern * (current_write_size // len(pattern) + 1))[:current_write_size]
-                        current_buffer = create_string_buffer(current_pattern)
-                    else:
-                        current_buffer = write_buffer
+                    write_view = pattern_source.next(current_write_size)
+                    current_buffer = write_buffers.get(id(write_view))
+                    if current_buffer is None:
+                        current_buffer = (ctypes.c_char * current_write_size).from_buffer(
+                            write_view)
+                        write_buffers[id(write_view)] = current_buffer
 
                     # CRITICAL WRITE OPERATION - Method 6 style
                     result = windll.kernel32.WriteFile(
@@ -1634,10 +2618,13 @@ class SecureWipeEngine:
                             f"expected {current_write_size}, wrote {bytes_written.value}")
 
                     written += bytes_written.value
+                    self.bytes_written += bytes_written.value
+                    pattern_source.release()
 
                     # Flush buffers periodically for reliability
                     if written % (16 * 1024 * 1024) == 0:  # Every 16MB
-                        windll.kernel32.FlushFileBuffers(handle)
+                        if windll.kernel32.FlushFileBuffers(handle):
+                            self._journal_checkpoint(pass_num, written)
 
                     # Update progress (avoid spam)
                     current_progress = int((written / total_size) * 100)
@@ -1652,13 +2639,32 @@ class SecureWipeEngine:
                 # Final flush to ensure all data is written
                 windll.kernel32.FlushFileBuffers(handle)
 
+                elapsed = max(time.time() - pass_start, 1e-6)
+                pass_written = written - start_offset
+                pass_stats = {
+                    'pass': pass_num,
+                    'bytes_written': pass_written,
+                    'seconds': round(elapsed, 3),
+                    'throughput_mb_s': round(pass_written / elapsed / (1024 * 1024), 2),
+                    'io_mode': 'buffered',
+                    'queue_depth': 1,
+                    'chunk_size': buffer_size,
+                    'bad_sectors': 0
+                }
+
                 print(f"  ✅ Pass {pass_num} completed successfully!")
                 print(
                     f"  📊 Total written: {written:,} bytes using FINAL SOLUTION")
                 print(f"  🎯 Used approach: {successful_approach}")
+                print(
+                    f"  📈 Throughput: {pass_stats['throughput_mb_s']:.1f} MB/s over {pass_stats['seconds']:.1f}s")
+                return pass_stats
 
             finally:
                 windll.kernel32.CloseHandle(handle)
+                if pattern_source:
+                    write_buffers = current_buffer = None
+                    pattern_source.close()
 
         except Exception as e:
             raise Exception(f"FINAL SOLUTION Device Wipe failed: {str(e)}")
@@ -1706,18 +2712,30 @@ class SecureWipeEngine:
         except Exception as e:
             raise Exception(f"Android overwrite failed: {str(e)}")
 
-    def _verify_wipe(self, device_info: Dict) -> bool:
+    def _verify_wipe(self, device_info: Dict, wipe_log: Dict = None, expected_pattern=None,
+                     progress_callback: Callable = None) -> bool:
         """Verify that the wipe was successful"""
         try:
             device_path = device_info['device']
             platform = device_info.get('platform', self.system.platform)
 
+            if platform == 'linux' and self.verification_mode == 'full':
+                report = self._linux_full_verify(
+                    device_path, expected_pattern, progress_callback)
+                if wipe_log is not None:
+                    wipe_log['verification'] = report
+                return report['passed']
+            if wipe_log is not None:
+                wipe_log['verification'] = {
+                    'mode': 'sample',
+                    'compared_against': self._verification_reference(expected_pattern)
+                }
             if platform == 'linux':
-                return self._linux_verify(device_path)
+                return self._linux_verify(device_path, expected_pattern)
             elif platform == 'windows':
-                return self._windows_verify(device_path)
+                return self._windows_verify(device_path, expected_pattern)
             elif platform == 'android':
-                return self._android_verify(device_path)
+                return self._android_verify(device_path, expected_pattern)
 
             return False
 
@@ -1725,10 +2743,36 @@ class SecureWipeEngine:
             print(f"Verification error: {str(e)}")
             return False
 
-    def _linux_verify(self, device_path: str) -> bool:
+    def _verification_reference(self, expected_pattern=None) -> str:
+        """What verification compares the device contents against"""
+        if expected_pattern is None:
+            return 'heuristic'
+        return 'keystream' if isinstance(expected_pattern, RandomPattern) else 'pattern'
+
+    def _sample_matches(self, data: bytes, offset: int, expected_pattern=None) -> bool:
+        """Check a verification sample read from offset.
+
+        When the last pass is known the sample must equal what it wrote there:
+        the keystream at that offset, or the fixed pattern as tiled per write
+        chunk. Only without one do the recoverable-data heuristics run, since
+        their short signatures match random pass data by chance.
+        """
+        if expected_pattern is None:
+            return not self._contains_recoverable_data(data)
+        if isinstance(expected_pattern, RandomPattern):
+            return expected_pattern.xor(data, offset) == bytes(len(data))
+
+        chunk_size = self.chunk_size
+        period = (expected_pattern *
+                  (chunk_size // len(expected_pattern) + 1))[:chunk_size]
+        phase = offset % chunk_size
+        expected = period * ((phase + len(data)) // chunk_size + 1)
+        return bytes(data) == expected[phase:phase + len(data)]
+
+    def _linux_verify(self, device_path: str, expected_pattern=None) -> bool:
         """Linux verification implementation"""
         try:
-            sample_size = 1024 * 1024  # 1MB samples
+            sample_size = self.chunk_size
             num_samples = 10
 
             with open(device_path, 'rb') as device:
@@ -1738,7 +2782,7 @@ class SecureWipeEngine:
                 if total_size < sample_size:
                     device.seek(0)
                     data = device.read()
-                    return not self._contains_recoverable_data(data)
+                    return self._sample_matches(data, 0, expected_pattern)
 
                 # Check random samples
                 for _ in range(num_samples):
@@ -1747,7 +2791,7 @@ class SecureWipeEngine:
                     device.seek(position)
                     data = device.read(sample_size)
 
-                    if self._contains_recoverable_data(data):
+                    if not self._sample_matches(data, position, expected_pattern):
                         return False
 
                 return True
@@ -1755,7 +2799,173 @@ class SecureWipeEngine:
         except Exception:
             return False
 
-    def _windows_verify(self, device_path: str) -> bool:
+    def _linux_full_verify(self, device_path: str, expected_pattern=None,
+                           progress_callback: Callable = None) -> Dict:
+        """Read back the entire device and compare it with the last pass.
+
+        Reads are large, aligned and kept write_queue_depth deep (O_DIRECT
+        when the device allows it, sequential readahead otherwise), and each
+        chunk is compared in C with a single bytes comparison. Without a known
+        last pattern (hardware erase, failed passes) every chunk goes through
+        the recoverable-data heuristic instead.
+        """
+        max_reported = 10
+        chunk_size = self.chunk_size
+        report = {
+            'mode': 'full',
+            'passed': False,
+            'compared_against': self._verification_reference(expected_pattern),
+            'bytes_verified': 0,
+            'mismatched_chunks': 0,
+            'first_mismatches': [],
+            'seconds': 0.0,
+            'throughput_mb_s': 0.0,
+            'io_mode': 'buffered'
+        }
+
+        direct_fd = None
+        buffered_fd = os.open(device_path, os.O_RDONLY)
+        executor = None
+        buffers = []
+        try:
+            total_size = os.lseek(buffered_fd, 0, os.SEEK_END)
+            sector_size = self._get_logical_sector_size(device_path)
+            chunk_size = max(sector_size,
+                             (chunk_size // sector_size) * sector_size)
+
+            try:
+                if not hasattr(os, 'O_DIRECT'):
+                    raise OSError("O_DIRECT not supported")
+                direct_fd = os.open(device_path, os.O_RDONLY | os.O_DIRECT)
+                probe = AlignedBuffer(sector_size)
+                try:
+                    os.preadv(direct_fd, [probe.view], 0)
+                finally:
+                    probe.close()
+                read_fd = direct_fd
+                report['io_mode'] = 'direct'
+            except OSError:
+                if direct_fd is not None:
+                    os.close(direct_fd)
+                    direct_fd = None
+                read_fd = buffered_fd
+                try:
+                    os.posix_fadvise(buffered_fd, 0, 0,
+                                     os.POSIX_FADV_SEQUENTIAL)
+                except (AttributeError, OSError):
+                    pass
+
+            # How each chunk is checked against what the last pass wrote
+            if isinstance(expected_pattern, RandomPattern):
+                zeros = bytes(chunk_size)
+
+                def chunk_matches(data, offset):
+                    result = expected_pattern.xor(data, offset)
+                    return result == (zeros if len(data) == chunk_size else bytes(len(data)))
+            elif expected_pattern is not None:
+                # Fixed patterns restart at every write chunk boundary
+                expected = (expected_pattern *
+                            (chunk_size // len(expected_pattern) + 1))[:chunk_size]
+
+                def chunk_matches(data, offset):
+                    phase = offset % chunk_size
+                    if phase == 0 and len(data) == chunk_size:
+                        return data.tobytes() == expected
+                    return data.tobytes() == expected[phase:phase + len(data)]
+            else:
+                def chunk_matches(data, offset):
+                    return not self._contains_recoverable_data(data.tobytes())
+
+            def first_mismatch(data, offset):
+                """Narrow a failed chunk down to the first differing byte"""
+                if expected_pattern is None:
+                    return offset
+                block = 4096
+                for start in range(0, len(data), block):
+                    if not chunk_matches(data[start:start + block], offset + start):
+                        for byte in range(start, min(start + block, len(data))):
+                            if not chunk_matches(data[byte:byte + 1], offset + byte):
+                                return offset + byte
+                return offset
+
+            queue_depth = max(1, self.write_queue_depth)
+            buffers = [AlignedBuffer(chunk_size) for _ in range(queue_depth)]
+            executor = ThreadPoolExecutor(max_workers=queue_depth,
+                                          thread_name_prefix='ews-reader')
+            pending = deque()
+            next_offset = 0
+            submitted = 0
+            verify_start = time.time()
+            last_progress = -1
+
+            print(
+                f"  🔎 Full verification of {total_size:,} bytes "
+                f"({report['io_mode']} I/O, {chunk_size:,}-byte reads, "
+                f"against {report['compared_against']})")
+
+            while next_offset < total_size or pending:
+                # Keep the read queue full; reads complete in submission
+                # order, so buffers are reused round-robin
+                while next_offset < total_size and len(pending) < queue_depth:
+                    length = min(chunk_size, total_size - next_offset)
+                    slot_index = submitted % queue_depth
+                    # An unaligned tail cannot go through O_DIRECT
+                    fd = read_fd if length % sector_size == 0 else buffered_fd
+                    future = executor.submit(
+                        os.preadv, fd, [buffers[slot_index].view[:length]], next_offset)
+                    pending.append((next_offset, length, slot_index, future))
+                    next_offset += length
+                    submitted += 1
+
+                offset, length, slot_index, future = pending.popleft()
+                got = future.result()
+                data = buffers[slot_index].view[:got]
+
+                if got != length or not chunk_matches(data, offset):
+                    report['mismatched_chunks'] += 1
+                    if len(report['first_mismatches']) < max_reported:
+                        mismatch = first_mismatch(data, offset) if got == length \
+                            else offset + got
+                        report['first_mismatches'].append(mismatch)
+                        if expected_pattern is None:
+                            print(
+                                f"  ❌ Possible recoverable data in chunk at offset {mismatch:,}")
+                        else:
+                            print(f"  ❌ Mismatch at offset {mismatch:,}")
+                report['bytes_verified'] = offset + length
+
+                current_progress = int(
+                    report['bytes_verified'] / max(total_size, 1) * 100)
+                if progress_callback and current_progress != last_progress:
+                    progress_callback(
+                        80 + current_progress * 0.1,
+                        f"Verifying: {current_progress}% read back")
+                    last_progress = current_progress
+
+            elapsed = max(time.time() - verify_start, 1e-6)
+            report['seconds'] = round(elapsed, 3)
+            report['throughput_mb_s'] = round(
+                report['bytes_verified'] / elapsed / (1024 * 1024), 2)
+            report['passed'] = (report['mismatched_chunks'] == 0 and
+                                report['bytes_verified'] == total_size)
+
+            outcome = 'PASSED' if report['passed'] else \
+                f"{report['mismatched_chunks']} mismatched chunks"
+            print(
+                f"  🔎 Verified {report['bytes_verified']:,} bytes at "
+                f"{report['throughput_mb_s']:.1f} MB/s - {outcome}")
+            return report
+
+        finally:
+            if executor:
+                executor.shutdown(wait=True)
+            for buffer in buffers:
+                buffer.close()
+            if direct_fd is not None:
+                os.close(direct_fd)
+            os.close(buffered_fd)
+
+    def _windows_verify(self, device_path: str, expected_pattern=None) -> bool:
         """Windows verification implementation using Windows API"""
         import ctypes
         from ctypes import wintypes, windll, byref, create_string_buffer
@@ -1808,7 +3018,7 @@ class SecureWipeEngine:
                     return False
 
                 # Verification parameters
-                sample_size = 1024 * 1024  # 1MB samples, sector-aligned
+                sample_size = self.chunk_size  # Sector-aligned below
                 sector_size = 512
                 aligned_sample_size = (
                     (sample_size + sector_size - 1) // sector_size) * sector_size
@@ -1872,11 +3082,11 @@ class SecureWipeEngine:
                             f"Read failed during verification at position {position}")
                         continue
 
-                    # Check if data contains recoverable information
+                    # Check the sample against the last pass
                     data = read_buffer.raw[:bytes_read.value]
-                    if self._contains_recoverable_data(data):
+                    if not self._sample_matches(data, position, expected_pattern):
                         print(
-                            f"Recoverable data found at position {position} during verification")
+                            f"Unexpected data found at position {position} during verification")
                         return False
 
                     print(
@@ -1892,14 +3102,14 @@ class SecureWipeEngine:
             print(f"Windows verification error: {str(e)}")
             return False
 
-    def _android_verify(self, device_path: str) -> bool:
+    def _android_verify(self, device_path: str, expected_pattern=None) -> bool:
         """Android verification implementation"""
         try:
             print(f"Verifying Android device: {device_path}")
 
             # Android verification would use similar approach to Linux
             # but might need different device access methods
-            sample_size = 1024 * 1024  # 1MB samples
+            sample_size = self.chunk_size
             num_samples = 5  # Fewer samples for mobile devices
 
             # Try to read device using standard file operations
@@ -1927,9 +3137,9 @@ class SecureWipeEngine:
                         device.seek(position)
                         data = device.read(read_size)
 
-                        if self._contains_recoverable_data(data):
+                        if not self._sample_matches(data, position, expected_pattern):
                             print(
-                                f"Recoverable data found during Android verification")
+                                f"Unexpected data found during Android verification")
                             return False
 
                     print("Android device verification completed successfully")
@@ -1943,69 +3153,171 @@ class SecureWipeEngine:
             print(f"Android verification error: {str(e)}")
             return False
 
+    # Byte classes for the verification heuristics
+    PRINTABLE_ASCII = bytes(range(0x20, 0x7F))  # str.isprintable() below 0x80
+    NON_ASCII = bytes(range(0x80, 0x100))
+
     def _contains_recoverable_data(self, data: bytes) -> bool:
         """Check if data contains recoverable information"""
         if not data:
             return False
+        data = bytes(data)
 
-        # Check for common file system signatures
-        signatures = [
-            b'NTFS', b'\x55\xAA', b'FAT32', b'FAT16', b'exFAT',
-            b'ext2', b'ext3', b'ext4', b'XFS', b'Btrfs',
-            b'\x89PNG', b'JFIF', b'%PDF', b'PK\x03\x04',
-            b'MZ', b'ELF', b'\x7fELF', b'RIFF', b'GIF8'
-        ]
+        # A buffer of one repeated byte is wipe output and cannot contain
+        # any of the (multi-valued) signatures below
+        if data.count(data[:1]) == len(data):
+            return False
+
+        # Check for common file system and file format signatures
+        if self.signature_scanner.find_signature(data) is not None:
+            return True
+
+        return self._statistics_suggest_data(data)
+
+    def _byte_histogram(self, data: bytes, sector_matches=None):
+        """256-entry byte histogram of data.
+
+        sector_matches marks 512-byte sectors identical to the first one;
+        those are counted once and scaled instead of being rescanned.
+        """
+        if np is None:
+            histogram = [0] * 256
+            for value in set(data):
+                histogram[value] = data.count(bytes((value,)))
+            return histogram
+
+        array = np.frombuffer(data, dtype=np.uint8)
+        if sector_matches is None:
+            return np.bincount(array, minlength=256)
+
+        sector_bytes = len(sector_matches) * 512
+        sectors = array[:sector_bytes].reshape(-1, 512)
+        histogram = np.bincount(sectors[0], minlength=256) * \
+            int(np.count_nonzero(sector_matches))
+        histogram += np.bincount(sectors[~sector_matches].ravel(), minlength=256)
+        histogram += np.bincount(array[sector_bytes:], minlength=256)
+        return histogram
+
+    def _histogram_statistics(self, histogram, length: int) -> Dict:
+        """Unique byte count, ASCII/printable counts and Shannon entropy from a histogram"""
+        counts = [int(count) for count in histogram]
+        return {
+            'unique_bytes': sum(1 for count in counts if count),
+            'ascii_bytes': sum(counts[:0x80]),
+            'printable_bytes': sum(counts[0x20:0x7F]),
+            'entropy': -sum((count / length) * math.log2(count / length)
+                            for count in counts if count)
+        }
 
-        for signature in signatures:
-            if signature in data:
+    def _sample_entropy(self, data: bytes) -> float:
+        """Shannon entropy (bits/byte) estimated from at most 64K evenly spaced bytes"""
+        sample = data[::max(1, len(data) // 65536)]
+        if np is not None:
+            histogram = np.bincount(np.frombuffer(sample, dtype=np.uint8),
+                                    minlength=256)
+        else:
+            histogram = self._byte_histogram(sample)
+        return self._histogram_statistics(histogram, len(sample))['entropy']
+
+    def _statistics_suggest_data(self, data: bytes) -> bool:
+        """Statistical part of the heuristic: text content and filesystem structures"""
+        array = np.frombuffer(data, dtype=np.uint8) if np is not None else None
+
+        # Check for ASCII text patterns that suggest files: more than 10% of
+        # the ASCII bytes printable, plus a common file indicator
+        if array is not None:
+            ascii_bytes = int(np.count_nonzero(array < 0x80))
+            printable_bytes = int(np.count_nonzero(array >= 0x20)) - \
+                int(np.count_nonzero(array >= 0x7F))
+        else:
+            ascii_bytes = len(data.translate(None, self.NON_ASCII))
+            printable_bytes = len(data) - \
+                len(data.translate(None, self.PRINTABLE_ASCII))
+
+        if ascii_bytes > 100 and printable_bytes / ascii_bytes > 0.1 and \
+                self._sample_entropy(data) <= 7.9:
+            # Random-looking data (a cryptographic wipe pass) is not text, and
+            # any indicator found in it would be coincidence
+            text = data if ascii_bytes == len(data) else \
+                data.translate(None, self.NON_ASCII)
+            text_lower = text.lower()
+            if self.signature_scanner.find_text_indicator(text_lower) is not None:
                 return True
 
-        # Check for ASCII text patterns that suggest files
-        try:
-            # Look for readable text strings (possible file content)
-            decoded = data.decode('ascii', errors='ignore')
-            # Check if more than 10% is printable ASCII text
-            printable_ratio = sum(1 for c in decoded if c.isprintable(
-            ) and c not in '\x00\xff') / len(decoded)
-            if printable_ratio > 0.1 and len(decoded) > 100:
-                # Additional check: look for common file patterns
-                text_lower = decoded.lower()
-                file_indicators = ['filename', 'document', 'created', 'modified', 'author',
-                                   'copyright', 'version', 'www.', 'http', '.com', '.exe', '.txt']
-                if any(indicator in text_lower for indicator in file_indicators):
-                    return True
-        except:
-            pass
+        # Check for repeating patterns that might indicate file structures
+        total_sectors = len(data) // 512
+        if total_sectors < 2:
+            return False
 
-        # Check for structured data patterns (but exclude legitimate wipe patterns)
-        unique_bytes = len(set(data))
+        # Look for sector-sized repetitive patterns
+        first_sector = data[:512]
+        sector_matches = None
+        if array is not None:
+            sectors = np.frombuffer(data, dtype=np.uint64, count=total_sectors * 64) \
+                .reshape(total_sectors, 64)
+            sector_matches = (sectors == sectors[0]).all(axis=1)
+            repeated_sectors = int(np.count_nonzero(sector_matches)) - 1
+        else:
+            repeated_sectors = sum(1 for i in range(512, total_sectors * 512, 512)
+                                   if data[i:i + 512] == first_sector)
 
-        # Allow uniform patterns (legitimate wipe results)
-        if unique_bytes <= 2:  # All same byte or alternating pattern
+        # More than 80% of sectors identical and containing structured data
+        if (repeated_sectors / total_sectors) <= 0.8 or \
+                not self._looks_like_filesystem_structure(first_sector):
             return False
 
-        # Allow random-looking data (cryptographic wipe patterns)
-        if unique_bytes > len(data) * 0.8:  # High entropy suggests random data
+        # Only then is the byte histogram needed: uniform or alternating
+        # patterns and random-looking data are legitimate wipe results
+        stats = self._histogram_statistics(
+            self._byte_histogram(data, sector_matches), len(data))
+        if stats['unique_bytes'] <= 2:
+            return False
+        if stats['unique_bytes'] > len(data) * 0.8 or stats['entropy'] > 7.9:
             return False
 
-        # Check for repeating patterns that might indicate file structures
-        if len(data) >= 512:
-            # Look for sector-sized repetitive patterns
-            first_sector = data[:512]
-            repeated_sectors = 0
-            for i in range(512, len(data), 512):
-                sector = data[i:i+512]
-                if len(sector) == 512 and sector == first_sector:
-                    repeated_sectors += 1
-
-            # If more than 80% of sectors are identical and contain structured data
-            total_sectors = len(data) // 512
-            if total_sectors > 1 and (repeated_sectors / total_sectors) > 0.8:
-                # Check if the repeated sector contains structured data
-                if self._looks_like_filesystem_structure(first_sector):
-                    return True
+        return True
 
-        return False
+    def benchmark_verification_heuristics(self, buffer_size: int = 1024 * 1024,
+                                          rounds: int = 20) -> Dict:
+        """Time the verification heuristics on representative buffers, in GB/s per core.
+
+        The 1 GB/s target applies to the heuristics stage on wipe output
+        (zero, ones and repeated-sector buffers, ~0.9-1.1 GB/s; random
+        ~0.7). The full check adds the signature scan and measures ~0.35-0.75
+        GB/s on wipe output. Text and binary data without an early hit are
+        bounded by the indicator and signature regex searches, an order of
+        magnitude slower.
+        """
+        boot_sector = bytearray(512)
+        boot_sector[3:11] = b'MSDOS5.0'
+        boot_sector[510:512] = b'\x55\xAA'
+        keystream = RandomPattern().generate(0, buffer_size)
+        buffers = {
+            'zero pass': bytes(buffer_size),
+            'ones pass': b'\xFF' * buffer_size,
+            'random pass': keystream,
+            'text': (b'Quarterly report, version 3, created by the finance team. '
+                     * (buffer_size // 58 + 1))[:buffer_size],
+            'text, no indicators': (b'Quarterly report for the finance team, third draft. '
+                                    * (buffer_size // 52 + 1))[:buffer_size],
+            'filesystem': (bytes(boot_sector) * (buffer_size // 512 + 1))[:buffer_size],
+            'low-entropy binary': keystream.translate(bytes(v & 0x0F for v in range(256)))
+        }
+
+        results = {}
+        for name, data in buffers.items():
+            row = {}
+            for stage, check in (('heuristics', self._statistics_suggest_data),
+                                 ('full_check', self._contains_recoverable_data)):
+                start = time.perf_counter()
+                for _ in range(rounds):
+                    check(data)
+                elapsed = max(time.perf_counter() - start, 1e-9)
+                row[stage] = round(rounds * len(data) / elapsed / 1e9, 2)
+            results[name] = row
+
+        return {'buffer_size': buffer_size, 'numpy': np is not None,
+                'gb_per_s': results}
 
     def _looks_like_filesystem_structure(self, sector: bytes) -> bool:
         """Check if a sector looks like filesystem metadata"""
@@ -2245,55 +3557,1123 @@ class SecureWipeEngine:
         """Cancel the current wipe operation"""
         self.is_wiping = False
 
+# ============================================================================
+# ISOLATED WIPE WORKERS
+# ============================================================================
+
+
+def _worker_process_context():
+    """Multiprocessing context for worker processes started by a threaded app.
+
+    A forked child inherits every lock held by the parent's other threads
+    (GUI, queue workers, writer pools) at that instant, so workers start
+    from a forkserver instead, or are spawned where there is none. Either
+    way the worker entry point is re-imported from this module.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context('forkserver')
+    return multiprocessing.get_context('spawn')
+
+
+def _isolated_wipe_worker(conn, device_info, method: str, settings: Dict, resume: bool):
+    """Worker process body: run one wipe, streaming progress over the pipe"""
+    engine = SecureWipeEngine()
+    for setting, value in settings.items():
+        setattr(engine, setting, value)
+    last_report = [0.0]
+
+    def progress_callback(progress, message):
+        while conn.poll():
+            if conn.recv() == 'cancel':
+                engine.cancel_wipe()
+        now = time.time()
+        if now - last_report[0] >= WipeSupervisor.PROGRESS_INTERVAL or progress >= 100:
+            last_report[0] = now
+            conn.send(('progress', progress, message, engine.bytes_written))
+
+    try:
+        result = engine.wipe_device(device_info, method, progress_callback, resume=resume)
+        conn.send(('result', result))
+    except Exception as e:
+        conn.send(('error', str(e)))
+    finally:
+        conn.close()
+
+
+class WipeSupervisor:
+    """Runs each wipe in its own worker process under a watchdog.
+
+    A hung fsync on a dying drive then only stalls that worker: when it
+    reports no progress for stall_timeout seconds (or runs past job_timeout)
+    it is killed and the wipe fails, while other jobs and the GUI carry on.
+    The engine passed to run() mirrors the worker - is_wiping, bytes_written
+    and cancel_wipe() work on it as for an in-process wipe.
+    """
+
+    PROGRESS_INTERVAL = 0.1  # Seconds between progress messages from a worker
+
+    def __init__(self, stall_timeout: float = 1800.0, job_timeout: float = None,
+                 cancel_grace: float = 30.0, poll_interval: float = 0.5):
+        self.stall_timeout = stall_timeout  # Generous: secure erase reports no progress
+        self.job_timeout = job_timeout
+        self.cancel_grace = cancel_grace  # Seconds a cancelled worker gets to stop
+        self.poll_interval = poll_interval
+        self._context = _worker_process_context()
+        self._abandoned = []  # Killed workers still stuck in the kernel
+        self._lock = threading.Lock()
+
+    def run(self, engine: SecureWipeEngine, device_info, method: str,
+            progress_callback: Callable = None, resume: bool = False) -> Dict:
+        """Wipe a device in a worker process and return its wipe log"""
+        self._reap()
+        settings = {setting: getattr(engine, setting)
+                    for setting in SecureWipeEngine.TUNABLE_SETTINGS}
+        parent_conn, child_conn = self._context.Pipe()
+        worker = self._context.Process(
+            target=_isolated_wipe_worker,
+            args=(child_conn, device_info, method, settings, resume),
+            daemon=True)
+
+        engine.is_wiping = True
+        base_bytes = engine.bytes_written
+        started = last_progress = time.time()
+        cancelled_at = None
+        result = None
+        killed = False  # The watchdog already dealt with the worker
+
+        try:
+            worker.start()
+            child_conn.close()
+
+            while result is None:
+                if not engine.is_wiping and cancelled_at is None:
+                    cancelled_at = time.time()
+                    try:
+                        parent_conn.send('cancel')
+                    except OSError:
+                        pass
+
+                if parent_conn.poll(self.poll_interval):
+                    try:
+                        message = parent_conn.recv()
+                    except EOFError:
+                        worker.join(timeout=5)
+                        result = self._failed_result(
+                            device_info, method,
+                            f"Wipe worker exited unexpectedly (exit code {worker.exitcode})")
+                        break
+
+                    if message[0] == 'progress':
+                        last_progress = time.time()
+                        engine.bytes_written = base_bytes + message[3]
+                        if progress_callback:
+                            progress_callback(message[1], message[2])
+                    elif message[0] == 'result':
+                        result = message[1]
+                    else:
+                        result = self._failed_result(
+                            device_info, method, f"Critical error: {message[1]}")
+                    continue
+
+                now = time.time()
+                if now - last_progress > self.stall_timeout:
+                    reason = f"Watchdog: no progress for {self.stall_timeout:.0f}s, wipe worker killed"
+                elif self.job_timeout and now - started > self.job_timeout:
+                    reason = f"Watchdog: job exceeded {self.job_timeout:.0f}s, wipe worker killed"
+                elif cancelled_at and now - cancelled_at > self.cancel_grace:
+                    reason = "Cancelled: wipe worker did not stop in time and was killed"
+                else:
+                    continue
+
+                print(f"⏱️ {reason}")
+                self._kill(worker)
+                killed = True
+                result = self._failed_result(device_info, method, reason)
+
+        finally:
+            parent_conn.close()
+            engine.is_wiping = False
+
+        if not killed:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                self._kill(worker)
+        engine.current_operation = None
+        return result
+
+    def _kill(self, worker):
+        """Terminate a worker, escalating to SIGKILL; keep it for reaping if it won't die"""
+        worker.terminate()
+        worker.join(timeout=5)
+        if worker.is_alive():
+            worker.kill()
+            worker.join(timeout=5)
+        if worker.is_alive():
+            # Blocked in uninterruptible I/O; it exits once the kernel lets go
+            print(f"⚠️ Wipe worker {worker.pid} is stuck in the kernel, will be reaped later")
+            with self._lock:
+                self._abandoned.append(worker)
+
+    def _reap(self):
+        """Collect killed workers that have finally exited"""
+        with self._lock:
+            for worker in [w for w in self._abandoned if not w.is_alive()]:
+                worker.join(timeout=0)
+                self._abandoned.remove(worker)
+
+    def _failed_result(self, device_info, method: str, reason: str) -> Dict:
+        if not isinstance(device_info, dict):
+            device_info = {'device': device_info}
+        now = datetime.now(timezone.utc).isoformat()
+        return {
+            'device': device_info.get('device'),
+            'method': method,
+            'start_time': now,
+            'end_time': now,
+            'device_info': device_info,
+            'passes_completed': 0,
+            'total_passes': 0,
+            'pass_stats': [],
+            'verification_passed': False,
+            'errors': [reason],
+            'success': False,
+            'platform': platform.system().lower()
+        }
+
 # ============================================================================
 # CERTIFICATE MANAGEMENT SYSTEM
 # ============================================================================
 
 
-class CertificateManager:
-    """Advanced tamper-proof certificate generation and management"""
+class CertificateIndex:
+    """SQLite index of stored certificates by ID, serial, fingerprint and time.
+
+    Lets a certificate be found without opening every JSON file in the
+    store; generate_certificate keeps it current and rebuild() recreates
+    it from an existing directory. It also tracks the rendering status of
+    each certificate's QR code and PDF.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()  # One connection per thread
+        self._connection().executescript("""
+            CREATE TABLE IF NOT EXISTS certificates (
+                cert_id TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                serial TEXT,
+                fingerprint TEXT,
+                timestamp TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_certificates_serial ON certificates(serial);
+            CREATE INDEX IF NOT EXISTS idx_certificates_fingerprint ON certificates(fingerprint);
+            CREATE INDEX IF NOT EXISTS idx_certificates_timestamp ON certificates(timestamp);
+            CREATE TABLE IF NOT EXISTS artifacts (
+                cert_id TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                error TEXT,
+                updated REAL NOT NULL,
+                PRIMARY KEY (cert_id, kind)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_artifacts_status ON artifacts(status);
+        """)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(
+                str(self.db_path), timeout=30, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def _entry(self, cert_data: Dict, path: Path) -> tuple:
+        device_info = cert_data.get('device_info', {})
+        return (cert_data['certificate_id'], str(path), device_info.get('serial_number'),
+                device_info.get('fingerprint'), cert_data.get('timestamp'))
+
+    def add(self, cert_data: Dict, path: Path):
+        """Index (or re-index) one stored certificate"""
+        self._connection().execute(
+            'INSERT OR REPLACE INTO certificates VALUES (?, ?, ?, ?, ?)',
+            self._entry(cert_data, path))
+
+    def remove(self, cert_id: str):
+        self._connection().execute(
+            'DELETE FROM certificates WHERE cert_id = ?', (cert_id,))
+
+    def lookup(self, cert_id: str) -> Optional[Path]:
+        """Path of the certificate's JSON file, if indexed"""
+        row = self._connection().execute(
+            'SELECT path FROM certificates WHERE cert_id = ?', (cert_id,)).fetchone()
+        return Path(row['path']) if row else None
+
+    def find(self, serial: str = None, fingerprint: str = None, since: str = None,
+             until: str = None, limit: int = None) -> List[Dict]:
+        """Index entries matching a serial, fingerprint and/or ISO timestamp range, oldest first"""
+        clauses, params = [], []
+        for clause, value in (('serial = ?', serial), ('fingerprint = ?', fingerprint),
+                              ('timestamp >= ?', since), ('timestamp < ?', until)):
+            if value is not None:
+                clauses.append(clause)
+                params.append(value)
+
+        query = 'SELECT * FROM certificates'
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        query += ' ORDER BY timestamp'
+        if limit:
+            query += f' LIMIT {int(limit)}'
+        return [dict(row) for row in self._connection().execute(query, params)]
+
+    def count(self) -> int:
+        return self._connection().execute('SELECT COUNT(*) FROM certificates').fetchone()[0]
+
+    def set_artifact(self, cert_id: str, kind: str, status: str, error: str = None):
+        """Record an artifact as 'pending', 'ready' or 'failed'"""
+        self._connection().execute(
+            'INSERT OR REPLACE INTO artifacts VALUES (?, ?, ?, ?, ?)',
+            (cert_id, kind, status, error, time.time()))
+
+    def artifact_status(self, cert_id: str) -> Dict[str, Dict]:
+        """Status of each tracked artifact of a certificate, by kind"""
+        return {row['kind']: {'status': row['status'], 'error': row['error'],
+                              'updated': row['updated']}
+                for row in self._connection().execute(
+                    'SELECT * FROM artifacts WHERE cert_id = ?', (cert_id,))}
+
+    def pending_artifacts(self, limit: int = None) -> List[str]:
+        """Certificates with an artifact not rendered yet or failed, oldest first"""
+        query = """SELECT cert_id FROM artifacts WHERE status != 'ready'
+                   GROUP BY cert_id ORDER BY MIN(updated)"""
+        if limit:
+            query += f' LIMIT {int(limit)}'
+        return [row['cert_id'] for row in self._connection().execute(query)]
+
+    def rebuild(self, storage_path: Path, on_certificate: Callable = None) -> int:
+        """Recreate the index from every certificate JSON file under storage_path.
+
+        on_certificate(cert_data) is called for each certificate indexed.
+        """
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.execute('DELETE FROM certificates')
+            indexed = 0
+            for json_file in storage_path.rglob('*.json'):
+                try:
+                    with open(json_file, 'r') as f:
+                        cert_data = json.load(f)
+                    connection.execute(
+                        'INSERT OR REPLACE INTO certificates VALUES (?, ?, ?, ?, ?)',
+                        self._entry(cert_data, json_file))
+                    indexed += 1
+                except (OSError, ValueError, KeyError, TypeError, AttributeError):
+                    continue  # Not a certificate
+                if on_certificate:
+                    on_certificate(cert_data)
+            connection.execute('COMMIT')
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+        return indexed
+
+
+class StatisticsStore:
+    """Running totals for the verification portal, kept in SQLite.
+
+    Counters are bumped when certificates are issued and verified, so
+    reading them never touches the certificate store. Increments are
+    buffered in memory and written at most every flush_interval seconds,
+    by the next increment or by a background flusher thread, so other
+    processes (gunicorn workers) see them even when this one goes idle.
+    """
+
+    ISSUANCE_COUNTERS = ('certificates', 'devices_wiped', 'bytes_wiped')
+    FLUSHER_TICK = 0.5  # Seconds between the flusher's checks
+
+    # Stores still alive; one flusher thread per process and one atexit
+    # handler write them all
+    _open_stores = weakref.WeakSet()
+    _open_stores_lock = threading.Lock()
+    _atexit_registered = False
+    _flusher_pid = None  # Threads do not survive fork, so track the owner
+
+    def __init__(self, db_path: Path = None, flush_interval: float = 2.0):
+        self.db_path = db_path or Path.home() / '.ewaste_safe' / 'statistics.db'
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self._local = threading.local()  # One connection per thread
+        self._pending = {}  # (day, name) -> unflushed delta; day '' is all-time
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._connection().execute("""
+            CREATE TABLE IF NOT EXISTS counters (
+                day TEXT NOT NULL,
+                name TEXT NOT NULL,
+                value INTEGER NOT NULL,
+                PRIMARY KEY (day, name)
+            ) WITHOUT ROWID
+        """)
+        with self._open_stores_lock:
+            StatisticsStore._open_stores.add(self)
+            if not StatisticsStore._atexit_registered:
+                atexit.register(StatisticsStore._flush_all)
+                StatisticsStore._atexit_registered = True
+        self._start_flusher()
+
+    @classmethod
+    def _start_flusher(cls):
+        with cls._open_stores_lock:
+            if cls._flusher_pid == os.getpid():
+                return
+            cls._flusher_pid = os.getpid()
+        threading.Thread(target=cls._run_flusher, name='ewaste-stats-flush',
+                         daemon=True).start()
+
+    @classmethod
+    def _run_flusher(cls):
+        """Write every store's increments once they are flush_interval old"""
+        while True:
+            time.sleep(cls.FLUSHER_TICK)
+            with cls._open_stores_lock:
+                stores = list(cls._open_stores)
+            for store in stores:
+                with store._lock:
+                    due = store._pending and \
+                        time.monotonic() - store._last_flush >= store.flush_interval
+                if due:
+                    store.flush()
+
+    @classmethod
+    def _flush_all(cls):
+        with cls._open_stores_lock:
+            stores = list(cls._open_stores)
+        for store in stores:
+            store.flush()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(
+                str(self.db_path), timeout=30, isolation_level=None)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _today() -> str:
+        return datetime.now(timezone.utc).strftime('%Y-%m-%d')
+
+    def increment(self, name: str, amount: int = 1, daily: bool = False):
+        """Add to an all-time counter, and to today's as well if daily"""
+        with self._lock:
+            self._pending[('', name)] = self._pending.get(('', name), 0) + amount
+            if daily:
+                key = (self._today(), name)
+                self._pending[key] = self._pending.get(key, 0) + amount
+            due = time.monotonic() - self._last_flush >= self.flush_interval
+        if due:
+            self.flush()
+
+    def flush(self):
+        """Write buffered increments; they stay buffered if the write fails"""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        if not pending:
+            return
+        connection = self._connection()
+        try:
+            connection.execute('BEGIN IMMEDIATE')
+            try:
+                connection.executemany(
+                    """INSERT INTO counters (day, name, value) VALUES (?, ?, ?)
+                       ON CONFLICT (day, name) DO UPDATE SET value = value + excluded.value""",
+                    [(day, name, value) for (day, name), value in pending.items()])
+                connection.execute('COMMIT')
+            except Exception:
+                connection.execute('ROLLBACK')
+                raise
+        except sqlite3.Error as e:
+            print(f"⚠️ Could not save statistics: {e}")
+            # Put the increments back, merged with any made meanwhile
+            with self._lock:
+                for key, value in pending.items():
+                    self._pending[key] = self._pending.get(key, 0) + value
+
+    def record_certificate(self, cert_data: Dict):
+        """Count an issued certificate, its device and its method"""
+        device_info = cert_data.get('device_info', {})
+        wipe_details = cert_data.get('wipe_details') or device_info.get('wipe_details', {})
+        self.increment('certificates')
+        if wipe_details.get('success', True):
+            self.increment('devices_wiped')
+            self.increment('bytes_wiped', int(device_info.get('size_bytes') or 0))
+        self.increment(f"method:{wipe_details.get('method', 'unknown')}")
+        # Issuance is rare, so it is written straight away
+        self.flush()
+
+    def record_verification(self):
+        self.increment('verifications', daily=True)
+
+    def reset_issuance(self):
+        """Zero the certificate-derived counters before recounting the store"""
+        self.flush()
+        self._connection().execute(
+            "DELETE FROM counters WHERE day = '' AND (name IN (?, ?, ?) OR name LIKE 'method:%')",
+            self.ISSUANCE_COUNTERS)
+
+    def snapshot(self) -> Dict:
+        """Current totals, including increments not yet flushed"""
+        today = self._today()
+        totals, today_totals = {}, {}
+        for day, name, value in self._connection().execute(
+                "SELECT day, name, value FROM counters WHERE day IN ('', ?)", (today,)):
+            (totals if day == '' else today_totals)[name] = value
+        with self._lock:
+            for (day, name), value in self._pending.items():
+                if day == '':
+                    totals[name] = totals.get(name, 0) + value
+                elif day == today:
+                    today_totals[name] = today_totals.get(name, 0) + value
 
-    def __init__(self):
+        return {
+            'total_certificates': totals.get('certificates', 0),
+            'verified_today': today_totals.get('verifications', 0),
+            'verifications_total': totals.get('verifications', 0),
+            'devices_wiped': totals.get('devices_wiped', 0),
+            'bytes_wiped': totals.get('bytes_wiped', 0),
+            'data_wiped_tb': round(totals.get('bytes_wiped', 0) / 1e12, 1),
+            'methods': {name[len('method:'):]: value for name, value in sorted(totals.items())
+                        if name.startswith('method:')}
+        }
+
+
+class SigningService:
+    """Process-wide RSA-PSS signer that keeps the certificate key loaded.
+
+    Every CertificateManager in a process shares one instance per key file,
+    so the 4096-bit PEM key is parsed once. Signatures run on a small worker
+    pool, and sign_batch() signs a single Merkle root over many payloads so
+    each certificate in the batch only costs a hash and an inclusion proof.
+    """
+
+    MERKLE_ROOT_PREFIX = b'EWSAFE-MERKLE-ROOT:'
+    MERKLE_SCHEME = 'RSA-PSS-SHA256/MERKLE-SHA256'
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, key_path: Path, workers: Optional[int] = None):
+        self.key_path = key_path
         self.private_key = self._generate_or_load_key()
         self.public_key = self.private_key.public_key()
+        self._pid = os.getpid()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers or min(4, os.cpu_count() or 1),
+            thread_name_prefix='ewaste-signer')
+
+    @classmethod
+    def shared(cls, key_path: Optional[Path] = None) -> 'SigningService':
+        """Return the signer for a key file, loading the key on first use"""
+        key_path = Path(key_path or Path.home() / '.ewaste_safe' / 'master_key.pem')
+        with cls._instances_lock:
+            service = cls._instances.get(key_path)
+            # Pool threads do not survive fork (gunicorn workers, multiprocessing)
+            if service is None or service._pid != os.getpid():
+                service = cls._instances[key_path] = cls(key_path)
+            return service
+
+    def _generate_or_load_key(self):
+        """Generate or load existing private key"""
+        self.key_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self.key_path.exists():
+            try:
+                with open(self.key_path, 'rb') as f:
+                    return serialization.load_pem_private_key(
+                        f.read(), password=None, backend=default_backend()
+                    )
+            except:
+                pass
+
+        # Generate new key
+        private_key = rsa.generate_private_key(
+            public_exponent=65537,
+            key_size=4096,
+            backend=default_backend()
+        )
+
+        # Save key
+        pem = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        )
+
+        with open(self.key_path, 'wb') as f:
+            f.write(pem)
+
+        return private_key
+
+    def _sign(self, data: bytes) -> bytes:
+        return self.private_key.sign(
+            data,
+            padding.PSS(
+                mgf=padding.MGF1(hashes.SHA256()),
+                salt_length=padding.PSS.MAX_LENGTH
+            ),
+            hashes.SHA256()
+        )
+
+    def submit(self, data: bytes):
+        """Queue data for signing; returns a future resolving to the signature"""
+        return self._executor.submit(self._sign, data)
+
+    def sign(self, data: bytes) -> bytes:
+        """Sign data on the worker pool and wait for the signature"""
+        return self.submit(data).result()
+
+    @staticmethod
+    def leaf_hash(payload: bytes) -> bytes:
+        return hashlib.sha256(b'\x00' + payload).digest()
+
+    @staticmethod
+    def node_hash(left: bytes, right: bytes) -> bytes:
+        return hashlib.sha256(b'\x01' + left + right).digest()
+
+    def sign_batch(self, payloads: List[bytes]) -> Dict:
+        """Sign one Merkle root covering all payloads.
+
+        Returns the hex root, its signature and, per payload, the list of
+        ('L'|'R', sibling hash) steps leading from its leaf to the root. An
+        odd node at the end of a level is promoted unchanged.
+        """
+        if not payloads:
+            raise Exception("Nothing to sign")
+
+        level = [self.leaf_hash(payload) for payload in payloads]
+        positions = list(range(len(payloads)))
+        proofs = [[] for _ in payloads]
+
+        while len(level) > 1:
+            for leaf, position in enumerate(positions):
+                if position % 2:
+                    proofs[leaf].append(('L', level[position - 1].hex()))
+                elif position + 1 < len(level):
+                    proofs[leaf].append(('R', level[position + 1].hex()))
+            next_level = [self.node_hash(level[i], level[i + 1])
+                          for i in range(0, len(level) - 1, 2)]
+            if len(level) % 2:
+                next_level.append(level[-1])
+            level = next_level
+            positions = [position // 2 for position in positions]
+
+        root = level[0]
+        return {
+            'root': root.hex(),
+            'signature': self.sign(self.MERKLE_ROOT_PREFIX + root).hex(),
+            'proofs': proofs
+        }
+
+    @classmethod
+    def merkle_root(cls, payload: bytes, proof: List) -> bytes:
+        """Recompute the batch root from a payload and its inclusion proof"""
+        node = cls.leaf_hash(payload)
+        for side, sibling_hex in proof:
+            sibling = bytes.fromhex(sibling_hex)
+            node = cls.node_hash(sibling, node) if side == 'L' else cls.node_hash(node, sibling)
+        return node
+
+    def verify(self, signature: bytes, data: bytes) -> bool:
+        """Check a signature made by this service's key"""
+        try:
+            self.public_key.verify(
+                signature,
+                data,
+                padding.PSS(
+                    mgf=padding.MGF1(hashes.SHA256()),
+                    salt_length=padding.PSS.MAX_LENGTH
+                ),
+                hashes.SHA256()
+            )
+            return True
+        except Exception:
+            return False
+
+
+class TransparencyLog:
+    """Local append-only Merkle log of issued certificates.
+
+    Each certificate's content hash becomes a leaf of an RFC 6962-shaped
+    tree. A signed tree head is published every head_batch leaves or
+    head_interval seconds (or on demand), so one signature anchors
+    thousands of certificates, and an inclusion proof against a head is
+    checked with O(log n) hashes. Hashes of complete subtrees are stored
+    as leaves arrive, so roots and proofs never rehash the whole log.
+    """
+
+    TREE_HEAD_PREFIX = b'EWSAFE-TREE-HEAD:'
+
+    def __init__(self, db_path: Path, signer: SigningService,
+                 head_batch: int = 1000, head_interval: float = 300.0):
+        self.db_path = db_path
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.signer = signer
+        self.head_batch = head_batch
+        self.head_interval = head_interval
+        self.log_id = 'EWSAFE-LOG-' + hashlib.sha256(
+            signer.public_key.public_bytes(
+                encoding=serialization.Encoding.DER,
+                format=serialization.PublicFormat.SubjectPublicKeyInfo
+            )
+        ).hexdigest()[:16].upper()
+        self._local = threading.local()  # One connection per thread
+        self._connection().executescript("""
+            CREATE TABLE IF NOT EXISTS leaves (
+                leaf_index INTEGER PRIMARY KEY,
+                cert_id TEXT NOT NULL UNIQUE,
+                content_hash TEXT NOT NULL,
+                timestamp REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS nodes (
+                level INTEGER NOT NULL,
+                node_index INTEGER NOT NULL,
+                hash BLOB NOT NULL,
+                PRIMARY KEY (level, node_index)
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS tree_heads (
+                tree_size INTEGER PRIMARY KEY,
+                root TEXT NOT NULL,
+                timestamp REAL NOT NULL,
+                signature TEXT NOT NULL
+            );
+        """)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(
+                str(self.db_path), timeout=30, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def _tree_size(self, connection: sqlite3.Connection) -> int:
+        return connection.execute(
+            'SELECT COALESCE(MAX(leaf_index) + 1, 0) FROM leaves').fetchone()[0]
+
+    def _node(self, connection: sqlite3.Connection, level: int, node_index: int) -> bytes:
+        return connection.execute(
+            'SELECT hash FROM nodes WHERE level = ? AND node_index = ?',
+            (level, node_index)).fetchone()['hash']
+
+    def _subtree_hash(self, connection: sqlite3.Connection, start: int, size: int) -> bytes:
+        """Root of the leaves [start, start + size), from stored complete subtrees"""
+        if size & (size - 1) == 0:
+            return self._node(connection, size.bit_length() - 1, start // size)
+        split = 1 << ((size - 1).bit_length() - 1)  # Largest power of two below size
+        return SigningService.node_hash(self._subtree_hash(connection, start, split),
+                                        self._subtree_hash(connection, start + split, size - split))
+
+    def _audit_path(self, connection: sqlite3.Connection, leaf_index: int,
+                    start: int, size: int) -> List:
+        """Sibling hashes from a leaf up to the root of [start, start + size)"""
+        if size == 1:
+            return []
+        split = 1 << ((size - 1).bit_length() - 1)
+        if leaf_index < start + split:
+            return self._audit_path(connection, leaf_index, start, split) + \
+                [('R', self._subtree_hash(connection, start + split, size - split).hex())]
+        return self._audit_path(connection, leaf_index, start + split, size - split) + \
+            [('L', self._subtree_hash(connection, start, split).hex())]
+
+    def _tree_head_message(self, tree_size: int, root: bytes) -> bytes:
+        return self.TREE_HEAD_PREFIX + tree_size.to_bytes(8, 'big') + root
+
+    def append(self, cert_id: str, content_hash: str) -> int:
+        """Add a certificate's content hash to the log; returns its leaf index"""
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            row = connection.execute(
+                'SELECT leaf_index FROM leaves WHERE cert_id = ?', (cert_id,)).fetchone()
+            if row:
+                connection.execute('COMMIT')
+                return row['leaf_index']
+
+            leaf_index = self._tree_size(connection)
+            connection.execute('INSERT INTO leaves VALUES (?, ?, ?, ?)',
+                               (leaf_index, cert_id, content_hash, time.time()))
+            node = SigningService.leaf_hash(content_hash.encode())
+            level, node_index = 0, leaf_index
+            connection.execute('INSERT INTO nodes VALUES (?, ?, ?)', (level, node_index, node))
+            # Store every subtree this leaf completes
+            while node_index % 2:
+                node = SigningService.node_hash(
+                    self._node(connection, level, node_index - 1), node)
+                level, node_index = level + 1, node_index // 2
+                connection.execute('INSERT INTO nodes VALUES (?, ?, ?)', (level, node_index, node))
+            connection.execute('COMMIT')
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+
+        head = self.latest_tree_head()
+        if head is None or leaf_index + 1 - head['tree_size'] >= self.head_batch or \
+                time.time() - head['timestamp'] >= self.head_interval:
+            self.publish_tree_head()
+        return leaf_index
+
+    def latest_tree_head(self) -> Optional[Dict]:
+        row = self._connection().execute(
+            'SELECT * FROM tree_heads ORDER BY tree_size DESC LIMIT 1').fetchone()
+        return dict(row) if row else None
+
+    def publish_tree_head(self) -> Optional[Dict]:
+        """Sign the current tree, unless the latest head already covers it"""
+        connection = self._connection()
+        tree_size = self._tree_size(connection)
+        head = self.latest_tree_head()
+        if tree_size == 0 or (head and head['tree_size'] >= tree_size):
+            return head
+
+        root = self._subtree_hash(connection, 0, tree_size)
+        signature = self.signer.sign(self._tree_head_message(tree_size, root))
+        connection.execute('INSERT OR IGNORE INTO tree_heads VALUES (?, ?, ?, ?)',
+                           (tree_size, root.hex(), time.time(), signature.hex()))
+        return self.latest_tree_head()
+
+    def inclusion_proof(self, cert_id: str, publish: bool = True) -> Optional[Dict]:
+        """Proof that a certificate is in the latest signed tree head.
+
+        If no head covers the certificate yet, one is published first unless
+        publish is False. Returns None for certificates not in the log.
+        """
+        connection = self._connection()
+        row = connection.execute(
+            'SELECT leaf_index, content_hash FROM leaves WHERE cert_id = ?', (cert_id,)).fetchone()
+        if not row:
+            return None
+
+        head = self.latest_tree_head()
+        if publish and (head is None or head['tree_size'] <= row['leaf_index']):
+            head = self.publish_tree_head()
+        if head is None or head['tree_size'] <= row['leaf_index']:
+            return None
+
+        return {
+            'log_id': self.log_id,
+            'certificate_id': cert_id,
+            'leaf_index': row['leaf_index'],
+            'content_hash': row['content_hash'],
+            'tree_head': head,
+            'proof': self._audit_path(connection, row['leaf_index'], 0, head['tree_size'])
+        }
+
+    def verify_inclusion(self, content_hash: str, inclusion: Dict) -> bool:
+        """Check an inclusion proof and the signature on its tree head"""
+        head = inclusion['tree_head']
+        root = SigningService.merkle_root(content_hash.encode(), inclusion['proof'])
+        if root.hex() != head['root']:
+            return False
+        return self.signer.verify(bytes.fromhex(head['signature']),
+                                  self._tree_head_message(head['tree_size'], root))
+
+
+class PDFTemplate:
+    """Prebuilt ReportLab styles and fixed content for certificate PDFs and batch reports.
+
+    Documents only add their variable fields. A template lives for the life
+    of a thread rather than being shared, because flowables keep layout
+    state while a document is built.
+    """
+
+    # Stored QR code PNGs; qr_image() relies on whole pixels per module
+    QR_BOX_SIZE = 10  # Pixels per module
+    QR_BORDER = 5  # Quiet zone, in modules
+    PARAGRAPH_CACHE_SIZE = 256
+
+    _local = threading.local()
+
+    def __init__(self):
+        styles = getSampleStyleSheet()
+        self.paragraph_styles = {
+            'title': ParagraphStyle(
+                'CustomTitle',
+                parent=styles['Heading1'],
+                fontSize=24,
+                spaceAfter=30,
+                textColor=colors.HexColor('#1f4e79'),
+                alignment=1  # Center
+            ),
+            'heading': ParagraphStyle(
+                'CustomHeading',
+                parent=styles['Heading2'],
+                fontSize=14,
+                textColor=colors.HexColor('#2e75b5'),
+                spaceBefore=20,
+                spaceAfter=10
+            ),
+            'report_title': ParagraphStyle(
+                'Title', fontSize=20, alignment=1, spaceAfter=30),
+            'heading2': styles['Heading2'],
+            'normal': styles['Normal']
+        }
+
+        self.table_styles = {
+            'certificate': TableStyle([
+                ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e7f3ff')),
+                ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
+                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, -1), 10),
+                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cccccc'))
+            ]),
+            'device': TableStyle([
+                ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f8ff')),
+                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
+                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cccccc'))
+            ]),
+            'wipe': TableStyle([
+                ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f8f0')),
+                ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, -1), 9),
+                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cccccc'))
+            ]),
+            'report_summary': TableStyle([
+                ('BACKGROUND', (0, 0), (0, -1), colors.lightblue),
+                ('GRID', (0, 0), (-1, -1), 1, colors.black)
+            ]),
+            'report_rows': TableStyle([
+                ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, -1), 7),
+                ('LEADING', (0, 0), (-1, -1), 8),
+                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f4f4f4')]),
+                ('TOPPADDING', (0, 0), (-1, -1), 2),
+                ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.grey)
+            ])
+        }
+
+        self.certificate_header = [
+            Paragraph("🛡️ E-WASTE SAFE INDIA", self.paragraph_styles['title']),
+            Paragraph("SECURE DATA WIPING CERTIFICATE", self.paragraph_styles['heading2']),
+            Spacer(1, 20)
+        ]
+        footer_text = """
+        This certificate is digitally signed and tamper-proof. Any modification to this document
+        will invalidate the digital signature. For technical support, visit ewastesafe.in
+
+        Generated by E-Waste Safe India v2.0 - Making device recycling safe and trusted.
+        """
+        self.certificate_footer = [
+            Spacer(1, 20),
+            Paragraph(footer_text, self.paragraph_styles['normal'])
+        ]
+        self._paragraphs = OrderedDict()  # (text, style) -> Paragraph, least recently used first
+
+    @classmethod
+    def shared(cls) -> 'PDFTemplate':
+        """This thread's template, built on first use"""
+        template = getattr(cls._local, 'template', None)
+        if template is None:
+            template = cls._local.template = cls()
+        return template
+
+    @classmethod
+    def discard(cls):
+        """Drop this thread's template; the next document builds a new one"""
+        cls._local.template = None
+
+    def paragraph(self, text: str, style: str = 'normal') -> Paragraph:
+        """Paragraph for text, parsed once and reused while it keeps coming up"""
+        key = (text, style)
+        paragraph = self._paragraphs.get(key)
+        if paragraph is None:
+            paragraph = self._paragraphs[key] = Paragraph(text, self.paragraph_styles[style])
+            if len(self._paragraphs) > self.PARAGRAPH_CACHE_SIZE:
+                self._paragraphs.popitem(last=False)
+        else:
+            self._paragraphs.move_to_end(key)
+        return paragraph
+
+    def table(self, data: List, col_widths: List[float], style: str) -> Table:
+        table = Table(data, colWidths=col_widths)
+        table.setStyle(self.table_styles[style])
+        return table
+
+    def qr_image(self, qr_code_path: str, size: float) -> RLImage:
+        """QR code embedded at one pixel per module; the PDF viewer scales it up sharply"""
+        with Image.open(qr_code_path) as image:
+            modules = image.resize((image.width // self.QR_BOX_SIZE, image.height // self.QR_BOX_SIZE),
+                                   Image.NEAREST)
+        buffer = BytesIO()
+        modules.save(buffer, 'PNG')
+        buffer.seek(0)
+        return RLImage(buffer, width=size, height=size)
+
+
+class CertificateManager:
+    """Advanced tamper-proof certificate generation and management"""
+
+    # Fields added after signing, so not covered by the signature
+    POST_SIGNING_FIELDS = ('digital_signature', 'batch_signature', 'transparency_log',
+                           'pdf_path', 'json_path', 'qr_code_path', 'verification_url')
+
+    # Rendered files per certificate, in rendering order (the PDF embeds the QR code)
+    ARTIFACT_SUFFIXES = {'qr': '_qr.png', 'pdf': '_certificate.pdf'}
+    ARTIFACT_MODES = ('eager', 'background', 'on_demand')
+    RENDER_WORKERS = 4  # Processes rendering artifacts in 'background' mode
+
+    def __init__(self, artifact_mode: str = 'eager'):
+        """artifact_mode decides when the QR code and PDF are rendered: 'eager'
+        before generate_certificate returns, 'background' in a process pool,
+        or 'on_demand' when get_artifact() first asks for them."""
+        if artifact_mode not in self.ARTIFACT_MODES:
+            raise Exception(f"Unknown artifact mode: {artifact_mode}")
+        self.artifact_mode = artifact_mode
+        self._render_pool = None
+        self._render_pool_lock = threading.Lock()
+        self._render_futures = {}  # Cert ID -> background render still running
+        self._artifact_locks = weakref.WeakValueDictionary()  # Cert ID -> lock while in use
+        self.signer = SigningService.shared()
+        self.private_key = self.signer.private_key
+        self.public_key = self.signer.public_key
         self.cert_storage_path = Path.home() / '.ewaste_safe' / 'certificates'
         self.cert_storage_path.mkdir(parents=True, exist_ok=True)
 
-    def _generate_or_load_key(self):
-        """Generate or load existing private key"""
-        key_path = Path.home() / '.ewaste_safe' / 'master_key.pem'
-        key_path.parent.mkdir(parents=True, exist_ok=True)
+        index_path = Path.home() / '.ewaste_safe' / 'certificate_index.db'
+        statistics_path = Path.home() / '.ewaste_safe' / 'statistics.db'
+        index_is_new = not index_path.exists() or not statistics_path.exists()
+        self.cert_index = CertificateIndex(index_path)
+        self.statistics = StatisticsStore(statistics_path)
+        self.transparency_log = TransparencyLog(
+            Path.home() / '.ewaste_safe' / 'transparency_log.db', self.signer)
+        if index_is_new and next(self.cert_storage_path.rglob('*.json'), None):
+            print("🗂️ Indexing existing certificates (one-time)...")
+            self.rebuild_index()
+
+    def rebuild_index(self) -> int:
+        """Rebuild the certificate index, and recount the statistics, from the storage directory"""
+        self.statistics.reset_issuance()
+        indexed = self.cert_index.rebuild(
+            self.cert_storage_path, self.statistics.record_certificate)
+        self.statistics.flush()
+        return indexed
+
+    def certificate_dir(self, cert_id: str, create: bool = False) -> Path:
+        """Shard directory for a certificate's files: YYYY/MM/<2 hex chars>.
+
+        The month comes from the timestamp embedded in the certificate ID
+        and the last level from its random suffix, so the location follows
+        from the ID alone and no shard grows past a few hundred entries.
+        """
+        parts = cert_id.split('-')
+        try:
+            issued = datetime.fromtimestamp(int(parts[1], 16), timezone.utc)
+            shard = self.cert_storage_path / f"{issued:%Y}" / f"{issued:%m}" / parts[-1][:2].lower()
+        except (IndexError, ValueError, OverflowError, OSError):
+            # Not an EWSAFE-<hex time>-... ID
+            shard = self.cert_storage_path / 'other' / \
+                hashlib.sha256(cert_id.encode()).hexdigest()[:2]
+        if create:
+            shard.mkdir(parents=True, exist_ok=True)
+        return shard
+
+    def migrate_to_sharded_layout(self) -> int:
+        """Move certificates stored flat in the storage directory into their shards"""
+        suffixes = {'_qr.png': 'qr_code_path', '_certificate.pdf': 'pdf_path'}
+        moved_files = {}
+        certificates = []
+
+        with os.scandir(self.cert_storage_path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if entry.name.endswith('.json'):
+                    try:
+                        with open(entry.path, 'r') as f:
+                            cert_id = json.load(f).get('certificate_id')
+                    except (OSError, ValueError, AttributeError):
+                        continue
+                    if cert_id:
+                        certificates.append((cert_id, entry.path))
+                    continue
+                for suffix in suffixes:
+                    if entry.name.endswith(suffix):
+                        cert_id = entry.name[:-len(suffix)]
+                        target = self.certificate_dir(cert_id, create=True) / entry.name
+                        os.replace(entry.path, target)
+                        moved_files[entry.path] = str(target)
+
+        for cert_id, old_path in certificates:
+            with open(old_path, 'r') as f:
+                cert_data = json.load(f)
+            # Artifact paths are not covered by the signature, so they can be updated
+            for field in suffixes.values():
+                if cert_data.get(field) in moved_files:
+                    cert_data[field] = moved_files[cert_data[field]]
+
+            target = self.certificate_dir(cert_id, create=True) / Path(old_path).name
+            temp_path = target.with_suffix('.tmp')
+            with open(temp_path, 'w') as f:
+                json.dump(cert_data, f, indent=2)
+            os.replace(temp_path, target)
+            os.remove(old_path)
+            self.cert_index.add(cert_data, target)
+
+        return len(certificates)
+
+    def generate_certificate(self, wipe_log: Dict) -> Dict:
+        """Generate comprehensive tamper-proof certificate with blockchain-style verification"""
+        certificate_data = self._build_certificate_data(wipe_log)
+
+        # Create digital signature
+        signature = self._sign_certificate(certificate_data)
+        certificate_data['digital_signature'] = signature.hex()
 
-        if key_path.exists():
-            try:
-                with open(key_path, 'rb') as f:
-                    return serialization.load_pem_private_key(
-                        f.read(), password=None, backend=default_backend()
-                    )
-            except:
-                pass
+        return self._store_certificate(certificate_data)
 
-        # Generate new key
-        private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=4096,
-            backend=default_backend()
-        )
+    def generate_certificates(self, wipe_logs: List[Dict]) -> List[Dict]:
+        """Generate certificates for a batch of wipes under one signed Merkle root.
 
-        # Save key
-        pem = private_key.private_bytes(
-            encoding=serialization.Encoding.PEM,
-            format=serialization.PrivateFormat.PKCS8,
-            encryption_algorithm=serialization.NoEncryption()
-        )
+        Each certificate carries a batch_signature with the root signature
+        and its inclusion proof instead of an individual digital_signature.
+        """
+        if len(wipe_logs) == 1:
+            return [self.generate_certificate(wipe_logs[0])]
+        if not wipe_logs:
+            return []
 
-        with open(key_path, 'wb') as f:
-            f.write(pem)
+        certificates = [self._build_certificate_data(wipe_log) for wipe_log in wipe_logs]
+        batch = self.signer.sign_batch(
+            [self._canonical_payload(certificate_data) for certificate_data in certificates])
+
+        for leaf_index, certificate_data in enumerate(certificates):
+            certificate_data['batch_signature'] = {
+                'scheme': SigningService.MERKLE_SCHEME,
+                'root': batch['root'],
+                'signature': batch['signature'],
+                'leaf_index': leaf_index,
+                'batch_size': len(certificates),
+                'proof': batch['proofs'][leaf_index]
+            }
 
-        return private_key
+        return [self._store_certificate(certificate_data) for certificate_data in certificates]
 
-    def generate_certificate(self, wipe_log: Dict) -> Dict:
-        """Generate comprehensive tamper-proof certificate with blockchain-style verification"""
+    def _build_certificate_data(self, wipe_log: Dict) -> Dict:
+        """Build the signed body of a certificate, up to its content hash"""
 
         # Generate unique certificate ID with checksums
         timestamp_hex = hex(int(time.time()))[2:]
@@ -2368,7 +4748,10 @@ class CertificateManager:
                     'key_size': 2048,
                     'certificate_version': '2.1',
                     'tamper_detection': True,
-                    'blockchain_anchor': self._create_blockchain_anchor(),
+                    'transparency_log': {
+                        'log_id': self.transparency_log.log_id,
+                        'leaf': 'content_hash'
+                    },
                     'verification_url': f'https://verify.ewastesafe.in/cert/{cert_id}'
                 },
                 'geographic_info': {
@@ -2386,30 +4769,171 @@ class CertificateManager:
         content_hash = hashlib.sha256(content_json.encode()).hexdigest()
         certificate_data['content_hash'] = content_hash
 
-        # Create digital signature
-        signature = self._sign_certificate(certificate_data)
-        certificate_data['digital_signature'] = signature.hex()
+        return certificate_data
 
-        # Generate QR code for verification
-        qr_code_path = self._generate_qr_code(cert_id, content_hash)
-        certificate_data['qr_code_path'] = qr_code_path
+    def _store_certificate(self, certificate_data: Dict) -> Dict:
+        """Save and index a signed certificate, then render its QR code and PDF per artifact_mode"""
+        cert_id = certificate_data['certificate_id']
+        content_hash = certificate_data['content_hash']
 
-        # Generate PDF certificate
-        pdf_path = self._generate_pdf_certificate(certificate_data)
-        certificate_data['pdf_path'] = pdf_path
+        # The signed JSON is the proof; the QR code and PDF are rendered from it
+        certificate_data['qr_code_path'] = str(self.artifact_path(cert_id, 'qr'))
+        certificate_data['pdf_path'] = str(self.artifact_path(cert_id, 'pdf'))
+
+        # Anchor the certificate in the transparency log
+        certificate_data['transparency_log'] = {
+            'log_id': self.transparency_log.log_id,
+            'leaf_index': self.transparency_log.append(cert_id, content_hash)
+        }
 
         # Save JSON certificate
-        json_path = self.cert_storage_path / f"{cert_id}.json"
+        json_path = self.certificate_dir(cert_id, create=True) / f"{cert_id}.json"
         with open(json_path, 'w') as f:
             json.dump(certificate_data, f, indent=2)
         certificate_data['json_path'] = str(json_path)
+        self.cert_index.add(certificate_data, json_path)
+        self.statistics.record_certificate(certificate_data)
 
         # Create verification URL
         certificate_data[
             'verification_url'] = f"https://verify.ewastesafe.in/cert/{cert_id}"
 
+        if self.artifact_mode == 'eager':
+            self.render_artifacts(certificate_data)
+        else:
+            for kind in self.ARTIFACT_SUFFIXES:
+                self.cert_index.set_artifact(cert_id, kind, 'pending')
+            if self.artifact_mode == 'background':
+                future = self._submit_render(certificate_data)
+                self._render_futures[cert_id] = future
+                future.add_done_callback(lambda future: self._background_rendered(cert_id, future))
+
         return certificate_data
 
+    def artifact_path(self, cert_id: str, kind: str) -> Path:
+        """Where a certificate's QR code ('qr') or PDF ('pdf') is stored"""
+        return self.certificate_dir(cert_id) / f"{cert_id}{self.ARTIFACT_SUFFIXES[kind]}"
+
+    def _draw_artifacts(self, cert_data: Dict, kinds: List[str] = None) -> Dict:
+        """Render artifacts; returns kind -> error message, or None if it was written"""
+        outcome = {}
+        for kind in kinds or self.ARTIFACT_SUFFIXES:
+            try:
+                if kind == 'qr':
+                    self._generate_qr_code(cert_data['certificate_id'], cert_data['content_hash'])
+                else:
+                    self._generate_pdf_certificate(cert_data)
+                outcome[kind] = None
+            except Exception as e:
+                outcome[kind] = str(e)
+        return outcome
+
+    def _background_rendered(self, cert_id: str, future):
+        self._record_artifacts(cert_id, self._render_outcome(future))
+        self._render_futures.pop(cert_id, None)
+
+    def _artifact_lock(self, cert_id: str) -> threading.Lock:
+        """Lock serialising on-demand renders of one certificate in this process"""
+        with self._render_pool_lock:
+            lock = self._artifact_locks.get(cert_id)
+            if lock is None:
+                lock = self._artifact_locks[cert_id] = threading.Lock()
+            return lock
+
+    def _write_atomically(self, path: Path, write: Callable):
+        """Run write(temp_path) and move the result over path in one step.
+
+        Readers such as the verification server never see a half-written
+        file, and concurrent renders of the same artifact (this process, a
+        render pool worker) each complete their own temporary file.
+        """
+        path = Path(path)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}-{threading.get_ident()}.tmp")
+        try:
+            write(temp_path)
+            os.replace(temp_path, path)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+    def _record_artifacts(self, cert_id: str, outcome: Dict):
+        for kind, error in outcome.items():
+            if error:
+                print(f"⚠️ Could not render {kind} for {cert_id}: {error}")
+            self.cert_index.set_artifact(cert_id, kind, 'failed' if error else 'ready', error)
+
+    def render_artifacts(self, cert_data: Dict, kinds: List[str] = None) -> Dict:
+        """Render a certificate's artifacts in this process and record their status"""
+        outcome = self._draw_artifacts(cert_data, kinds)
+        self._record_artifacts(cert_data['certificate_id'], outcome)
+        return outcome
+
+    def _submit_render(self, cert_data: Dict):
+        """Queue a certificate on the render pool; the future resolves to its outcome"""
+        with self._render_pool_lock:
+            if self._render_pool is None:
+                self._render_pool = ProcessPoolExecutor(
+                    max_workers=min(self.RENDER_WORKERS, os.cpu_count() or 1),
+                    mp_context=_worker_process_context())
+            return self._render_pool.submit(_render_artifacts_worker, cert_data)
+
+    def _render_outcome(self, future) -> Dict:
+        error = future.exception()
+        if error is not None:
+            return {kind: f"Render worker failed: {error}" for kind in self.ARTIFACT_SUFFIXES}
+        return future.result()
+
+    def render_pending_artifacts(self, limit: int = None) -> Dict[str, int]:
+        """Render every pending or failed artifact on the render pool"""
+        futures = {}
+        for cert_id in self.cert_index.pending_artifacts(limit):
+            cert_data = self.load_certificate(cert_id)
+            if cert_data:
+                futures[cert_id] = self._submit_render(cert_data)
+
+        rendered = failed = 0
+        for cert_id, future in futures.items():
+            outcome = self._render_outcome(future)
+            self._record_artifacts(cert_id, outcome)
+            if any(outcome.values()):
+                failed += 1
+            else:
+                rendered += 1
+        return {'rendered': rendered, 'failed': failed}
+
+    def get_artifact(self, cert_id: str, kind: str) -> Optional[str]:
+        """Path of a certificate's QR code or PDF, rendering it first if it is not ready"""
+        cert_data = self.load_certificate(cert_id)
+        if cert_data is None:
+            return None
+
+        status = self.cert_index.artifact_status(cert_id)
+        field = 'qr_code_path' if kind == 'qr' else 'pdf_path'
+        # Certificates issued before status tracking only have their files
+        existing = cert_data.get(field)
+        if existing and os.path.exists(existing) and \
+                status.get(kind, {'status': 'ready'})['status'] == 'ready':
+            return existing
+
+        with self._artifact_lock(cert_id):
+            # A background render already under way is awaited, not repeated
+            future = self._render_futures.get(cert_id)
+            if future is not None:
+                outcome = self._render_outcome(future)
+                if outcome.get(kind) is None:
+                    return str(self.artifact_path(cert_id, kind))
+
+            # Another request may have rendered it while this one waited
+            if self.cert_index.artifact_status(cert_id).get(kind, {}).get('status') == 'ready' \
+                    and self.artifact_path(cert_id, kind).exists():
+                return str(self.artifact_path(cert_id, kind))
+
+            kinds = [kind]
+            if kind == 'pdf' and not self.artifact_path(cert_id, 'qr').exists():
+                kinds = ['qr', 'pdf']
+            outcome = self.render_artifacts(cert_data, kinds)
+            return None if outcome[kind] else str(self.artifact_path(cert_id, kind))
+
     def _create_enhanced_device_fingerprint(self, device_info: Dict) -> str:
         """Create enhanced device fingerprint with multiple characteristics"""
         components = [
@@ -2439,90 +4963,49 @@ class CertificateManager:
         fingerprint_data = f"{device_info.get('model', '')}{device_info.get('serial', '')}{device_info.get('size', 0)}"
         return hashlib.sha256(fingerprint_data.encode()).hexdigest()[:16].upper()
 
-    def _create_blockchain_anchor(self) -> Dict:
-        """Create blockchain anchor (simulated for demo)"""
-        return {
-            'network': 'Polygon Mumbai Testnet',
-            'contract_address': '0x742d35Cc6634C0532925a3b8D402aD4Ad27D0F3C',
-            'transaction_hash': f"0x{secrets.token_hex(32)}",
-            'block_number': secrets.randbelow(1000000) + 10000000,
-            'timestamp': int(time.time()),
-            'gas_used': secrets.randbelow(50000) + 21000,
-            'confirmation_blocks': 12
-        }
+    def _canonical_payload(self, cert_data: Dict) -> bytes:
+        """Canonical JSON of the signed certificate fields"""
+        cert_copy = {key: value for key, value in cert_data.items()
+                     if key not in self.POST_SIGNING_FIELDS}
+        return json.dumps(cert_copy, sort_keys=True,
+                          separators=(',', ':')).encode()
 
     def _sign_certificate(self, cert_data: Dict) -> bytes:
         """Create digital signature for certificate"""
-        # Remove signature field if it exists
-        cert_copy = dict(cert_data)
-        cert_copy.pop('digital_signature', None)
-
-        # Create canonical JSON
-        cert_json = json.dumps(cert_copy, sort_keys=True,
-                               separators=(',', ':'))
-
-        # Sign the data
-        signature = self.private_key.sign(
-            cert_json.encode(),
-            padding.PSS(
-                mgf=padding.MGF1(hashes.SHA256()),
-                salt_length=padding.PSS.MAX_LENGTH
-            ),
-            hashes.SHA256()
-        )
+        return self.signer.sign(self._canonical_payload(cert_data))
 
-        return signature
-
-    def _generate_qr_code(self, cert_id: str, content_hash: str) -> str:
+    def _generate_qr_code(self, cert_id: str, content_hash: str, qr_path: Path = None) -> str:
         """Generate QR code for certificate verification"""
         qr_data = f"https://verify.ewastesafe.in/cert/{cert_id}?hash={content_hash[:16]}"
 
-        qr = qrcode.QRCode(version=1, box_size=10, border=5)
+        qr = qrcode.QRCode(version=1, box_size=PDFTemplate.QR_BOX_SIZE,
+                           border=PDFTemplate.QR_BORDER)
         qr.add_data(qr_data)
         qr.make(fit=True)
 
         qr_image = qr.make_image(fill_color="black", back_color="white")
-        qr_path = self.cert_storage_path / f"{cert_id}_qr.png"
-        qr_image.save(qr_path)
+        qr_path = qr_path or self.certificate_dir(cert_id, create=True) / f"{cert_id}_qr.png"
+        self._write_atomically(qr_path, lambda temp_path: qr_image.save(temp_path, format='PNG'))
 
         return str(qr_path)
 
-    def _generate_pdf_certificate(self, cert_data: Dict) -> str:
+    def _generate_pdf_certificate(self, cert_data: Dict, pdf_path: Path = None) -> str:
         """Generate professional PDF certificate"""
-        pdf_path = self.cert_storage_path / \
+        pdf_path = pdf_path or self.certificate_dir(cert_data['certificate_id'], create=True) / \
             f"{cert_data['certificate_id']}_certificate.pdf"
 
-        doc = SimpleDocTemplate(str(pdf_path), pagesize=A4, rightMargin=72, leftMargin=72,
+        # Built in memory and written in one step, see _write_atomically
+        pdf_buffer = BytesIO()
+        doc = SimpleDocTemplate(pdf_buffer, pagesize=A4, rightMargin=72, leftMargin=72,
                                 topMargin=72, bottomMargin=18)
 
-        # Define styles
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=colors.HexColor('#1f4e79'),
-            alignment=1  # Center
-        )
-
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=14,
-            textColor=colors.HexColor('#2e75b5'),
-            spaceBefore=20,
-            spaceAfter=10
-        )
-
-        # Build PDF content
-        story = []
+        # Styles and fixed content come prebuilt from the template
+        template = PDFTemplate.shared()
+        wipe_details = cert_data['device_info']['wipe_details']
+        compliance = cert_data['device_info']['compliance']
 
         # Header
-        story.append(Paragraph("🛡️ E-WASTE SAFE INDIA", title_style))
-        story.append(
-            Paragraph("SECURE DATA WIPING CERTIFICATE", styles['Heading2']))
-        story.append(Spacer(1, 20))
+        story = list(template.certificate_header)
 
         # Certificate Info Table
         cert_info_data = [
@@ -2530,25 +5013,13 @@ class CertificateManager:
             ['Issue Date:', datetime.fromisoformat(cert_data['timestamp'].replace(
                 'Z', '+00:00')).strftime('%Y-%m-%d %H:%M:%S UTC')],
             ['Version:', cert_data['version']],
-            ['Status:', '✅ VERIFIED' if cert_data['wipe_details']
-                ['success'] else '❌ FAILED']
+            ['Status:', '✅ VERIFIED' if wipe_details['success'] else '❌ FAILED']
         ]
-
-        cert_table = Table(cert_info_data, colWidths=[2*inch, 4*inch])
-        cert_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#e7f3ff')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cccccc'))
-        ]))
-
-        story.append(cert_table)
+        story.append(template.table(cert_info_data, [2*inch, 4*inch], 'certificate'))
         story.append(Spacer(1, 20))
 
         # Device Information
-        story.append(Paragraph("Device Information", heading_style))
+        story.append(template.paragraph("Device Information", 'heading'))
         device_data = [
             ['Device Path:', cert_data['device_info']['device_path']],
             ['Model:', cert_data['device_info']['model']],
@@ -2557,118 +5028,123 @@ class CertificateManager:
             ['Serial Number:', cert_data['device_info']['serial_number']],
             ['Device Fingerprint:', cert_data['device_info']['fingerprint']]
         ]
-
-        device_table = Table(device_data, colWidths=[2*inch, 4*inch])
-        device_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f8ff')),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cccccc'))
-        ]))
-
-        story.append(device_table)
+        story.append(template.table(device_data, [2*inch, 4*inch], 'device'))
         story.append(Spacer(1, 15))
 
         # Wipe Details
-        story.append(Paragraph("Wipe Operation Details", heading_style))
+        story.append(template.paragraph("Wipe Operation Details", 'heading'))
         wipe_data = [
-            ['Method:', cert_data['wipe_details']['method']],
+            ['Method:', wipe_details['method']],
             ['Passes Completed:',
-                f"{cert_data['wipe_details']['passes_completed']}/{cert_data['wipe_details']['total_passes']}"],
+                f"{wipe_details['passes_completed']}/{wipe_details['total_passes']}"],
             ['Duration:',
-                f"{cert_data['wipe_details']['duration_seconds']:.1f} seconds"],
-            ['Verification:', '✅ PASSED' if cert_data['wipe_details']
-                ['verification_passed'] else '❌ FAILED'],
-            ['Start Time:', cert_data['wipe_details']['start_time']],
-            ['End Time:', cert_data['wipe_details'].get('end_time', 'N/A')]
+                f"{wipe_details['duration_seconds']:.1f} seconds"],
+            ['Verification:', '✅ PASSED' if wipe_details['verification_passed'] else '❌ FAILED'],
+            ['Start Time:', wipe_details['start_time']],
+            ['End Time:', wipe_details.get('end_time') or 'N/A']
         ]
-
-        wipe_table = Table(wipe_data, colWidths=[2*inch, 4*inch])
-        wipe_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.HexColor('#f0f8f0')),
-            ('FONTNAME', (0, 0), (0, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#cccccc'))
-        ]))
-
-        story.append(wipe_table)
+        story.append(template.table(wipe_data, [2*inch, 4*inch], 'wipe'))
         story.append(Spacer(1, 15))
 
-        # Compliance Information
-        story.append(Paragraph("Compliance & Standards", heading_style))
+        # Compliance Information - the same for nearly every certificate
+        story.append(template.paragraph("Compliance & Standards", 'heading'))
         compliance_text = f"""
         This secure data wiping operation complies with the following standards:
-        • {' • '.join(cert_data['compliance']['standards'])}
+        • {' • '.join(compliance['standards'])}
         • Indian IT Rules 2021 & E-Waste Management Rules 2016
 
-        Security Level: {cert_data['compliance']['security_level']}
-        Verification Method: {cert_data['compliance']['verification_method']}
+        Security Level: {compliance['security_level']}
+        Verification Method: {compliance['verification_method']}
         """
-        story.append(Paragraph(compliance_text, styles['Normal']))
+        story.append(template.paragraph(compliance_text))
         story.append(Spacer(1, 15))
 
         # Verification Information
-        story.append(Paragraph("Certificate Verification", heading_style))
+        story.append(template.paragraph("Certificate Verification", 'heading'))
         verification_text = f"""
         Content Hash: {cert_data['content_hash']}
 
         Verify this certificate online at: {cert_data.get('verification_url', 'N/A')}
         Or scan the QR code below.
 
-        Digital Signature (SHA-256): {cert_data['digital_signature'][:64]}...
+        Digital Signature (SHA-256): {(cert_data.get('digital_signature') or cert_data['batch_signature']['signature'])[:64]}...
         """
-        story.append(Paragraph(verification_text, styles['Normal']))
+        story.append(Paragraph(verification_text, template.paragraph_styles['normal']))
 
         # Add QR code if available
         if 'qr_code_path' in cert_data and os.path.exists(cert_data['qr_code_path']):
             try:
-                qr_img = RLImage(
-                    cert_data['qr_code_path'], width=1.5*inch, height=1.5*inch)
+                qr_img = template.qr_image(cert_data['qr_code_path'], 1.5*inch)
                 story.append(Spacer(1, 10))
                 story.append(qr_img)
             except:
                 pass
 
         # Footer
-        story.append(Spacer(1, 20))
-        footer_text = """
-        This certificate is digitally signed and tamper-proof. Any modification to this document
-        will invalidate the digital signature. For technical support, visit ewastesafe.in
-
-        Generated by E-Waste Safe India v2.0 - Making device recycling safe and trusted.
-        """
-        story.append(Paragraph(footer_text, styles['Normal']))
+        story.extend(template.certificate_footer)
 
         # Build PDF
         doc.build(story)
+        self._write_atomically(pdf_path, lambda temp_path: temp_path.write_bytes(pdf_buffer.getvalue()))
         return str(pdf_path)
 
+    def benchmark_pdf_rendering(self, count: int = 50) -> Dict:
+        """Measure certificate PDFs per second with the template rebuilt for every document and cached"""
+        import tempfile
+
+        wipe_log = {
+            'device': '/dev/benchmark',
+            'device_info': {'model': 'Benchmark Drive', 'serial': 'BENCH0001',
+                            'size': 500 * 1024**3, 'type': 'SSD', 'interface': 'SATA'},
+            'method': 'nist_purge', 'start_time': datetime.now(timezone.utc).isoformat(),
+            'end_time': datetime.now(timezone.utc).isoformat(), 'duration_seconds': 1800.0,
+            'passes_completed': 1, 'total_passes': 1, 'verification_passed': True,
+            'success': True, 'platform': platform.system()
+        }
+        cert_data = self._build_certificate_data(wipe_log)
+        cert_data['digital_signature'] = '00' * 512
+
+        results = {'count': count, 'certificates_per_s': {}}
+        with tempfile.TemporaryDirectory() as work_dir:
+            work_dir = Path(work_dir)
+            cert_data['qr_code_path'] = self._generate_qr_code(
+                cert_data['certificate_id'], cert_data['content_hash'], work_dir / 'qr.png')
+            for name in ('uncached', 'cached'):
+                self._generate_pdf_certificate(cert_data, work_dir / f'{name}.pdf')  # Warm up
+                start = time.perf_counter()
+                for _ in range(count):
+                    if name == 'uncached':
+                        PDFTemplate.discard()
+                    self._generate_pdf_certificate(cert_data, work_dir / f'{name}.pdf')
+                results['certificates_per_s'][name] = count / (time.perf_counter() - start)
+            results['pdf_bytes'] = (work_dir / 'cached.pdf').stat().st_size
+        return results
+
     def verify_certificate(self, cert_data: Dict) -> bool:
         """Verify certificate authenticity"""
         try:
-            # Extract signature and remove it from data
+            # Recreate canonical JSON without the post-signing fields
+            payload = self._canonical_payload(cert_data)
+
             signature_hex = cert_data.get('digital_signature')
-            if not signature_hex:
+            batch = cert_data.get('batch_signature')
+            if signature_hex:
+                signature = bytes.fromhex(signature_hex)
+            elif batch:
+                # Batch-signed: the proof must lead to the signed Merkle root
+                root = SigningService.merkle_root(payload, batch['proof'])
+                if root.hex() != batch['root']:
+                    print("Certificate verification failed: not part of the signed batch")
+                    return False
+                signature = bytes.fromhex(batch['signature'])
+                payload = SigningService.MERKLE_ROOT_PREFIX + root
+            else:
                 return False
 
-            signature = bytes.fromhex(signature_hex)
-
-            # Remove signature and other post-signing fields
-            cert_copy = dict(cert_data)
-            cert_copy.pop('digital_signature', None)
-            cert_copy.pop('pdf_path', None)
-            cert_copy.pop('json_path', None)
-            cert_copy.pop('qr_code_path', None)
-            cert_copy.pop('verification_url', None)
-
-            # Recreate canonical JSON
-            cert_json = json.dumps(
-                cert_copy, sort_keys=True, separators=(',', ':'))
-
             # Verify signature
             self.public_key.verify(
                 signature,
-                cert_json.encode(),
+                payload,
                 padding.PSS(
                     mgf=padding.MGF1(hashes.SHA256()),
                     salt_length=padding.PSS.MAX_LENGTH
@@ -2682,38 +5158,55 @@ class CertificateManager:
             print(f"Certificate verification failed: {e}")
             return False
 
+    def verify_log_inclusion(self, cert_data: Dict) -> bool:
+        """Check that a certificate's content hash is in a signed transparency log tree head"""
+        inclusion = self.transparency_log.inclusion_proof(cert_data.get('certificate_id'))
+        if inclusion is None or inclusion['content_hash'] != cert_data.get('content_hash'):
+            return False
+        return self.transparency_log.verify_inclusion(cert_data['content_hash'], inclusion)
+
+    def find_certificate_path(self, cert_id: str) -> Optional[Path]:
+        """Locate a certificate's JSON file without reading it"""
+        # Its shard or the legacy flat layout, then alternative naming patterns
+        for json_path in (self.certificate_dir(cert_id) / f"{cert_id}.json",
+                          self.cert_storage_path / f"{cert_id}.json",
+                          self.cert_storage_path / f"{cert_id}_certificate.json",
+                          self.cert_storage_path / f"EWSAFE-{cert_id}.json"):
+            if json_path.exists():
+                return json_path
+
+        # Otherwise the index knows where it is stored, if anywhere
+        indexed_path = self.cert_index.lookup(cert_id)
+        if indexed_path is not None:
+            if indexed_path.exists():
+                return indexed_path
+            self.cert_index.remove(cert_id)  # Stale entry
+        return None
+
     def load_certificate(self, cert_id: str) -> Dict:
         """Load certificate from storage by ID"""
         try:
-            # Try loading from JSON file
-            json_path = self.cert_storage_path / f"{cert_id}.json"
-            if json_path.exists():
-                with open(json_path, 'r') as f:
-                    return json.load(f)
-
-            # Try alternative naming patterns
-            for pattern in [f"{cert_id}_certificate.json", f"EWSAFE-{cert_id}.json"]:
-                alt_path = self.cert_storage_path / pattern
-                if alt_path.exists():
-                    with open(alt_path, 'r') as f:
-                        return json.load(f)
-
-            # Search through all certificates if exact match not found
-            for json_file in self.cert_storage_path.glob("*.json"):
-                try:
-                    with open(json_file, 'r') as f:
-                        cert_data = json.load(f)
-                        if cert_data.get('certificate_id') == cert_id:
-                            return cert_data
-                except Exception:
-                    continue
-
-            return None
+            json_path = self.find_certificate_path(cert_id)
+            if json_path is None:
+                return None
+            with open(json_path, 'r') as f:
+                return json.load(f)
 
         except Exception as e:
             print(f"Failed to load certificate {cert_id}: {e}")
             return None
 
+
+_render_worker_manager = None  # CertificateManager of a render pool process
+
+
+def _render_artifacts_worker(cert_data: Dict) -> Dict:
+    """Render pool process body: draw one certificate's QR code and PDF"""
+    global _render_worker_manager
+    if _render_worker_manager is None:
+        _render_worker_manager = CertificateManager()
+    return _render_worker_manager._draw_artifacts(cert_data)
+
 # ============================================================================
 # BOOTABLE ENVIRONMENT CREATOR
 # ============================================================================
@@ -3285,6 +5778,7 @@ class EWasteSafeGUI:
             return
 
         self.wipe_engine = SecureWipeEngine()
+        self.wipe_supervisor = WipeSupervisor()
         self.cert_manager = CertificateManager()
         self.bootable_creator = BootableCreator()
 
@@ -3898,6 +6392,16 @@ exit'''
         if not self.confirm_wipe():
             return
 
+        # Offer to continue an interrupted wipe of this device
+        self.resume_wipe = False
+        journal_state = self.wipe_engine.journal.load(self.selected_device)
+        if journal_state and journal_state.get('method') == self.method_var.get():
+            self.resume_wipe = tk.messagebox.askyesno(
+                "Resume Interrupted Wipe",
+                f"An interrupted {journal_state['method'].upper()} wipe of this device "
+                f"stopped at pass {journal_state['pass']}, offset {journal_state['offset']:,}.\n\n"
+                "Resume from there? Choose No to start over.")
+
         self.wipe_in_progress = True
         self.wipe_btn.config(
             state='disabled', text="⏳ WIPING IN PROGRESS...", bg='#ffc107')
@@ -4194,11 +6698,15 @@ This is your final confirmation before data destruction."""
             self.log_message(
                 f"🚨 Starting {method.upper()} wipe on {device_path}")
 
-            # Pass the complete device info dictionary instead of just the path
-            result = self.wipe_engine.wipe_device(
+            # Pass the complete device info dictionary instead of just the path.
+            # The wipe runs in a supervised worker process so a hung drive
+            # cannot freeze the GUI
+            result = self.wipe_supervisor.run(
+                self.wipe_engine,
                 self.selected_device,  # Pass the full device info dict
                 method,
-                progress_callback=progress_callback
+                progress_callback=progress_callback,
+                resume=getattr(self, 'resume_wipe', False)
             )
 
             if result['success']:
@@ -4815,7 +7323,7 @@ Perfect for situations where you need to wipe devices without installing softwar
                         variable=self.store_on_device_var).pack(anchor='w', pady=2)
 
         self.blockchain_anchor_var = tk.BooleanVar(value=True)
-        ttk.Checkbutton(security_frame, text="Create blockchain anchors",
+        ttk.Checkbutton(security_frame, text="Record certificates in transparency log",
                         variable=self.blockchain_anchor_var).pack(anchor='w', pady=2)
 
         # Advanced Settings
@@ -5173,7 +7681,7 @@ Wipe Details:
 
 Security:
 • Content Hash: {cert_data.get('content_hash', 'Unknown')[:32]}...
-• Blockchain Anchor: {cert_data.get('blockchain_anchor', {}).get('transaction_hash', 'Unknown')[:16]}...
+• Transparency Log: leaf #{cert_data.get('transparency_log', {}).get('leaf_index', 'Unknown')}
 • Standards: {', '.join(cert_data.get('compliance', {}).get('standards', []))}
 
 """
@@ -5394,6 +7902,16 @@ class CLIInterface:
         """Run CLI commands"""
         import argparse
 
+        def report_formats(value: str) -> List[str]:
+            formats = list(dict.fromkeys(
+                fmt.strip().lower() for fmt in value.split(',') if fmt.strip()))
+            unknown = [fmt for fmt in formats if fmt not in EnterpriseWipeManager.REPORT_FORMATS]
+            if unknown or not formats:
+                raise argparse.ArgumentTypeError(
+                    f"unsupported format {', '.join(unknown) or '(none)'}; "
+                    f"choose from {', '.join(EnterpriseWipeManager.REPORT_FORMATS)}")
+            return formats
+
         parser = argparse.ArgumentParser(
             description="E-Waste Safe - Secure Data Wiping Tool")
         parser.add_argument('--gui', action='store_true',
@@ -5410,6 +7928,38 @@ class CLIInterface:
         parser.add_argument('--create-usb', help='Create bootable USB drive')
         parser.add_argument('--batch', nargs='+',
                             help='Batch wipe multiple devices')
+        parser.add_argument('--queue-depth', type=int, default=8,
+                            help='Outstanding writes per overwrite pass (Linux)')
+        parser.add_argument('--interleave', action='store_true',
+                            help='Apply all passes region by region (multi-pass methods on HDDs, Linux)')
+        parser.add_argument('--region-size', type=int, default=256,
+                            help='Region size in MB for --interleave')
+        parser.add_argument('--resume', action='store_true',
+                            help='Continue an interrupted wipe from its journal')
+        parser.add_argument('--verify-mode', default='sample', choices=['sample', 'full'],
+                            help='Sample the device or read back every byte after wiping (Linux)')
+        parser.add_argument('--benchmark-heuristics', action='store_true',
+                            help='Measure verification heuristic throughput and exit')
+        parser.add_argument('--benchmark-pdf', action='store_true',
+                            help='Measure certificate PDF rendering throughput and exit')
+        parser.add_argument('--rebuild-cert-index', action='store_true',
+                            help='Rebuild the certificate index from the certificate directory')
+        parser.add_argument('--migrate-cert-layout', action='store_true',
+                            help='Move flat-stored certificates into the sharded directory layout')
+        parser.add_argument('--batch-report', nargs='?', const='', metavar='BATCH_ID',
+                            help='Write a report of finished wipe jobs, for one batch or all')
+        parser.add_argument('--report-formats', type=report_formats, default='pdf',
+                            help='Comma-separated --batch-report formats: pdf, csv, ndjson')
+        parser.add_argument('--render-artifacts', action='store_true',
+                            help='Render certificate PDFs and QR codes that are pending or failed')
+        parser.add_argument('--publish-tree-head', action='store_true',
+                            help='Sign a transparency log tree head covering every certificate')
+        parser.add_argument('--load-test', metavar='URL',
+                            help='Load test a verification server with certificates from the local store')
+        parser.add_argument('--concurrency', type=int, default=32,
+                            help='Concurrent clients for --load-test')
+        parser.add_argument('--duration', type=float, default=10.0,
+                            help='Seconds to run --load-test')
 
         parsed_args = parser.parse_args(args)
 
@@ -5434,6 +7984,86 @@ class CLIInterface:
                 print()
             return
 
+        if parsed_args.benchmark_heuristics:
+            benchmark = self.wipe_engine.benchmark_verification_heuristics()
+            print(
+                f"\nVerification heuristics ({benchmark['buffer_size']:,}-byte buffers, "
+                f"NumPy {'enabled' if benchmark['numpy'] else 'not installed'}):")
+            print(f"  {'Buffer':<20} {'Heuristics':>12} {'Full check':>12}")
+            for name, row in benchmark['gb_per_s'].items():
+                print(
+                    f"  {name:<20} {row['heuristics']:>9.2f} GB/s {row['full_check']:>7.2f} GB/s")
+            return
+
+        if parsed_args.benchmark_pdf:
+            benchmark = self.cert_manager.benchmark_pdf_rendering()
+            print(f"\nCertificate PDF rendering ({benchmark['count']} documents, "
+                  f"{benchmark['pdf_bytes']:,} bytes each):")
+            for name, rate in benchmark['certificates_per_s'].items():
+                print(f"  {name:<10} {rate:>8.1f} certificates/s")
+            return
+
+        if parsed_args.rebuild_cert_index:
+            start = time.time()
+            indexed = self.cert_manager.rebuild_index()
+            print(
+                f"🗂️ Indexed {indexed:,} certificates from {self.cert_manager.cert_storage_path} "
+                f"in {time.time() - start:.1f}s")
+            return
+
+        if parsed_args.batch_report is not None:
+            start = time.time()
+            formats = parsed_args.report_formats
+            report_path = Path(EnterpriseWipeManager().generate_batch_report(
+                batch_id=parsed_args.batch_report or None, formats=formats))
+            print(f"📊 Batch report written in {time.time() - start:.1f}s:")
+            # Every format is written beside the first under the same report ID
+            for fmt in formats:
+                print(f"  {fmt:<7} {report_path.with_suffix('.' + fmt)}")
+            return
+
+        if parsed_args.render_artifacts:
+            start = time.time()
+            counts = self.cert_manager.render_pending_artifacts()
+            print(
+                f"🖨️ Rendered artifacts for {counts['rendered']:,} certificates "
+                f"({counts['failed']:,} failed) in {time.time() - start:.1f}s")
+            return
+
+        if parsed_args.publish_tree_head:
+            head = self.cert_manager.transparency_log.publish_tree_head()
+            if head is None:
+                print("Transparency log is empty")
+                return
+            print(f"🌳 Tree head for {head['tree_size']:,} certificates: {head['root']}")
+            return
+
+        if parsed_args.load_test:
+            cert_ids = [entry['cert_id']
+                        for entry in self.cert_manager.cert_index.find(limit=1000)]
+            if not cert_ids:
+                print("No certificates in the local store to verify")
+                return
+            print(
+                f"🔥 Load testing {parsed_args.load_test} with {parsed_args.concurrency} clients "
+                f"for {parsed_args.duration:.0f}s ({len(cert_ids)} certificates)")
+            report = OnlineVerificationService().load_test(
+                parsed_args.load_test, cert_ids, parsed_args.concurrency, parsed_args.duration)
+            print(f"  Requests: {report['requests']:,} ({report['errors']:,} errors)")
+            print(f"  Throughput: {report['requests_per_second']:,.1f} requests/sec")
+            print(
+                f"  Latency: p50 {report['latency_ms']['p50']} ms, "
+                f"p95 {report['latency_ms']['p95']} ms, p99 {report['latency_ms']['p99']} ms")
+            return
+
+        if parsed_args.migrate_cert_layout:
+            start = time.time()
+            migrated = self.cert_manager.migrate_to_sharded_layout()
+            print(
+                f"🗂️ Moved {migrated:,} certificates into shards under "
+                f"{self.cert_manager.cert_storage_path} in {time.time() - start:.1f}s")
+            return
+
         if parsed_args.verify_cert:
             try:
                 with open(parsed_args.verify_cert, 'r') as f:
@@ -5476,14 +8106,36 @@ class CLIInterface:
             def progress_callback(progress, message):
                 print(f"\r{message} [{progress:.1f}%]", end='', flush=True)
 
+            journal_state = self.wipe_engine.journal.load(device_info)
+            if journal_state and not parsed_args.resume:
+                print(
+                    f"Note: an interrupted {journal_state['method']} wipe stopped at pass "
+                    f"{journal_state['pass']}; use --resume to continue it")
+
             print(f"\nStarting secure wipe with method: {parsed_args.method}")
+            self.wipe_engine.write_queue_depth = parsed_args.queue_depth
+            self.wipe_engine.interleave_passes = parsed_args.interleave
+            self.wipe_engine.interleave_region_size = parsed_args.region_size * 1024 * 1024
+            self.wipe_engine.verification_mode = parsed_args.verify_mode
             result = self.wipe_engine.wipe_device(
-                device_info, parsed_args.method, progress_callback)
+                device_info, parsed_args.method, progress_callback,
+                resume=parsed_args.resume)
 
             print(
                 f"\n\nWipe completed: {'SUCCESS' if result['success'] else 'FAILED'}")
             print(
                 f"Verification: {'PASSED' if result['verification_passed'] else 'FAILED'}")
+            verification = result.get('verification')
+            if verification:
+                print(
+                    f"  Read back {verification['bytes_verified']:,} bytes at "
+                    f"{verification['throughput_mb_s']:.1f} MB/s")
+                for offset in verification['first_mismatches']:
+                    print(f"  Mismatch at offset {offset:,}")
+            for pass_stats in result.get('pass_stats', []):
+                print(
+                    f"  Pass {pass_stats['pass']}: {pass_stats['throughput_mb_s']:.1f} MB/s "
+                    f"({pass_stats['io_mode']}, queue depth {pass_stats['queue_depth']})")
 
             if result['success']:
                 # Generate certificate
@@ -5499,16 +8151,120 @@ class CLIInterface:
 # ============================================================================
 
 
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after ttl seconds"""
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()  # Key -> (stored_at, value), oldest first
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            if time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+
+class VerificationCache:
+    """Memoizes certificate loads and signature checks for the verification server.
+
+    Loaded certificates are keyed by (cert_id, path, file mtime) and
+    verification outcomes by (cert_id, content_hash, file mtime), so a
+    rewritten or replaced file is never served from a stale entry.
+    """
+
+    def __init__(self, cert_manager: 'CertificateManager', max_entries: int = 10000,
+                 ttl: float = 300.0):
+        self.cert_manager = cert_manager
+        self.certificates = TTLCache(max_entries, ttl)
+        self.verifications = TTLCache(max_entries, ttl)
+
+    def verify(self, cert_id: str):
+        """Return (cert_data, is_valid); cert_data is None if the certificate is unknown"""
+        json_path = self.cert_manager.find_certificate_path(cert_id)
+        if json_path is None:
+            return None, False
+        try:
+            mtime = json_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None, False
+
+        cert_key = (cert_id, str(json_path), mtime)
+        cert_data = self.certificates.get(cert_key)
+        if cert_data is None:
+            with open(json_path, 'r') as f:
+                cert_data = json.load(f)
+            self.certificates.put(cert_key, cert_data)
+
+        self.cert_manager.statistics.record_verification()
+        verification_key = (cert_id, cert_data.get('content_hash'), mtime)
+        is_valid = self.verifications.get(verification_key)
+        if is_valid is None:
+            is_valid = self.cert_manager.verify_certificate(cert_data)
+            self.verifications.put(verification_key, is_valid)
+
+        return cert_data, is_valid
+
+    def stats(self) -> Dict:
+        return {'certificates': self.certificates.stats(),
+                'verifications': self.verifications.stats()}
+
+
 class OnlineVerificationService:
     """Web service for certificate verification (Flask-based)"""
 
+    MAX_BATCH_SIZE = 10000  # Certificate IDs per /api/verify/batch request
+    BATCH_WORKERS = 8  # Verification threads shared by all batch requests
+
     def __init__(self):
         try:
-            from flask import Flask, request, jsonify, render_template_string
+            from flask import Flask, Response, request, jsonify, render_template_string, \
+                stream_with_context, send_file
             self.flask = Flask
+            self.response = Response
             self.request = request
             self.jsonify = jsonify
             self.render_template_string = render_template_string
+            self.stream_with_context = stream_with_context
+            self.send_file = send_file
             self.available = True
         except ImportError:
             print("Flask not available - online verification service disabled")
@@ -5521,6 +8277,9 @@ class OnlineVerificationService:
 
         app = self.flask(__name__)
         cert_manager = CertificateManager()
+        self.verification_cache = VerificationCache(cert_manager)
+        batch_executor = ThreadPoolExecutor(
+            max_workers=self.BATCH_WORKERS, thread_name_prefix='ewaste-verify')
 
         # HTML template for verification page
         verification_template = """
@@ -5768,7 +8527,7 @@ class OnlineVerificationService:
             <div class="alert alert-info">
                 <strong>🔒 How Verification Works:</strong><br>
                 Our verification system uses RSA-2048 digital signatures and SHA-256 hashing to ensure certificate authenticity.
-                Each certificate includes blockchain anchors and tamper-detection mechanisms. All certificates are stored in
+                Each certificate is recorded in a signed Merkle transparency log and carries tamper-detection mechanisms. All certificates are stored in
                 our secure database and can be independently verified by government auditors.
             </div>
             {% endif %}
@@ -5794,13 +8553,7 @@ class OnlineVerificationService:
 
         @app.route('/')
         def index():
-            # Mock statistics for demo
-            stats = {
-                'total_certificates': 15247,
-                'verified_today': 89,
-                'devices_wiped': 12893,
-                'data_wiped_tb': 2847
-            }
+            stats = cert_manager.statistics.snapshot()
             return self.render_template_string(verification_template, result=None, stats=stats)
 
         @app.route('/verify', methods=['POST'])
@@ -5812,10 +8565,8 @@ class OnlineVerificationService:
 
             # Try to load and verify certificate
             try:
-                cert_data = cert_manager.load_certificate(cert_id)
+                cert_data, is_valid = self.verification_cache.verify(cert_id)
                 if cert_data:
-                    is_valid = cert_manager.verify_certificate(cert_data)
-
                     result = {
                         'valid': is_valid,
                         'certificate_id': cert_data.get('certificate_id', 'Unknown'),
@@ -5825,7 +8576,8 @@ class OnlineVerificationService:
                         'wipe_method': cert_data.get('wipe_details', {}).get('method', 'Unknown'),
                         'standards': cert_data.get('compliance', {}).get('standards', []),
                         'verification_passed': cert_data.get('wipe_details', {}).get('verification_passed', False),
-                        'signature_preview': cert_data.get('digital_signature', '')[:32]
+                        'signature_preview': (cert_data.get('digital_signature') or
+                                              cert_data.get('batch_signature', {}).get('signature', ''))[:32]
                     }
                 else:
                     result = {'valid': False, 'error': 'Certificate not found'}
@@ -5840,9 +8592,8 @@ class OnlineVerificationService:
         def api_verify(cert_id):
             """JSON API endpoint for programmatic verification"""
             try:
-                cert_data = cert_manager.load_certificate(cert_id)
+                cert_data, is_valid = self.verification_cache.verify(cert_id)
                 if cert_data:
-                    is_valid = cert_manager.verify_certificate(cert_data)
                     return self.jsonify({
                         'valid': is_valid,
                         'certificate_id': cert_id,
@@ -5856,20 +8607,228 @@ class OnlineVerificationService:
             except Exception as e:
                 return self.jsonify({'valid': False, 'error': str(e)}), 500
 
+        @app.route('/api/verify/batch', methods=['POST'])
+        def api_verify_batch():
+            """Verify many certificates; results stream back as NDJSON as they complete.
+
+            Accepts JSON ({"certificate_ids": [...]} or a plain list) or NDJSON
+            (one ID string or {"certificate_id": ...} object per line).
+            """
+            try:
+                cert_ids = self._parse_batch_request()
+            except ValueError as e:
+                return self.jsonify({'error': str(e)}), 400
+            if len(cert_ids) > self.MAX_BATCH_SIZE:
+                return self.jsonify(
+                    {'error': f'At most {self.MAX_BATCH_SIZE} certificate IDs per batch'}), 413
+
+            def verify_one(index, cert_id):
+                try:
+                    cert_data, is_valid = self.verification_cache.verify(cert_id)
+                except Exception as e:
+                    return {'index': index, 'certificate_id': cert_id, 'valid': False,
+                            'error': f'Verification error: {str(e)}'}
+                if cert_data is None:
+                    return {'index': index, 'certificate_id': cert_id, 'valid': False,
+                            'error': 'Certificate not found'}
+                return {'index': index, 'certificate_id': cert_id, 'valid': is_valid,
+                        'timestamp': cert_data.get('timestamp')}
+
+            def generate():
+                futures = [batch_executor.submit(verify_one, index, cert_id)
+                           for index, cert_id in enumerate(cert_ids)]
+                valid = 0
+                try:
+                    for future in as_completed(futures):
+                        result = future.result()
+                        valid += result['valid'] is True
+                        yield json.dumps(result) + '\n'
+                    yield json.dumps({'summary': {'total': len(cert_ids), 'valid': valid,
+                                                  'invalid': len(cert_ids) - valid}}) + '\n'
+                finally:
+                    # Client gone: drop whatever has not started yet
+                    for future in futures:
+                        future.cancel()
+
+            return self.response(self.stream_with_context(generate()),
+                                 mimetype='application/x-ndjson')
+
         @app.route('/api/stats')
         def api_stats():
             """API endpoint for verification statistics"""
-            # In production, these would come from database
-            return self.jsonify({
-                'total_certificates': 15247,
-                'verified_today': 89,
-                'devices_wiped': 12893,
-                'data_wiped_tb': 2847,
-                'last_updated': datetime.now(timezone.utc).isoformat()
-            })
+            stats = cert_manager.statistics.snapshot()
+            stats['last_updated'] = datetime.now(timezone.utc).isoformat()
+            return self.jsonify(stats)
+
+        @app.route('/api/cache/stats')
+        def api_cache_stats():
+            """Hit/miss metrics of the certificate and verification caches"""
+            return self.jsonify(self.verification_cache.stats())
+
+        @app.route('/api/certificate/<cert_id>/<kind>')
+        def api_certificate_artifact(cert_id, kind):
+            """A certificate's PDF or QR code, rendered on first request if needed"""
+            if kind not in CertificateManager.ARTIFACT_SUFFIXES:
+                return self.jsonify({'error': 'Artifact must be pdf or qr'}), 404
+            path = cert_manager.get_artifact(cert_id, kind)
+            if path is None:
+                return self.jsonify({'error': 'Artifact not available'}), 404
+            return self.send_file(path, mimetype='application/pdf' if kind == 'pdf' else 'image/png')
+
+        @app.route('/api/log/head')
+        def api_log_head():
+            """Latest signed tree head of the certificate transparency log"""
+            head = cert_manager.transparency_log.latest_tree_head()
+            if head is None:
+                return self.jsonify({'error': 'Transparency log is empty'}), 404
+            return self.jsonify(dict(head, log_id=cert_manager.transparency_log.log_id))
+
+        @app.route('/api/log/proof/<cert_id>')
+        def api_log_proof(cert_id):
+            """Inclusion proof of a certificate against the latest signed tree head"""
+            inclusion = cert_manager.transparency_log.inclusion_proof(cert_id)
+            if inclusion is None:
+                return self.jsonify({'error': 'Certificate not in transparency log'}), 404
+            return self.jsonify(inclusion)
 
         return app
 
+    def _parse_batch_request(self) -> List[str]:
+        """Certificate IDs from a JSON or NDJSON batch verification request body"""
+        if 'ndjson' in (self.request.mimetype or ''):
+            entries = []
+            for line in self.request.get_data(as_text=True).splitlines():
+                if line.strip():
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        raise ValueError(f'Invalid NDJSON line: {line[:80]}')
+        else:
+            body = self.request.get_json(silent=True)
+            if body is None:
+                raise ValueError('Expected a JSON or NDJSON request body')
+            entries = body.get('certificate_ids') if isinstance(body, dict) else body
+            if not isinstance(entries, list):
+                raise ValueError('Expected a list of certificate IDs')
+
+        cert_ids = []
+        for entry in entries:
+            if isinstance(entry, dict):
+                entry = entry.get('certificate_id')
+            if not isinstance(entry, str) or not entry.strip():
+                raise ValueError(f'Invalid certificate ID: {entry!r}')
+            cert_ids.append(entry.strip())
+        return cert_ids
+
+    def serve_production(self, port: int = 5000, workers: int = None, threads: int = 4,
+                         keepalive: int = 5, timeout: int = 30, graceful_timeout: int = 30,
+                         max_requests: int = 0) -> bool:
+        """Serve the verification app under gunicorn (pre-fork) or waitress.
+
+        Returns False if neither server is installed. Under gunicorn, SIGHUP
+        to the master reloads gracefully: new workers start, old ones finish
+        their requests within graceful_timeout.
+        """
+        if not self.available:
+            return False
+        workers = workers or (os.cpu_count() or 1) * 2 + 1
+
+        # Create the signing key once, before workers could race to generate it
+        CertificateManager()
+
+        try:
+            from gunicorn.app.base import BaseApplication
+        except ImportError:
+            BaseApplication = None
+
+        if BaseApplication is not None:
+            service = self
+            options = {
+                'bind': f"0.0.0.0:{port}",
+                'workers': workers,
+                'worker_class': 'gthread',  # Threaded workers keep connections alive
+                'threads': threads,
+                'keepalive': keepalive,
+                'timeout': timeout,
+                'graceful_timeout': graceful_timeout,
+                'max_requests': max_requests,
+                'max_requests_jitter': max_requests // 10,
+                'preload_app': False
+            }
+
+            class VerificationApplication(BaseApplication):
+                def load_config(self):
+                    for key, value in options.items():
+                        self.cfg.set(key, value)
+
+                def load(self):
+                    # Each worker builds its own app: SQLite handles must not cross fork()
+                    return service.create_verification_server(port)
+
+            print(
+                f"🚀 gunicorn: {workers} workers x {threads} threads on port {port} "
+                f"(SIGHUP to pid {os.getpid()} reloads gracefully)")
+            VerificationApplication().run()
+            return True
+
+        try:
+            from waitress import serve
+        except ImportError:
+            return False
+
+        # Single process, so everything runs in one thread pool
+        print(f"🚀 waitress: {workers * threads} threads on port {port}")
+        serve(self.create_verification_server(port), host='0.0.0.0', port=port,
+              threads=workers * threads, channel_timeout=timeout,
+              connection_limit=max(100, workers * threads * 4))
+        return True
+
+    def load_test(self, base_url: str, cert_ids: List[str], concurrency: int = 32,
+                  duration: float = 10.0) -> Dict:
+        """Hammer /api/verify/<cert_id> with keep-alive clients and report requests/sec"""
+        deadline = time.time() + duration
+        latencies = []
+        errors = [0]
+        lock = threading.Lock()
+
+        def client():
+            session = requests.Session()
+            local_latencies, local_errors = [], 0
+            while time.time() < deadline:
+                cert_id = random.choice(cert_ids)
+                start = time.perf_counter()
+                try:
+                    response = session.get(
+                        f"{base_url.rstrip('/')}/api/verify/{cert_id}", timeout=30)
+                    if response.status_code != 200:
+                        local_errors += 1
+                except requests.RequestException:
+                    local_errors += 1
+                local_latencies.append(time.perf_counter() - start)
+            with lock:
+                latencies.extend(local_latencies)
+                errors[0] += local_errors
+
+        start = time.time()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for _ in range(concurrency):
+                executor.submit(client)
+        elapsed = time.time() - start
+
+        latencies.sort()
+
+        def percentile(fraction):
+            return round(latencies[min(len(latencies) - 1, int(len(latencies) * fraction))] * 1000, 2) \
+                if latencies else 0.0
+
+        return {
+            'requests': len(latencies),
+            'errors': errors[0],
+            'seconds': round(elapsed, 2),
+            'requests_per_second': round(len(latencies) / elapsed, 1),
+            'latency_ms': {'p50': percentile(0.5), 'p95': percentile(0.95), 'p99': percentile(0.99)}
+        }
+
 
 # ============================================================================
 # MOBILE APP INTEGRATION (Android)
@@ -5989,149 +8948,776 @@ class AndroidIntegration:
 # ============================================================================
 
 
+class WipeJobStore:
+    """Durable wipe job queue in SQLite (WAL mode).
+
+    Jobs move queued -> processing -> completed/failed/error/cancelled.
+    Claims are atomic, so several worker processes can pull from the same
+    database, and a job whose worker stops sending heartbeats is requeued.
+    A completed job is certified once its certificate is stored with it;
+    batch-signed jobs stay uncertified (and heartbeating) until the batch
+    is signed.
+    """
+
+    FINISHED_STATUSES = ('completed', 'failed', 'error', 'cancelled')
+
+    def __init__(self, db_path: Path = None):
+        self.db_path = db_path or Path.home() / '.ewaste_safe' / 'jobs.db'
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()  # One connection per thread
+        self._initialize()
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(
+                str(self.db_path), timeout=30, isolation_level=None)
+            connection.row_factory = sqlite3.Row
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    def _initialize(self):
+        self._connection().executescript("""
+            CREATE TABLE IF NOT EXISTS wipe_jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                batch_id TEXT,
+                device TEXT NOT NULL,
+                serial TEXT,
+                method TEXT NOT NULL,
+                status TEXT NOT NULL,
+                device_info TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                worker TEXT,
+                heartbeat REAL,
+                queued_time TEXT,
+                start_time TEXT,
+                end_time TEXT,
+                wipe_result TEXT,
+                error TEXT,
+                certified INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS idx_wipe_jobs_status ON wipe_jobs(status, id);
+            CREATE INDEX IF NOT EXISTS idx_wipe_jobs_serial ON wipe_jobs(serial);
+            CREATE INDEX IF NOT EXISTS idx_wipe_jobs_batch ON wipe_jobs(batch_id);
+        """)
+        self._add_certified_column()
+
+    def _add_certified_column(self):
+        """Upgrade a database created before jobs tracked their certificate"""
+        connection = self._connection()
+        columns = [row['name'] for row in connection.execute('PRAGMA table_info(wipe_jobs)')]
+        if 'certified' in columns:
+            return
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            connection.execute(
+                'ALTER TABLE wipe_jobs ADD COLUMN certified INTEGER NOT NULL DEFAULT 0')
+            for row in connection.execute(
+                    "SELECT id, wipe_result FROM wipe_jobs WHERE status = 'completed'").fetchall():
+                if row['wipe_result'] and json.loads(row['wipe_result']).get('certificate'):
+                    connection.execute(
+                        'UPDATE wipe_jobs SET certified = 1 WHERE id = ?', (row['id'],))
+            connection.execute('COMMIT')
+        except sqlite3.OperationalError:
+            # Another process added the column first
+            connection.execute('ROLLBACK')
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+
+    def _row_to_job(self, row: sqlite3.Row) -> Dict:
+        """Job dict in the shape of the former in-memory queue items"""
+        job = {
+            'job_id': row['id'],
+            'batch_id': row['batch_id'],
+            'device_info': json.loads(row['device_info']),
+            'method': row['method'],
+            'status': row['status'],
+            'attempts': row['attempts'],
+            'queued_time': row['queued_time'],
+            'certified': bool(row['certified'])
+        }
+        for optional in ('worker', 'start_time', 'end_time', 'error'):
+            if row[optional] is not None:
+                job[optional] = row[optional]
+        if row['wipe_result'] is not None:
+            job['wipe_result'] = json.loads(row['wipe_result'])
+        return job
+
+    def enqueue(self, device_info: Dict, method: str, batch_id: str = None) -> int:
+        """Queue a wipe and return its job id"""
+        cursor = self._connection().execute(
+            """INSERT INTO wipe_jobs (batch_id, device, serial, method, status,
+                                       device_info, queued_time)
+               VALUES (?, ?, ?, ?, 'queued', ?, ?)""",
+            (batch_id, device_info.get('device'), device_info.get('serial'), method,
+             json.dumps(device_info, default=str), datetime.now(timezone.utc).isoformat()))
+        return cursor.lastrowid
+
+    def dequeue(self, job_id: int) -> bool:
+        """Remove a job that has not been claimed yet"""
+        cursor = self._connection().execute(
+            "DELETE FROM wipe_jobs WHERE id = ? AND status = 'queued'", (job_id,))
+        return cursor.rowcount == 1
+
+    def claim(self, worker_id: str, job_id: int = None) -> Optional[Dict]:
+        """Atomically take the given queued job, or the oldest one, for a worker"""
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            if job_id is None:
+                row = connection.execute(
+                    "SELECT id FROM wipe_jobs WHERE status = 'queued' ORDER BY id LIMIT 1").fetchone()
+                job_id = row['id'] if row else None
+            claimed = job_id is not None and connection.execute(
+                """UPDATE wipe_jobs SET status = 'processing', worker = ?, heartbeat = ?,
+                                      attempts = attempts + 1, start_time = ?
+                   WHERE id = ? AND status = 'queued'""",
+                (worker_id, time.time(), datetime.now(timezone.utc).isoformat(), job_id)).rowcount == 1
+            connection.execute('COMMIT')
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+        return self.get(job_id) if claimed else None
+
+    def heartbeat(self, job_id: int):
+        """Mark a claimed job as still being worked on"""
+        self._connection().execute(
+            'UPDATE wipe_jobs SET heartbeat = ? WHERE id = ?', (time.time(), job_id))
+
+    def finish(self, job_id: int, status: str, wipe_result: Dict = None, error: str = None):
+        """Record the outcome of a claimed job; it is certified if wipe_result has a certificate"""
+        self._connection().execute(
+            """UPDATE wipe_jobs SET status = ?, end_time = ?, wipe_result = ?, error = ?,
+                                     certified = ?, heartbeat = ?
+               WHERE id = ?""",
+            (status, datetime.now(timezone.utc).isoformat(),
+             json.dumps(wipe_result, default=str) if wipe_result is not None else None,
+             error, int(bool(wipe_result and wipe_result.get('certificate'))),
+             time.time(), job_id))
+
+    def cancel_queued(self) -> int:
+        """Cancel every job that has not been claimed yet"""
+        return self._connection().execute(
+            "UPDATE wipe_jobs SET status = 'cancelled', end_time = ? WHERE status = 'queued'",
+            (datetime.now(timezone.utc).isoformat(),)).rowcount
+
+    def requeue_stale(self, timeout: float = 600.0) -> int:
+        """Put back jobs whose worker stopped sending heartbeats (crash or reboot)"""
+        return self._connection().execute(
+            "UPDATE wipe_jobs SET status = 'queued', worker = NULL "
+            "WHERE status = 'processing' AND heartbeat < ?",
+            (time.time() - timeout,)).rowcount
+
+    def claim_uncertified(self, worker_id: str, timeout: float = 600.0) -> List[Dict]:
+        """Take over completed jobs left uncertified by a worker that stopped heartbeating.
+
+        That worker crashed between the wipes and the batch signature, so
+        the devices are wiped but have no certificate yet.
+        """
+        connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            job_ids = [row['id'] for row in connection.execute(
+                """SELECT id FROM wipe_jobs
+                   WHERE status = 'completed' AND certified = 0 AND heartbeat < ?
+                   ORDER BY id""", (time.time() - timeout,))]
+            connection.executemany(
+                'UPDATE wipe_jobs SET worker = ?, heartbeat = ? WHERE id = ?',
+                [(worker_id, time.time(), job_id) for job_id in job_ids])
+            connection.execute('COMMIT')
+        except Exception:
+            connection.execute('ROLLBACK')
+            raise
+        return [self.get(job_id) for job_id in job_ids]
+
+    def get(self, job_id: int) -> Optional[Dict]:
+        row = self._connection().execute(
+            'SELECT * FROM wipe_jobs WHERE id = ?', (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def jobs(self, status=None, serial: str = None, batch_id: str = None,
+             limit: int = None) -> List[Dict]:
+        """Jobs filtered by status (one or a list), device serial and batch, oldest first"""
+        return list(self.iter_jobs(status, serial, batch_id, limit))
+
+    def iter_jobs(self, status=None, serial: str = None, batch_id: str = None,
+                  limit: int = None) -> Iterator[Dict]:
+        """As jobs(), but read from the database one row at a time"""
+        clauses, params = [], []
+        if status is not None:
+            statuses = [status] if isinstance(status, str) else list(status)
+            clauses.append(f"status IN ({', '.join('?' * len(statuses))})")
+            params.extend(statuses)
+        if serial is not None:
+            clauses.append('serial = ?')
+            params.append(serial)
+        if batch_id is not None:
+            clauses.append('batch_id = ?')
+            params.append(batch_id)
+
+        query = 'SELECT * FROM wipe_jobs'
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+        query += ' ORDER BY id'
+        if limit:
+            query += f' LIMIT {int(limit)}'
+        for row in self._connection().execute(query, params):
+            yield self._row_to_job(row)
+
+    def counts(self, batch_id: str = None) -> Dict[str, int]:
+        """Number of jobs per status"""
+        if batch_id is None:
+            rows = self._connection().execute(
+                'SELECT status, COUNT(*) FROM wipe_jobs GROUP BY status')
+        else:
+            rows = self._connection().execute(
+                'SELECT status, COUNT(*) FROM wipe_jobs WHERE batch_id = ? GROUP BY status',
+                (batch_id,))
+        return {status: count for status, count in rows}
+
+
+class BandwidthScheduler:
+    """Admits wipes per controller while the controller's total throughput grows.
+
+    Devices behind the same HBA, USB hub or port multiplier share its
+    bandwidth. Each group starts with one wipe; once a level has run fully
+    loaded for a sample interval its aggregate throughput is measured, and
+    another wipe is admitted only if that beat the previous level by
+    min_gain. Otherwise the group drops back to the best level and stays there.
+    """
+
+    def __init__(self, sample_interval: float = 5.0, min_gain: float = 0.05):
+        self.sample_interval = sample_interval
+        self.min_gain = min_gain  # Relative gain needed to keep adding wipes
+        self.groups = {}
+        self._last_sample = None
+
+    def group_key(self, device_info: Dict) -> str:
+        """Devices without a known controller are assumed to have their own bus"""
+        return device_info.get('controller') or device_info.get('device')
+
+    def _group(self, key: str) -> Dict:
+        return self.groups.setdefault(key, {
+            'limit': 1, 'saturated': False, 'engines': {},
+            'throughput': {}, 'level_samples': 0, 'devices': 0})
+
+    def can_admit(self, device_info: Dict) -> bool:
+        group = self._group(self.group_key(device_info))
+        return len(group['engines']) < group['limit']
+
+    def started(self, device_info: Dict, engine: SecureWipeEngine):
+        group = self._group(self.group_key(device_info))
+        group['engines'][id(engine)] = [engine, engine.bytes_written]
+        group['devices'] += 1
+
+    def finished(self, device_info: Dict, engine: SecureWipeEngine):
+        group = self._group(self.group_key(device_info))
+        group['engines'].pop(id(engine), None)
+        group['level_samples'] = 0  # The level is no longer fully loaded
+
+    def sample(self):
+        """Measure every group and adjust its admission limit"""
+        now = time.time()
+        if self._last_sample is None:
+            self._last_sample = now
+            return
+        elapsed = now - self._last_sample
+        if elapsed < self.sample_interval:
+            return
+        self._last_sample = now
+
+        for group in self.groups.values():
+            moved = 0
+            for entry in group['engines'].values():
+                moved += entry[0].bytes_written - entry[1]
+                entry[1] = entry[0].bytes_written
+
+            level = len(group['engines'])
+            if level == 0 or level < group['limit']:
+                group['level_samples'] = 0
+                continue
+            if moved <= 0:
+                # Nothing measurable (a hardware erase reports no bytes),
+                # so this interval says nothing about the level
+                continue
+
+            # The first interval at a level includes ramp-up, so judge the second
+            group['level_samples'] += 1
+            if group['level_samples'] < 2:
+                continue
+            throughput = moved / elapsed
+            group['throughput'][level] = throughput
+
+            if group['saturated']:
+                continue
+            previous = group['throughput'].get(level - 1)
+            if throughput > 0 and (previous is None or
+                                   throughput >= previous * (1 + self.min_gain)):
+                group['limit'] = level + 1
+            else:
+                group['saturated'] = True
+                group['limit'] = level - 1
+            group['level_samples'] = 0
+
+    def report(self) -> Dict:
+        """Per-group admission limit and measured throughput by concurrency"""
+        return {key: {
+            'devices': group['devices'],
+            'concurrency_limit': group['limit'],
+            'saturated': group['saturated'],
+            'throughput_mb_s': {level: round(value / (1024 * 1024), 1)
+                                for level, value in sorted(group['throughput'].items())}
+        } for key, group in self.groups.items()}
+
+
+class BatchReportPDF:
+    """Batch report PDF written one page at a time.
+
+    Device rows are held only until a page is full and then drawn as one
+    table, so memory stays flat however large the batch. The summary on
+    the first page and the page count in each footer are form XObjects,
+    placed as pages are drawn and filled in by finish() once the totals
+    are known.
+    """
+
+    MARGIN = 0.6 * inch
+    COLUMNS = (  # Heading, row field, width in inches, maximum characters
+        ('#', 'index', 0.45, 7),
+        ('Device', 'device', 1.15, 22),
+        ('Model', 'model', 1.25, 24),
+        ('Status', 'status', 0.7, 12),
+        ('Method', 'method', 0.9, 16),
+        ('Duration (s)', 'duration_seconds', 0.65, 10),
+        ('Certificate', 'certificate_id', 1.95, 36)
+    )
+
+    def __init__(self, path: Path, report_id: str, generation_time: str):
+        self.template = PDFTemplate.shared()
+        self.report_id = report_id
+        self.generation_time = generation_time
+        self.width, self.height = A4
+        self.canvas = RLCanvas(str(path), pagesize=A4)
+        self.canvas.setTitle(f"E-Waste Safe Batch Report {report_id}")
+        self.page_number = 0
+        self._rows = []
+        self._page_open = False
+        # Every row is one line high, so a page's capacity follows from one row
+        self._row_height = self._rows_table([{}]).wrap(self.width, self.height)[1] / 2
+        self._start_page()
+
+    def _summary_table(self, totals: Dict) -> Table:
+        devices = totals['total_devices']
+        summary_data = [
+            ['Report ID:', self.report_id],
+            ['Generated:', self.generation_time],
+            ['Total Devices:', str(devices)],
+            ['Successful:', str(totals['successful_wipes'])],
+            ['Failed:', str(totals['failed_wipes'])],
+            ['Success Rate:',
+                f"{(totals['successful_wipes'] / devices * 100) if devices else 0:.1f}%"],
+            ['Data Wiped:', f"{totals['total_data_wiped']/1e9:.1f} GB"]
+        ]
+        return self.template.table(summary_data, [2*inch, 3*inch], 'report_summary')
+
+    def _draw(self, flowable, top: float) -> float:
+        """Draw a flowable with its top at top; returns where the next one starts"""
+        top -= flowable.getSpaceBefore()
+        _, height = flowable.wrapOn(self.canvas, self.width - 2 * self.MARGIN, top - self.MARGIN)
+        flowable.drawOn(self.canvas, self.MARGIN, top - height)
+        return top - height - flowable.getSpaceAfter()
+
+    def _start_page(self):
+        self.page_number += 1
+        self._page_open = True
+        self._top = self.height - self.MARGIN
+        if self.page_number == 1:
+            self._top = self._draw(self.template.paragraph(
+                "E-Waste Safe - Batch Processing Report", 'report_title'), self._top)
+            self._summary_top = self._top
+            self.canvas.doForm('batch_summary')
+            placeholder = {'total_devices': 0, 'successful_wipes': 0, 'failed_wipes': 0,
+                           'total_data_wiped': 0}
+            _, height = self._summary_table(placeholder).wrapOn(
+                self.canvas, self.width - 2 * self.MARGIN, self._top)
+            self._top -= height + 20
+            self._top = self._draw(self.template.paragraph("Detailed Results", 'heading2'), self._top)
+        # Leave room for the footer and the table's header row
+        self._capacity = int((self._top - self.MARGIN) // self._row_height) - 1
+
+    def _cell(self, value, max_chars: int) -> str:
+        text = '' if value is None else str(value)
+        return text if len(text) <= max_chars else text[:max_chars - 3] + '...'
+
+    def _rows_table(self, rows: List[Dict]) -> Table:
+        data = [[heading for heading, _, _, _ in self.COLUMNS]]
+        for row in rows:
+            data.append([self._cell(row.get(field), max_chars).upper() if field == 'status'
+                         else self._cell(row.get(field), max_chars)
+                         for _, field, _, max_chars in self.COLUMNS])
+        return self.template.table(
+            data, [width * inch for _, _, width, _ in self.COLUMNS], 'report_rows')
+
+    def _end_page(self):
+        if self._rows:
+            self._draw(self._rows_table(self._rows), self._top)
+            self._rows = []
+
+        # Footer: the total page count is a form filled in by finish()
+        label = f"{self.report_id} - Page {self.page_number} of "
+        self.canvas.setFont('Helvetica', 8)
+        self.canvas.drawString(self.MARGIN, self.MARGIN / 2, label)
+        self.canvas.saveState()
+        self.canvas.translate(self.MARGIN + self.canvas.stringWidth(label, 'Helvetica', 8),
+                              self.MARGIN / 2)
+        self.canvas.doForm('page_count')
+        self.canvas.restoreState()
+        self.canvas.showPage()
+        self._page_open = False
+
+    def add_row(self, row: Dict):
+        if not self._page_open:
+            self._start_page()
+        self._rows.append(row)
+        if len(self._rows) >= self._capacity:
+            self._end_page()
+
+    def finish(self, totals: Dict):
+        """Draw the last page, fill in the summary and page count, and write the file"""
+        if self._page_open:
+            self._end_page()
+
+        self.canvas.beginForm('batch_summary')
+        self._draw(self._summary_table(totals), self._summary_top)
+        self.canvas.endForm()
+
+        self.canvas.beginForm('page_count')
+        self.canvas.setFont('Helvetica', 8)
+        self.canvas.drawString(0, 0, str(self.page_number))
+        self.canvas.endForm()
+
+        self.canvas.save()
+
+
 class EnterpriseWipeManager:
     """Enterprise-grade batch wiping and management"""
 
+    REPORT_FORMATS = ('pdf', 'csv', 'ndjson')
+    REPORT_FIELDS = ('index', 'job_id', 'batch_id', 'device', 'model', 'serial', 'status', 'method',
+                     'duration_seconds', 'size_bytes', 'certificate_id', 'error')
+
     def __init__(self):
-        self.wipe_engine = SecureWipeEngine()
-        self.cert_manager = CertificateManager()
-        self.processing_queue = []
-        self.completed_wipes = []
-
-    def add_devices_to_queue(self, devices: List[Dict], method: str = 'nist_purge'):
-        """Add multiple devices to processing queue"""
-        for device in devices:
-            self.processing_queue.append({
-                'device_info': device,
-                'method': method,
-                'status': 'queued',
-                'queued_time': datetime.now(timezone.utc).isoformat()
-            })
-
-    def process_queue(self, max_concurrent: int = 1, progress_callback: Callable = None) -> List[Dict]:
-        """Process the wipe queue"""
+        self.wipe_engine = SecureWipeEngine()  # Template for per-device engine settings
+        self.supervisor = WipeSupervisor()
+        self.cert_manager = CertificateManager(artifact_mode='background')
+        self.job_store = WipeJobStore()
+        self.worker_id = f"{platform.node()}:{os.getpid()}"
+        self.heartbeat_interval = 30.0  # Seconds between job heartbeats
+        self.stale_job_timeout = 600.0  # Requeue claimed jobs silent for this long
+        self._active_engines = {}  # Device path -> engine wiping it
+        self.scheduler_report = {}  # Bandwidth scheduler findings of the last batch
+        self._cancelled = set()  # Device paths cancelled before or during their wipe
+        self._lock = threading.Lock()
+
+    # Read-only snapshots of the job store. They are tuples so that code
+    # written for the old in-memory lists fails on append() instead of
+    # losing the job: queue devices with add_devices_to_queue().
+    @property
+    def processing_queue(self) -> Tuple[Dict, ...]:
+        """Jobs waiting to be claimed"""
+        return tuple(self.job_store.iter_jobs(status='queued'))
+
+    @property
+    def completed_wipes(self) -> Tuple[Dict, ...]:
+        """Jobs that have finished, successfully or not"""
+        return tuple(self.job_store.iter_jobs(status=['completed', 'failed']))
+
+    def add_devices_to_queue(self, devices: List[Dict], method: str = 'nist_purge') -> List[int]:
+        """Queue devices in the job store as one batch; returns the job ids.
+
+        This is the way to enqueue wipes: processing_queue is only a snapshot.
+        """
+        batch_id = f"BATCH-{int(time.time())}-{secrets.token_hex(4).upper()}"
+        return [self.job_store.enqueue(device, method, batch_id) for device in devices]
+
+    def _create_engine(self) -> SecureWipeEngine:
+        """New engine with the template's tuning, so each device has its own wipe state"""
+        engine = SecureWipeEngine()
+        for setting in SecureWipeEngine.TUNABLE_SETTINGS:
+            setattr(engine, setting, getattr(self.wipe_engine, setting))
+        return engine
+
+    def process_queue(self, max_concurrent: int = 1, progress_callback: Callable = None,
+                      device_progress_callback: Callable = None,
+                      bandwidth_aware: bool = False, isolated: bool = False,
+                      batch_sign: bool = False) -> List[Dict]:
+        """Process the wipe queue with up to max_concurrent devices at a time.
+
+        progress_callback(percent, message) reports overall progress as devices
+        finish; device_progress_callback(device, percent, message) reports each
+        wipe. Results are returned in completion order. With bandwidth_aware,
+        a BandwidthScheduler also limits the wipes per controller or hub; with
+        isolated, each wipe runs in a WipeSupervisor worker process. With
+        batch_sign, certificates are issued together once the queue is done,
+        under a single signed Merkle root; completed jobs keep heartbeating
+        until then, so a crash before signing is recovered by the next run.
+        """
         results = []
-        total_devices = len(self.processing_queue)
-
-        for i, queue_item in enumerate(self.processing_queue):
-            if progress_callback:
-                overall_progress = (i / total_devices) * 100
-                progress_callback(
-                    overall_progress, f"Processing device {i+1} of {total_devices}")
-
-            try:
-                queue_item['status'] = 'processing'
-                queue_item['start_time'] = datetime.now(
-                    timezone.utc).isoformat()
+        self.job_store.requeue_stale(self.stale_job_timeout)
+        self.certify_orphaned_jobs()
+        pending = deque(self.processing_queue)
+        total_devices = len(pending)
+        max_concurrent = max(1, max_concurrent)
+        scheduler = BandwidthScheduler() if bandwidth_aware else None
+        running = {}  # Future -> (queue item, engine)
+        last_heartbeat = time.time()
 
-                # Perform wipe
-                wipe_result = self.wipe_engine.wipe_device(
-                    queue_item['device_info'],
-                    queue_item['method']
-                )
-
-                # Generate certificate if successful
-                if wipe_result['success']:
-                    certificate = self.cert_manager.generate_certificate(
-                        wipe_result)
-                    wipe_result['certificate'] = certificate
-
-                queue_item['status'] = 'completed' if wipe_result['success'] else 'failed'
-                queue_item['wipe_result'] = wipe_result
-                queue_item['end_time'] = datetime.now(timezone.utc).isoformat()
+        if progress_callback:
+            progress_callback(
+                0, f"Processing {total_devices} devices, up to {max_concurrent} at a time")
+
+        with ThreadPoolExecutor(max_workers=max_concurrent,
+                                thread_name_prefix='ewaste-wipe') as executor:
+            while pending or running:
+                # Admit queued devices in order, skipping ones whose controller is full
+                for queue_item in list(pending):
+                    if len(running) >= max_concurrent:
+                        break
+                    if scheduler and not scheduler.can_admit(queue_item['device_info']):
+                        continue
+                    pending.remove(queue_item)
+                    # Another worker process may have taken the job meanwhile
+                    queue_item = self.job_store.claim(self.worker_id, queue_item['job_id'])
+                    if queue_item is None:
+                        continue
+                    engine = self._create_engine()
+                    if scheduler:
+                        scheduler.started(queue_item['device_info'], engine)
+                    future = executor.submit(
+                        self._process_item, queue_item, engine, device_progress_callback, isolated,
+                        not batch_sign)
+                    running[future] = (queue_item, engine)
+
+                done, _ = wait(list(running),
+                               timeout=scheduler.sample_interval if scheduler else self.heartbeat_interval,
+                               return_when=FIRST_COMPLETED)
+                if scheduler:
+                    scheduler.sample()
+                if time.time() - last_heartbeat >= self.heartbeat_interval:
+                    for queue_item, _ in running.values():
+                        self.job_store.heartbeat(queue_item['job_id'])
+                    # Completed jobs awaiting the batch signature
+                    for queue_item in results:
+                        if queue_item['status'] == 'completed' and \
+                                'certificate' not in queue_item['wipe_result']:
+                            self.job_store.heartbeat(queue_item['job_id'])
+                    last_heartbeat = time.time()
+
+                for future in done:
+                    queue_item, engine = running.pop(future)
+                    if scheduler:
+                        scheduler.finished(queue_item['device_info'], engine)
+                    results.append(future.result())
+                    if progress_callback:
+                        progress_callback(
+                            (len(results) / total_devices) * 100,
+                            f"Device {queue_item['device_info'].get('device')} "
+                            f"{queue_item['status']} ({len(results)} of {total_devices})")
 
-                results.append(queue_item)
-                self.completed_wipes.append(queue_item)
+        if scheduler:
+            self.scheduler_report = scheduler.report()
 
-            except Exception as e:
-                queue_item['status'] = 'error'
-                queue_item['error'] = str(e)
-                queue_item['end_time'] = datetime.now(timezone.utc).isoformat()
-                results.append(queue_item)
+        if batch_sign:
+            self._certify_batch(results)
 
-        # Clear processed items from queue
-        self.processing_queue.clear()
+        with self._lock:
+            self._cancelled.clear()
 
         return results
 
-    def generate_batch_report(self, results: List[Dict]) -> str:
-        """Generate comprehensive batch processing report"""
-        report_data = {
-            'report_id': f"BATCH-{int(time.time())}-{secrets.token_hex(4).upper()}",
-            'generation_time': datetime.now(timezone.utc).isoformat(),
-            'total_devices': len(results),
-            'successful_wipes': sum(1 for r in results if r['status'] == 'completed'),
-            'failed_wipes': sum(1 for r in results if r['status'] in ['failed', 'error']),
-            'total_data_wiped': sum(r.get('wipe_result', {}).get('device_info', {}).get('size', 0) for r in results),
-            'results': results
-        }
+    def _process_item(self, queue_item: Dict, engine: SecureWipeEngine,
+                      device_progress_callback: Callable = None, isolated: bool = False,
+                      certify: bool = True) -> Dict:
+        """Wipe and certify one queued device on its own engine"""
+        device_path = queue_item['device_info'].get('device')
 
-        # Create PDF report
-        report_path = Path.home() / '.ewaste_safe' / 'reports' / \
-            f"{report_data['report_id']}.pdf"
-        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            if device_path in self._cancelled:
+                queue_item['status'] = 'cancelled'
+                self.job_store.finish(queue_item['job_id'], 'cancelled')
+                return queue_item
+            self._active_engines[device_path] = engine
 
-        doc = SimpleDocTemplate(str(report_path), pagesize=A4)
-        story = []
+        def progress_callback(progress, message):
+            # A cancel that raced the start of the wipe is applied here
+            if device_path in self._cancelled:
+                engine.cancel_wipe()
+            if device_progress_callback:
+                device_progress_callback(device_path, progress, message)
 
-        # Title
-        title_style = ParagraphStyle(
-            'Title', fontSize=20, alignment=1, spaceAfter=30)
-        story.append(
-            Paragraph("E-Waste Safe - Batch Processing Report", title_style))
+        try:
+            # A job claimed before continues from its wipe journal
+            resume = queue_item.get('attempts', 1) > 1
+
+            # Perform wipe
+            if isolated:
+                wipe_result = self.supervisor.run(
+                    engine, queue_item['device_info'], queue_item['method'], progress_callback,
+                    resume=resume)
+            else:
+                wipe_result = engine.wipe_device(
+                    queue_item['device_info'],
+                    queue_item['method'],
+                    progress_callback,
+                    resume=resume
+                )
 
-        # Summary table
-        summary_data = [
-            ['Report ID:', report_data['report_id']],
-            ['Generated:', report_data['generation_time']],
-            ['Total Devices:', str(report_data['total_devices'])],
-            ['Successful:', str(report_data['successful_wipes'])],
-            ['Failed:', str(report_data['failed_wipes'])],
-            ['Success Rate:',
-                f"{(report_data['successful_wipes']/report_data['total_devices']*100):.1f}%"],
-            ['Data Wiped:', f"{report_data['total_data_wiped']/1e9:.1f} GB"]
-        ]
+            # Generate certificate if successful
+            if wipe_result['success'] and certify:
+                with self._lock:
+                    certificate = self.cert_manager.generate_certificate(
+                        wipe_result)
+                wipe_result['certificate'] = certificate
 
-        summary_table = Table(summary_data, colWidths=[2*inch, 3*inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (0, -1), colors.lightblue),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+            if wipe_result['success']:
+                queue_item['status'] = 'completed'
+            elif device_path in self._cancelled:
+                queue_item['status'] = 'cancelled'
+            else:
+                queue_item['status'] = 'failed'
+            queue_item['wipe_result'] = wipe_result
+            queue_item['end_time'] = datetime.now(timezone.utc).isoformat()
+            self.job_store.finish(queue_item['job_id'], queue_item['status'], wipe_result)
 
-        story.append(summary_table)
-        story.append(Spacer(1, 20))
+        except Exception as e:
+            queue_item['status'] = 'error'
+            queue_item['error'] = str(e)
+            queue_item['end_time'] = datetime.now(timezone.utc).isoformat()
+            self.job_store.finish(queue_item['job_id'], 'error', error=str(e))
 
-        # Detailed results
-        story.append(Paragraph("Detailed Results",
-                     getSampleStyleSheet()['Heading2']))
-
-        for i, result in enumerate(results, 1):
-            device_info = result['device_info']
-            wipe_result = result.get('wipe_result', {})
-
-            device_data = [
-                [f"Device {i}:", device_info['device']],
-                ['Model:', device_info.get('model', 'Unknown')],
-                ['Status:', result['status'].upper()],
-                ['Method:', result['method']],
-                ['Duration:',
-                    f"{wipe_result.get('duration_seconds', 0):.1f}s"],
-                ['Certificate:', wipe_result.get(
-                    'certificate', {}).get('certificate_id', 'N/A')]
-            ]
+        finally:
+            with self._lock:
+                self._active_engines.pop(device_path, None)
 
-            device_table = Table(device_data, colWidths=[1.5*inch, 3.5*inch])
-            device_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
+        return queue_item
 
-            story.append(device_table)
-            story.append(Spacer(1, 10))
+    def _certify_batch(self, results: List[Dict]):
+        """Issue the certificates of a batch's successful wipes under one signature"""
+        certified = [queue_item for queue_item in results
+                     if queue_item['status'] == 'completed'
+                     and 'certificate' not in queue_item['wipe_result']]
+        if not certified:
+            return
 
-        doc.build(story)
+        certificates = self.cert_manager.generate_certificates(
+            [queue_item['wipe_result'] for queue_item in certified])
+        for queue_item, certificate in zip(certified, certificates):
+            queue_item['wipe_result']['certificate'] = certificate
+            self.job_store.finish(queue_item['job_id'], 'completed', queue_item['wipe_result'])
+
+    def certify_orphaned_jobs(self) -> int:
+        """Issue the missing certificates of wiped devices whose batch was never signed"""
+        orphaned = self.job_store.claim_uncertified(self.worker_id, self.stale_job_timeout)
+        if orphaned:
+            print(f"📜 Certifying {len(orphaned)} completed wipes left without a certificate")
+            self._certify_batch(orphaned)
+        return len(orphaned)
+
+    def cancel_device(self, device_path: str):
+        """Cancel one device's wipe, or skip it if it has not started yet"""
+        with self._lock:
+            self._cancelled.add(device_path)
+            engine = self._active_engines.get(device_path)
+        if engine:
+            engine.cancel_wipe()
+
+    def cancel_all(self):
+        """Cancel every running wipe and every job still queued"""
+        self.job_store.cancel_queued()
+        with self._lock:
+            engines = list(self._active_engines.values())
+        for engine in engines:
+            engine.cancel_wipe()
+
+    def _report_rows(self, results: Iterable[Dict]) -> Iterator[Dict]:
+        """One flat row per device of a batch report"""
+        for index, result in enumerate(results, 1):
+            device_info = result.get('device_info', {})
+            wipe_result = result.get('wipe_result') or {}
+            yield {
+                'index': index,
+                'job_id': result.get('job_id'),
+                'batch_id': result.get('batch_id'),
+                'device': device_info.get('device'),
+                'model': device_info.get('model', 'Unknown'),
+                'serial': device_info.get('serial', 'Unknown'),
+                'status': result['status'],
+                'method': result['method'],
+                'duration_seconds': round(wipe_result.get('duration_seconds') or 0, 1),
+                'size_bytes': wipe_result.get('device_info', {}).get('size', 0),
+                'certificate_id': (wipe_result.get('certificate') or {}).get('certificate_id'),
+                'error': result.get('error')
+            }
+
+    def generate_batch_report(self, results: Iterable[Dict] = None, batch_id: str = None,
+                              formats: Iterable[str] = ('pdf',)) -> str:
+        """Generate comprehensive batch processing report.
 
-        return str(report_path)
+        results can be any iterable of jobs, such as a generator; by default
+        the finished jobs of batch_id (or of every batch) are read from the
+        job store. Each row is written as soon as it is read, so report time
+        grows linearly and memory stays flat. formats picks any of pdf, csv
+        and ndjson, written side by side under one report ID; the path of
+        the first is returned.
+        """
+        formats = list(dict.fromkeys(formats))
+        unknown = [fmt for fmt in formats if fmt not in self.REPORT_FORMATS]
+        if unknown or not formats:
+            raise Exception(f"Unknown report format: {', '.join(unknown) or 'none given'}")
+        if results is None:
+            results = self.job_store.iter_jobs(
+                status=['completed', 'failed', 'error', 'cancelled'], batch_id=batch_id)
+
+        report_id = f"BATCH-{int(time.time())}-{secrets.token_hex(4).upper()}"
+        generation_time = datetime.now(timezone.utc).isoformat()
+        report_dir = Path.home() / '.ewaste_safe' / 'reports'
+        report_dir.mkdir(parents=True, exist_ok=True)
+        paths = {fmt: report_dir / f"{report_id}.{fmt}" for fmt in formats}
+
+        totals = {'total_devices': 0, 'successful_wipes': 0, 'failed_wipes': 0,
+                  'total_data_wiped': 0}
+        with ExitStack() as files:
+            writers = []
+            if 'csv' in paths:
+                csv_writer = csv.DictWriter(
+                    files.enter_context(open(paths['csv'], 'w', newline='')),
+                    fieldnames=self.REPORT_FIELDS)
+                csv_writer.writeheader()
+                writers.append(csv_writer.writerow)
+            if 'ndjson' in paths:
+                ndjson_file = files.enter_context(open(paths['ndjson'], 'w'))
+                writers.append(lambda row: ndjson_file.write(json.dumps(row) + '\n'))
+            pdf = BatchReportPDF(paths['pdf'], report_id, generation_time) if 'pdf' in paths else None
+            if pdf:
+                writers.append(pdf.add_row)
+
+            for row in self._report_rows(results):
+                totals['total_devices'] += 1
+                totals['successful_wipes'] += row['status'] == 'completed'
+                totals['failed_wipes'] += row['status'] in ['failed', 'error']
+                totals['total_data_wiped'] += row['size_bytes'] or 0
+                for write in writers:
+                    write(row)
+
+            if 'ndjson' in paths:
+                ndjson_file.write(json.dumps({'summary': dict(
+                    totals, report_id=report_id, generation_time=generation_time)}) + '\n')
+            if pdf:
+                pdf.finish(totals)
+
+        return str(paths[formats[0]])
 
 # ============================================================================
 # MAIN APPLICATION ENTRY POINT
@@ -6168,13 +9754,17 @@ def main():
 # ============================================================================
 
 
-def run_verification_server(port=5000):
-    """Run standalone verification server"""
+def run_verification_server(port=5000, production: bool = False, **server_options):
+    """Run standalone verification server; production uses gunicorn or waitress"""
     verification_service = OnlineVerificationService()
     if verification_service.available:
-        app = verification_service.create_verification_server(port)
         print(f"Starting E-Waste Safe verification server on port {port}")
         print(f"Access the verification portal at: http://localhost:{port}")
+        if production:
+            if verification_service.serve_production(port, **server_options):
+                return
+            print("⚠️ Neither gunicorn nor waitress is installed - using Flask's development server")
+        app = verification_service.create_verification_server(port)
         app.run(host='0.0.0.0', port=port, debug=False)
     else:
         print("Flask not available - cannot start verification server")
@@ -6183,8 +9773,30 @@ def run_verification_server(port=5000):
 if __name__ == "__main__":
     # Support different run modes
     if len(sys.argv) > 1 and sys.argv[1] == '--server':
-        port = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
-        run_verification_server(port)
+        import argparse
+
+        server_parser = argparse.ArgumentParser(
+            prog=f"{sys.argv[0]} --server", description="E-Waste Safe verification server")
+        server_parser.add_argument('port', nargs='?', type=int, default=5000)
+        server_parser.add_argument('--workers', type=int,
+                                   help='Worker processes (default: 2 x CPUs + 1)')
+        server_parser.add_argument('--threads', type=int, default=4,
+                                   help='Threads per worker')
+        server_parser.add_argument('--keepalive', type=int, default=5,
+                                   help='Seconds to hold idle keep-alive connections')
+        server_parser.add_argument('--timeout', type=int, default=30,
+                                   help='Seconds before a silent worker is restarted')
+        server_parser.add_argument('--max-requests', type=int, default=0,
+                                   help='Recycle a worker after this many requests (0: never)')
+        server_parser.add_argument('--dev', action='store_true',
+                                   help="Use Flask's single-process development server")
+        server_args = server_parser.parse_args(sys.argv[2:])
+
+        run_verification_server(
+            server_args.port, production=not server_args.dev,
+            workers=server_args.workers, threads=server_args.threads,
+            keepalive=server_args.keepalive, timeout=server_args.timeout,
+            max_requests=server_args.max_requests)
     else:
         main()
 